@@ -12,6 +12,7 @@ from .dashboard_modes import DashboardModes
 from .dashboard_sysbatt import DashboardSysBatt
 from .dashboard_alarm import DashboardAlarm
 from .writer import Writer, CWriter
+from .glyph_cache import GlyphCache
 
 __all__ = [
     "DisplayUI",
@@ -27,4 +28,5 @@ __all__ = [
     "DashboardAlarm",
     "Writer",
     "CWriter",
+    "GlyphCache",
 ]
@@ -5,6 +5,7 @@ from time import ticks_diff, ticks_ms
 import fonts
 
 from .dashboard_base import DashboardBase
+from .widgets import BigNumber, Icon, Label, Row, digit_pitch, text_width
 from .writer import Writer
 
 _HEADER_FONT = "sevenSegment_20"
@@ -18,6 +19,7 @@ _BOTTOM_MARGIN = 10
 _VALUE_GAP = 8
 _SPEED_MAX_VALUE = 99
 _POWER_MAX_VALUE = 4000
+_POWER_MIN_VALUE = -999  # keeps regen within the four power cells
 _F1_INTERVAL_MS = 1000
 _F2_INTERVAL_MS = 500
 _TOP_OFFSET = 6
@@ -25,48 +27,6 @@ _FG = 0xFFFF
 _BG = 0x0000
 
 
-def _text_extent(font_mod, text):
-    width = 0
-    for ch in text:
-        try:
-            _, _, advance = font_mod.get_ch(ch)
-        except Exception:
-            advance = 0
-        width += advance
-    return width
-
-
-def _recolor_region(lcd, x, y, width, height):
-    if width <= 0 or height <= 0:
-        return
-    pixel = lcd.pixel
-    x_end = min(lcd.width, x + width)
-    y_end = min(lcd.height, y + height)
-    for py in range(max(0, y), y_end):
-        for px in range(max(0, x), x_end):
-            pixel(px, py, _FG if pixel(px, py) else _BG)
-
-
-def _render_text_block(lcd, writer, font_mod, text, x, y, area_width, bg_color):
-    if area_width <= 0 or y >= lcd.height:
-        return 0
-    height = font_mod.height()
-    if y + height > lcd.height:
-        height = lcd.height - y
-    if height <= 0:
-        return 0
-    x = max(0, x)
-    area_width = min(area_width, lcd.width - x)
-    if area_width <= 0:
-        return 0
-    lcd.fill_rect(x, y, area_width, height, bg_color)
-    Writer.set_textpos(lcd.framebuf, y, x)
-    writer.printstring(text)
-    text_width = min(_text_extent(font_mod, text), area_width)
-    _recolor_region(lcd, x, y, text_width, height)
-    return text_width
-
-
 class DashboardLayout(DashboardBase):
     """Render the main ride dashboard with staggered refresh rates."""
 
@@ -78,6 +38,7 @@ class DashboardLayout(DashboardBase):
         self.font_small = fonts.load(_SMALL_FONT)
         self.font_large = fonts.load(_LARGE_FONT)
         self.font_bottom = self._header_font
+        self.large_pitch = digit_pitch(self.font_large)
 
         self.writer_large = Writer(framebuf, self.font_large, verbose=False)
         self.writer_small = Writer(framebuf, self.font_small, verbose=False)
@@ -128,54 +89,32 @@ class DashboardLayout(DashboardBase):
         self._last_f1 = None
         self._last_f2 = None
         self._needs_full_refresh = True
-
-        self._last_time_text = None
-        self._last_km_text = None
-        self._last_speed_text = None
-        self._last_power_text = None
-        self._last_voltage_text = None
-        self._last_percent_text = None
+        self.widgets = self._build_widgets()
 
     def draw(self, state):
         now = ticks_ms()
 
-        trigger_f1 = self._needs_full_refresh or self._is_due(self._last_f1, _F1_INTERVAL_MS, now)
-        trigger_f2 = self._needs_full_refresh or self._is_due(self._last_f2, _F2_INTERVAL_MS, now)
+        full = self._needs_full_refresh
+        trigger_f1 = full or self._is_due(self._last_f1, _F1_INTERVAL_MS, now)
+        trigger_f2 = full or self._is_due(self._last_f2, _F2_INTERVAL_MS, now)
 
         if not (trigger_f1 or trigger_f2):
             return
 
-        if self._needs_full_refresh:
+        if full:
             self.lcd.fill(_BG)
-            self.ensure_header(force=True)
-            self._last_time_text = None
-            self._last_km_text = None
-            self._last_speed_text = None
-            self._last_power_text = None
-            self._last_voltage_text = None
-            self._last_percent_text = None
-            trigger_f1 = True
-            trigger_f2 = True
             self._needs_full_refresh = False
-        else:
-            self.ensure_header()
+        header = self.ensure_header(force=full)
 
         if trigger_f1:
             self._last_f1 = now
+            self._update_bottom_line(state)
         if trigger_f2:
             self._last_f2 = now
+            self._update_speed(state)
+            self._update_power(state)
 
-        updated = False
-        if trigger_f1:
-            if self._update_bottom_line(state):
-                updated = True
-        if trigger_f2:
-            if self._update_speed(state):
-                updated = True
-            if self._update_power(state):
-                updated = True
-
-        if updated:
+        if self.render_widgets(full) or header:
             self.lcd.show()
 
     def request_full_refresh(self):
@@ -200,9 +139,7 @@ class DashboardLayout(DashboardBase):
         if speed_val is None:
             speed_val = getattr(state, "trip_speed_kmh", None)
         if speed_val is None:
-            speed_val = state.get_pr("vehicle_speed_PR", (0.0, ""))[0]
-        if speed_val is None:
-            speed_val = state.get_pr("vehicle_speed", (0.0, ""))[0]
+            speed_val = state.pr_frame().speed_kmh
         if speed_val is None:
             speed_val = 0.0
         speed_int = max(0, min(int(round(speed_val)), self.speed_max_value))
@@ -243,97 +180,21 @@ class DashboardLayout(DashboardBase):
             trip_int = 0
         trip_text = f"{trip_int:02d}km"
 
-        if (
-            speed_text == self._last_speed_text
-            and time_text == self._last_time_text
-            and trip_text == self._last_km_text
-        ):
-            return False
-
-        self._last_speed_text = speed_text
-        self._last_time_text = time_text
-        self._last_km_text = trip_text
-
-        lcd = self.lcd
-        height = self.font_large.height()
-        lcd.fill_rect(0, self.speed_y, lcd.width, height, _BG)
-
-        digits_width = _text_extent(self.font_large, speed_text)
-        unit_width = _text_extent(self.font_small, self._unit_text)
-        info_width = max(
-            _text_extent(self.font_small, time_text),
-            _text_extent(self.font_small, trip_text),
-        ) + 4
-
-        unit_x = max(self.edge_padding, lcd.width - unit_width - self.edge_padding)
-        digits_x = unit_x - self.value_gap - digits_width
-
-        min_digits_x = self.edge_padding + info_width + self.value_gap
-        if digits_x < min_digits_x:
-            digits_x = min_digits_x
-            unit_x = digits_x + digits_width + self.value_gap
-            if unit_x + unit_width > lcd.width - self.edge_padding:
-                unit_x = max(self.edge_padding, lcd.width - unit_width - self.edge_padding)
-                digits_x = unit_x - self.value_gap - digits_width
-                if digits_x < min_digits_x:
-                    digits_x = min_digits_x
-
-        info_x = self.edge_padding
-        gap_y = 9
-        info_block_height = (self.font_small.height() * 2) + gap_y
-        info_y = self.speed_y + max(0, (height - info_block_height) // 2)
-
-        _render_text_block(lcd, self.writer_small, self.font_small, time_text, info_x, info_y, info_width, _BG)
-        second_y = info_y + self.font_small.height() + gap_y
-        _render_text_block(lcd, self.writer_small, self.font_small, trip_text, info_x, second_y, info_width, _BG)
-
-        _render_text_block(lcd, self.writer_large, self.font_large, speed_text, digits_x, self.speed_y, digits_width + 4, _BG)
-        _render_text_block(lcd, self.writer_small, self.font_small, self._unit_text, unit_x, self.speed_unit_y, unit_width + 4, _BG)
-        return True
+        self.w_speed.set(speed_text)
+        self.w_time.set(time_text)
+        self.w_trip.set(trip_text)
 
     def _update_power(self, state):
-        vbat = state.get_pr("battery_voltage", (None, ""))[0]
-        if vbat is None:
-            vbat = state.get_pr("batt_voltage_calc", (0.0, ""))[0]
-        vbat = float(vbat) if vbat is not None else 0.0
-        bc = state.get_pr("battery_current", (0.0, ""))[0]
-        bc = float(bc) if bc is not None else 0.0
-        power = state.get_pr("motor_input_power", (None, ""))[0]
-        if power is None:
-            power = vbat * bc
-        try:
-            power_val = float(power)
-        except Exception:
+        power_val = state.pr_frame().power_w
+        if power_val is None:
             power_val = 0.0
         power_int = int(round(power_val))
         clamp = self.power_max_value
         if power_int > clamp:
             power_int = clamp
-        if power_int < -clamp:
-            power_int = -clamp
-        power_text = str(power_int)
-
-        updated = False
-        if power_text != self._last_power_text:
-            self._last_power_text = power_text
-
-            lcd = self.lcd
-            height = self.font_large.height()
-            lcd.fill_rect(0, self.power_y, lcd.width, height, _BG)
-
-            digits_width = _text_extent(self.font_large, power_text)
-            unit_width = _text_extent(self.font_small, self._power_unit_text)
-            unit_x = max(self.edge_padding, lcd.width - unit_width - self.edge_padding)
-            digits_x = unit_x - self.value_gap - digits_width
-            if digits_x < self.edge_padding:
-                digits_x = self.edge_padding
-                unit_x = digits_x + digits_width + self.value_gap
-
-            _render_text_block(lcd, self.writer_large, self.font_large, power_text, digits_x, self.power_y, digits_width + 4, _BG)
-            _render_text_block(lcd, self.writer_small, self.font_small, self._power_unit_text, unit_x, self.power_unit_y, unit_width + 4, _BG)
-            updated = True
-
-        return updated
+        if power_int < _POWER_MIN_VALUE:
+            power_int = _POWER_MIN_VALUE
+        self.w_power.set(str(power_int))
 
     def _update_bottom_line(self, state):
         voltage = state.battery_voltage()
@@ -346,32 +207,75 @@ class DashboardLayout(DashboardBase):
             percent = 100
         percent_text = f"{percent}%"
 
-        if voltage_text == self._last_voltage_text and percent_text == self._last_percent_text:
-            return False
-
-        self._last_voltage_text = voltage_text
-        self._last_percent_text = percent_text
+        self.w_voltage.set(voltage_text)
+        self.w_percent.set(percent_text)
 
+    def _build_widgets(self):
         lcd = self.lcd
-        area_height = lcd.height - self.bottom_y
-        lcd.fill_rect(0, self.bottom_y, lcd.width, area_height, _BG)
-
-        text_start_x = self.edge_padding
+        width = lcd.width
+        edge = self.edge_padding
+        gap = self.value_gap
+        pitch = self.large_pitch
+        small = self.font_small
+        small_height = small.height()
+
+        # Speed: two digit cells right-aligned against the unit, time and
+        # trip stacked on the left.
+        unit_width = text_width(small, self._unit_text)
+        unit_x = max(edge, width - unit_width - edge)
+        digits_x = unit_x - gap - (2 * pitch)
+        self.w_speed = BigNumber(lcd, self.font_large, digits_x, self.speed_y, 2, writer=self.writer_large, pitch=pitch)
+        gap_y = 9
+        info_block_height = (small_height * 2) + gap_y
+        info_y = self.speed_y + max(0, (self.font_large.height() - info_block_height) // 2)
+        info_width = digits_x - gap - edge
+        self.w_time = Label(lcd, small, edge, info_y, info_width, writer=self.writer_small)
+        self.w_trip = Label(lcd, small, edge, info_y + small_height + gap_y, info_width, writer=self.writer_small)
+        speed_unit = Label(
+            lcd, small, unit_x, self.speed_unit_y, width - unit_x, writer=self.writer_small, text=self._unit_text
+        )
+
+        # Power: four cells (up to 4000 W or -999 W) from the left edge, the
+        # unit after them. The margin shrinks so "watts" still fits.
+        power_unit_width = text_width(small, self._power_unit_text)
+        power_x = max(0, min(edge, width - edge - power_unit_width - (gap // 2) - (4 * pitch)))
+        self.w_power = BigNumber(lcd, self.font_large, power_x, self.power_y, 4, writer=self.writer_large, pitch=pitch)
+        power_unit_x = power_x + (4 * pitch) + (gap // 2)
+        power_unit = Label(
+            lcd,
+            small,
+            power_unit_x,
+            self.power_unit_y,
+            width - power_unit_x,
+            writer=self.writer_small,
+            text=self._power_unit_text,
+        )
+
+        # Bottom line: battery icon, pack voltage, state of charge.
+        bottom = self.font_bottom
+        text_x = edge
+        icon = None
         if self.icon:
             icon_w, icon_h, icon_data = self.icon
-            lcd.blit_buffer(icon_data, self.icon_x, self.icon_y, icon_w, icon_h)
-            text_start_x = self.icon_x + icon_w + _SPRITE_GAP
-
-        volt_width = _text_extent(self.font_bottom, voltage_text)
-        percent_width = _text_extent(self.font_bottom, percent_text)
-        volt_x = text_start_x
-        percent_x = max(self.edge_padding, lcd.width - percent_width - self.edge_padding)
-        if percent_x <= volt_x + volt_width + 6:
-            percent_x = volt_x + volt_width + 6
-            if percent_x + percent_width > lcd.width:
-                percent_x = max(self.edge_padding, lcd.width - percent_width - self.edge_padding)
-
-        _render_text_block(lcd, self.writer_bottom, self.font_bottom, voltage_text, volt_x, self.bottom_text_y, volt_width + 4, _BG)
-        _render_text_block(lcd, self.writer_bottom, self.font_bottom, percent_text, percent_x, self.bottom_text_y, percent_width + 4, _BG)
-        return True
-
+            icon = Icon(lcd, self.icon_x, self.icon_y, icon_w, icon_h, icon_data)
+            text_x = self.icon_x + icon_w + _SPRITE_GAP
+        percent_width = text_width(bottom, "100%")
+        percent_x = width - percent_width - edge
+        self.w_percent = Label(
+            lcd, bottom, percent_x, self.bottom_text_y, percent_width, align="right", writer=self.writer_bottom
+        )
+        self.w_voltage = Label(
+            lcd, bottom, text_x, self.bottom_text_y, percent_x - 6 - text_x, writer=self.writer_bottom
+        )
+
+        return Row(
+            self.w_time,
+            self.w_trip,
+            self.w_speed,
+            speed_unit,
+            self.w_power,
+            power_unit,
+            icon,
+            self.w_voltage,
+            self.w_percent,
+        )
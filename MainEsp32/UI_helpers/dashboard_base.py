@@ -1,5 +1,7 @@
 """Common helpers for dashboard screens."""
 
+from time import ticks_diff, ticks_ms
+
 import fonts
 from .writer import Writer
 
@@ -23,6 +25,17 @@ def _text_width(font_mod, text):
 class DashboardBase:
     """Base class providing a common title header for dashboards."""
 
+    # Extra PR telemetry fields streamed only while this dashboard is shown.
+    PR_FIELDS_FAST = ()
+    PR_FIELDS_SLOW = ()
+    # Root of the dashboard's widget tree (see widgets.py), if it has one.
+    widgets = None
+    # ticks_ms() by which render_widgets() should stop (set by the UI
+    # scheduler per frame slot); None renders the whole tree.
+    render_deadline = None
+    # True while widgets invalidated by a cut-short render are still to draw.
+    render_pending = False
+
     def __init__(self, ui_display, title, *, fg=_DEFAULT_FG, bg=_DEFAULT_BG, font_name=_DEFAULT_HEADER_FONT, sep_color=None):
         self.ui = ui_display
         self.lcd = ui_display.display
@@ -39,6 +52,9 @@ class DashboardBase:
         self._header_title = title
         self._screen_index = 0
         self._header_dirty = True
+        # Bumped by request_full_refresh(); the UI scheduler compares it with
+        # the value it last drew to spot (and possibly defer) full refreshes.
+        self.refresh_requests = 0
         self._header_text = self._compose_header_text()
         self._header_text_height = self._header_font.height() + (_HEADER_PAD_Y * 2)
         self._header_height = self._header_text_height + 3
@@ -68,15 +84,40 @@ class DashboardBase:
             self._header_dirty = True
 
     def ensure_header(self, force=False):
+        """Redraw the header if needed; return True when it drew."""
         if force:
             self._header_dirty = True
         if not self._header_dirty:
-            return
+            return False
         self._draw_header()
         self._header_dirty = False
+        return True
 
     def request_full_refresh(self):
         self._header_dirty = True
+        self.refresh_requests += 1
+
+    def render_widgets(self, full=False):
+        """Render the widget tree (all of it after a full refresh).
+
+        Stops at ``render_deadline`` and sets ``render_pending`` when it may
+        have left widgets undrawn. Returns how many widgets drew, so callers
+        can skip ``lcd.show()``.
+        """
+        root = self.widgets
+        if root is None:
+            return 0
+        if full:
+            root.invalidate()
+        deadline = self.render_deadline
+        drawn = root.render(deadline)
+        self.render_pending = deadline is not None and ticks_diff(ticks_ms(), deadline) >= 0
+        return drawn
+
+    def resume_render(self):
+        """Draw the widgets a cut-short render_widgets() left; flush if any."""
+        if self.render_widgets():
+            self.lcd.show()
 
     def handle_event(self, event, state, **kwargs):
         """Handle input events; return truthy if consumed."""
@@ -4,6 +4,7 @@ import bats
 import fonts
 
 from .dashboard_base import DashboardBase
+from .widgets import Label, Row, Switcher, Widget
 from .writer import Writer
 
 FG_COLOR = 0xFFFF
@@ -28,6 +29,33 @@ _FIELD_LIMITS = {
 }
 
 
+class _PackRow(Widget):
+    """One pack name in the list, centred, with a "<" marker on the active pack.
+
+    The value is ``(label, invert, active)`` or None for an empty row.
+    """
+
+    def __init__(self, dash, y):
+        super().__init__(dash.lcd, 0, y, dash.lcd.width, dash.font_mode.height(), BG_COLOR)
+        self.dash = dash
+
+    def _draw(self, value, previous):
+        self.clear()
+        if value is None:
+            return
+        label, invert, active = value
+        dash = self.dash
+        framebuf = self.lcd.framebuf
+        x = max(0, (self.w - dash._text_width(dash.font_mode, label)) // 2)
+        Writer.set_textpos(framebuf, self.y, x)
+        dash.writer_mode.printstring(label, invert=invert)
+        if active:
+            mark_text = "<"
+            mark_x = max(0, x - dash._text_width(dash.font_small, mark_text) - 4)
+            Writer.set_textpos(framebuf, self.y + self.h - dash.font_small.height(), mark_x)
+            dash.writer_small.printstring(mark_text)
+
+
 class DashboardBattSelect(DashboardBase):
     """Interactive dashboard to select or create battery packs."""
 
@@ -64,12 +92,15 @@ class DashboardBattSelect(DashboardBase):
             "cell_capacity_mAh": 4500.0,
         }
         self._needs_refresh = True
+        self._needs_full_refresh = True
         self._last_snapshot = None
+        self.widgets = self._build_widgets()
 
     # ---------- DashboardBase overrides ----------
     def request_full_refresh(self):
         super().request_full_refresh()
         self._needs_refresh = True
+        self._needs_full_refresh = True
         self._last_snapshot = None
 
     def handle_event(self, event, state, **kwargs):
@@ -171,65 +202,63 @@ class DashboardBattSelect(DashboardBase):
         self._last_snapshot = snapshot
         self._needs_refresh = False
 
-        self.ensure_header(force=True)
-        lcd = self.lcd
-        top = self.header_height
-        lcd.fill_rect(0, top, lcd.width, lcd.height - top, BG_COLOR)
-
-        info_y = top + 2
-        self._draw_text(self.writer_small, self.font_small, "CUR {}".format(current_name), _PADDING_X, info_y)
-        info_y += self.font_small.height()
-        self._draw_text(self.writer_small, self.font_small, pack_info, _PADDING_X, info_y)
+        full = self._needs_full_refresh
+        self._needs_full_refresh = False
+        if full:
+            lcd = self.lcd
+            top = self.header_height
+            lcd.fill_rect(0, top, lcd.width, lcd.height - top, BG_COLOR)
+        header = self.ensure_header(force=full)
 
-        content_y = info_y + self.font_small.height() + _ROW_GAP
+        self.w_current.set("CUR {}".format(current_name))
+        self.w_info.set(pack_info)
 
         if self._mode == "create":
-            self._draw_create_editor(content_y)
+            self.view.show("create")
+            self._set_create_editor()
             current_field = _CREATE_FIELDS[self._create_field]
             field_label = self._field_label(current_field)
             value_text = self._field_value_text(current_field, self._create_values[current_field])
             status_label = "{} {}".format(field_label, value_text)
             instructions = "UP/DN +/-  PAGE LONG NEXT  EXTRA SAVE  SH EXIT"
         else:
-            status_label, instructions = self._draw_list(names, content_y, current_name)
+            self.view.show("list")
+            status_label, instructions = self._set_list(names, current_name)
 
-        self._draw_status_lines(status_label, instructions)
-        self.lcd.show()
+        max_width = self.lcd.width - 4
+        self.w_status.set(self._fit_text(self.font_small, status_label or "", max_width))
+        self.w_help.set(self._fit_text(self.font_small, instructions or "", max_width))
+        if self.render_widgets(full) or header:
+            self.lcd.show()
 
-    def _draw_list(self, names, start_y, current_name):
-        lcd = self.lcd
-        list_bottom = lcd.height - (self.font_small.height() * 2 + _STATUS_GAP + 4)
+    def _set_list(self, names, current_name):
         total = len(names)
-        if total <= _MAX_VISIBLE:
+        visible = len(self.w_rows)
+        if total <= visible:
             start = 0
         else:
-            half = _MAX_VISIBLE // 2
+            half = visible // 2
             start = self._selection - half
             if start < 0:
                 start = 0
-            end = start + _MAX_VISIBLE
+            end = start + visible
             if end > total:
-                start = total - _MAX_VISIBLE
+                start = total - visible
         current_upper = current_name.upper()
         display_current = current_upper or "-"
         if display_current == "CREATE NEW":
             display_current = "CREATE"
-        y = start_y
-        for idx in range(start, min(start + _MAX_VISIBLE, total)):
+        for row_idx, row in enumerate(self.w_rows):
+            idx = start + row_idx
+            if idx >= total:
+                row.set(None)
+                continue
             label = names[idx].upper()[:16]
-            if y + self.font_mode.height() > list_bottom:
-                break
-            width = self._text_width(self.font_mode, label)
-            x = max(0, (lcd.width - width) // 2)
-            Writer.set_textpos(lcd.framebuf, y, x)
             if self._entered and self._mode == "list":
                 invert = idx == self._selection
             else:
                 invert = label == current_upper
-            self.writer_mode.printstring(label, invert=invert)
-            if label == current_upper:
-                self._draw_active_marker(x, y)
-            y += self.font_mode.height() + _ROW_GAP
+            row.set((label, invert, label == current_upper))
 
         selected_label = names[self._selection].upper()[:16] if names else "-"
         if not selected_label:
@@ -249,53 +278,62 @@ class DashboardBattSelect(DashboardBase):
             instructions = "PAGE SH ENTER  UP NEXT  DOWN PREV"
         return status_label, instructions
 
-    def _draw_create_editor(self, start_y):
-        y = start_y
+    def _set_create_editor(self):
         values = self._create_values
         for idx, field in enumerate(_CREATE_FIELDS):
             label = self._field_label(field)
             value_text = self._field_value_text(field, values[field])
-            text = "{} {}".format(label, value_text)
-            invert = self._create_field == idx
-            self._draw_text(self.writer_small, self.font_small, text, _PADDING_X, y, invert=invert)
-            y += self.font_small.height() + _ROW_GAP
+            self.w_fields[idx].set("{} {}".format(label, value_text), self._create_field == idx)
         name = self._compose_pack_name(values)
-        self._draw_text(self.writer_small, self.font_small, "NAME {}".format(name[:14]), _PADDING_X, y)
-
-    def _draw_active_marker(self, label_x, label_y):
-        mark_text = "<"
-        mark_width = self._text_width(self.font_small, mark_text)
-        x = label_x - mark_width - 4
-        if x < 0:
-            x = 0
-        y = label_y + self.font_mode.height() - self.font_small.height()
-        height = self.font_small.height()
-        self.lcd.fill_rect(x, y, mark_width, height, BG_COLOR)
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        self.writer_small.printstring(mark_text)
-
-    def _draw_status_lines(self, line1, line2):
+        self.w_name.set("NAME {}".format(name[:14]))
+
+    def _build_widgets(self):
         lcd = self.lcd
-        status_area_height = self.font_small.height() * 2 + _STATUS_GAP + 4
+        width = lcd.width
+        small = self.font_small
+        small_height = small.height()
+        top = self.header_height
+
+        info_y = top + 2
+        line_w = width - _PADDING_X
+        self.w_current = Label(lcd, small, _PADDING_X, info_y, line_w, writer=self.writer_small)
+        info_y += small_height
+        self.w_info = Label(lcd, small, _PADDING_X, info_y, line_w, writer=self.writer_small)
+        content_y = info_y + small_height + _ROW_GAP
+
+        status_area_height = small_height * 2 + _STATUS_GAP + 4
         status_y = lcd.height - status_area_height
-        if status_y < self.header_height:
-            status_y = self.header_height
-        lcd.fill_rect(0, status_y, lcd.width, lcd.height - status_y, BG_COLOR)
+        if status_y < top:
+            status_y = top
         line1_y = status_y + 2
-        line2_y = line1_y + self.font_small.height() + _STATUS_GAP
-        self._draw_small_centered(line1 or "", line1_y)
-        self._draw_small_centered(line2 or "", line2_y)
-
-    def _draw_small_centered(self, text, y):
-        if text is None:
-            text = ""
-        max_width = self.lcd.width - 4
-        segment = self._fit_text(self.font_small, text, max_width)
-        width = self._text_width(self.font_small, segment)
-        x = max(2, (self.lcd.width - width) // 2)
-        self.lcd.fill_rect(0, y, self.lcd.width, self.font_small.height(), BG_COLOR)
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        self.writer_small.printstring(segment)
+        line2_y = line1_y + small_height + _STATUS_GAP
+        self.w_status = Label(lcd, small, 2, line1_y, width - 4, align="center", writer=self.writer_small)
+        self.w_help = Label(lcd, small, 2, line2_y, width - 4, align="center", writer=self.writer_small)
+
+        self.w_rows = []
+        y = content_y
+        row_height = self.font_mode.height()
+        while len(self.w_rows) < _MAX_VISIBLE and y + row_height <= status_y:
+            self.w_rows.append(_PackRow(self, y))
+            y += row_height + _ROW_GAP
+
+        self.w_fields = []
+        y = content_y
+        for _ in _CREATE_FIELDS:
+            self.w_fields.append(Label(lcd, small, _PADDING_X, y, line_w, writer=self.writer_small))
+            y += small_height + _ROW_GAP
+        self.w_name = Label(lcd, small, _PADDING_X, y, line_w, writer=self.writer_small)
+
+        self.view = Switcher(
+            lcd,
+            0,
+            content_y,
+            width,
+            status_y - content_y,
+            {"list": Row(*self.w_rows), "create": Row(*self.w_fields, self.w_name)},
+            active="list",
+        )
+        return Row(self.w_current, self.w_info, self.view, self.w_status, self.w_help)
 
     def _fit_text(self, font_mod, text, max_width):
         if text is None:
@@ -346,34 +384,6 @@ class DashboardBattSelect(DashboardBase):
         cap_ah = float(pack.get("pack_capacity_Ah", 0.0) or 0.0)
         return f"{cells:02d}s x{parallel} {cap_ah:04.1f}Ah"
 
-    def _draw_text(self, writer, font_mod, text, x, y, invert=False):
-        if text is None:
-            text = ""
-        try:
-            x = int(x)
-            y = int(y)
-        except Exception:
-            x = 0
-            y = 0
-
-        if x < 0:
-            x = 0
-
-        height = font_mod.height()
-        max_width = self.lcd.width - x
-        if max_width <= 0:
-            return
-
-        segment = text
-        while segment and self._text_width(font_mod, segment) > max_width:
-            segment = segment[:-1]
-
-        self.lcd.fill_rect(x, y, max_width, height, BG_COLOR)
-        if not segment:
-            return
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        writer.printstring(segment, invert=invert)
-
     @staticmethod
     def _text_width(font_mod, text):
         width = 0
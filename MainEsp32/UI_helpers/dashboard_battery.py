@@ -5,6 +5,7 @@ from time import ticks_diff, ticks_ms
 import fonts
 
 from .dashboard_base import DashboardBase
+from .widgets import Label, Row, text_width
 from .writer import Writer
 
 FG_COLOR = 0xFFFF
@@ -59,6 +60,7 @@ class DashboardBattStatus(DashboardBase):
         self._last_tick = None
         self._last_values = None
         self._needs_full_refresh = True
+        self.widgets = self._build_widgets()
 
     def request_full_refresh(self):
         super().request_full_refresh()
@@ -83,16 +85,16 @@ class DashboardBattStatus(DashboardBase):
             self._last_tick = now
             return
 
-        if self._needs_full_refresh:
+        full = self._needs_full_refresh
+        if full:
             self.lcd.fill(BG_COLOR)
-            self.ensure_header(force=True)
             self._needs_full_refresh = False
-        else:
-            self.ensure_header()
+        header = self.ensure_header(force=full)
 
         self._draw_content(values)
 
-        self.lcd.show()
+        if self.render_widgets(full) or header:
+            self.lcd.show()
         self._last_tick = now
         self._last_values = values
 
@@ -118,12 +120,13 @@ class DashboardBattStatus(DashboardBase):
         voltage = getattr(state, "battery_voltage_v", None)
         if not voltage:
             voltage = state.battery_voltage()
+        frame = state.pr_frame()
         current = getattr(state, "battery_current_a", None)
         if current is None:
-            current = state.get_pr("battery_current", (None, "A"))[0]
+            current = frame.battery_current_a
         power = getattr(state, "battery_power_w", None)
         if power is None:
-            power = state.get_pr("motor_input_power", (None, "W"))[0]
+            power = frame.power_w
         if power is None and voltage is not None and current is not None:
             power = _safe_float(voltage, 0.0) * _safe_float(current, 0.0)
 
@@ -175,92 +178,63 @@ class DashboardBattStatus(DashboardBase):
             cell_avg,
         ) = values
 
+        self.w_pack.set((pack_name or "PACK").upper())
+        self.w_cells.set(f"{cells_series}s x{parallel}")
+        self.w_percent.set(f"{max(0, min(percent, 100)):03d}%")
+        self.w_rows[0].set(f"{voltage:0.2f}V", f"{remaining_wh:0.0f}/{max_wh:0.0f}")
+        self.w_rows[1].set(f"{current:0.2f}A", f"{cell_avg:0.3f}V")
+        self.w_rows[2].set(f"{power:0.0f}W", f"{cells_series:02d}s x{parallel:02d}")
+        if guard_active:
+            if guard_applied and guard_throttle:
+                status_text = f"GUARD DAC {guard_throttle:0.2f}V"
+            else:
+                status_text = "GUARD ACTIVE"
+        else:
+            status_text = "GUARD OK"
+        self.w_status.set(status_text)
+
+    def _build_widgets(self):
         lcd = self.lcd
         width = lcd.width
         height = lcd.height
+        small = self.font_small
+        medium = self.font_medium
 
-        content_top = self.header_height
-        if content_top < height:
-            lcd.fill_rect(0, content_top, width, height - content_top, BG_COLOR)
-
-        pack_label = (pack_name or "PACK").upper()
-        pack_y = content_top + 2
-        self._draw_text(self.writer_small, self.font_small, pack_label, _PADDING_X, pack_y)
-        cells_text = f"{cells_series}s x{parallel}"
-        self._draw_text(
-            self.writer_small,
-            self.font_small,
-            cells_text,
-            width - self._text_width(self.font_small, cells_text) - _PADDING_X,
-            pack_y,
+        pack_y = self.header_height + 2
+        cells_w = text_width(small, "00s x00")
+        self.w_cells = Label(
+            lcd, small, width - _PADDING_X - cells_w, pack_y, cells_w, align="right", writer=self.writer_small
         )
-
-        percent_text = f"{max(0, min(percent, 100)):03d}%"
-        percent_width = self._text_width(self.font_large, percent_text)
-        percent_x = max(0, (width - percent_width) // 2)
-        percent_y = pack_y + self.font_small.height() + (_HEADER_MARGIN // 2)
-        self._draw_text(self.writer_large, self.font_large, percent_text, percent_x, percent_y)
-
-        rows_y = percent_y + self.font_large.height() + (_ROW_GAP * 2)
-        col_split = width // 2
-        col_gap = 6
-
-        left_rows = (
-            ("V", f"{voltage:0.2f}V"),
-            ("I", f"{current:0.2f}A"),
-            ("P", f"{power:0.0f}W"),
+        self.w_pack = Label(
+            lcd, small, _PADDING_X, pack_y, width - cells_w - (_PADDING_X * 2) - 4, writer=self.writer_small
         )
 
-        right_rows = (
-            ("Wh", f"{remaining_wh:0.1f}/{max_wh:0.1f}"),
-            ("Cell", f"{cell_avg:0.3f}V"),
-            ("Pack", f"{cells_series:02d}s x{parallel:02d}"),
-        )
+        percent_y = pack_y + small.height() + (_HEADER_MARGIN // 2)
+        self.w_percent = Label(lcd, self.font_large, 0, percent_y, width, align="center", writer=self.writer_large)
 
-        for (l_label, l_value), (r_label, r_value) in zip(left_rows, right_rows):
-            left_value_x = col_split - col_gap - self._text_width(self.font_medium, l_value)
-            self._draw_text(self.writer_small, self.font_small, l_label, _PADDING_X, rows_y)
-            self._draw_text(self.writer_medium, self.font_medium, l_value, left_value_x, rows_y)
-
-            right_label_x = col_split + col_gap
-            self._draw_text(self.writer_small, self.font_small, r_label, right_label_x, rows_y)
-            right_value_x = width - self._text_width(self.font_medium, r_value) - _PADDING_X
-            self._draw_text(self.writer_medium, self.font_medium, r_value, right_value_x, rows_y)
-
-            rows_y += self.font_medium.height() + _ROW_GAP
+        rows_y = percent_y + self.font_large.height() + (_ROW_GAP * 2)
+        # The right column carries the longer values (Wh, cell voltage), so
+        # it gets the wider share; values sit right after their labels.
+        col_split = (width * 7) // 16
+        col_gap = 3
+        right_label_x = col_split + col_gap
+        label_gap = 2
+        self.w_rows = []
+        for l_label, r_label in (("V", "Wh"), ("I", "Cell"), ("P", "Pack")):
+            l_end = _PADDING_X + text_width(small, l_label) + label_gap
+            r_end = right_label_x + text_width(small, r_label) + label_gap
+            row = Row(
+                Label(lcd, medium, l_end, rows_y, col_split - col_gap - l_end, align="right", writer=self.writer_medium),
+                Label(lcd, medium, r_end, rows_y, width - _PADDING_X - r_end, align="right", writer=self.writer_medium),
+            )
+            self.w_rows.append(row)
+            row.add(Label(lcd, small, _PADDING_X, rows_y, l_end - _PADDING_X, writer=self.writer_small, text=l_label))
+            row.add(Label(lcd, small, right_label_x, rows_y, r_end - right_label_x, writer=self.writer_small, text=r_label))
+            rows_y += medium.height() + _ROW_GAP
 
         status_y = rows_y + _ROW_GAP
-        if status_y + self.font_small.height() > height:
-            status_y = height - self.font_small.height() - 2
-        if guard_active:
-            if guard_applied and guard_throttle:
-                status_text = f"GUARD DAC {guard_throttle:0.2f}V"
-            else:
-                status_text = "GUARD ACTIVE"
-        else:
-            status_text = "GUARD OK"
-        self._draw_text(
-            self.writer_small,
-            self.font_small,
-            status_text,
-            _PADDING_X,
-            status_y,
-        )
+        if status_y + small.height() > height:
+            status_y = height - small.height() - 2
+        self.w_status = Label(lcd, small, _PADDING_X, status_y, width - (_PADDING_X * 2), writer=self.writer_small)
 
-    def _draw_text(self, writer, font_mod, text, x, y):
-        height = font_mod.height()
-        width = self._text_width(font_mod, text)
-        self.lcd.fill_rect(x, y, width + 4, height, BG_COLOR)
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        writer.printstring(text)
-
-    @staticmethod
-    def _text_width(font_mod, text):
-        total = 0
-        for ch in text:
-            try:
-                _, _, adv = font_mod.get_ch(ch)
-            except Exception:
-                adv = 0
-            total += adv
-        return total
+        return Row(self.w_pack, self.w_cells, self.w_percent, *self.w_rows, self.w_status)
@@ -5,6 +5,7 @@ from time import ticks_diff, ticks_ms
 import fonts
 
 from .dashboard_base import DashboardBase
+from .widgets import Label, Row
 from .writer import Writer
 
 _FG = 0xFFFF
@@ -15,17 +16,6 @@ _STATUS_GAP = 4
 _CONFIRM_DISPLAY_MS = 1800
 
 
-def _text_width(font_mod, text):
-    width = 0
-    for ch in text:
-        try:
-            _, _, advance = font_mod.get_ch(ch)
-        except Exception:
-            advance = 0
-        width += advance
-    return width
-
-
 def _normalize(mode):
     try:
         name = str(mode or "").strip().lower()
@@ -74,6 +64,7 @@ class DashboardModes(DashboardBase):
         self._entered = False
         self._move_handler = None
         self._confirm_handler = None
+        self.widgets = self._build_widgets()
 
     def request_full_refresh(self):
         super().request_full_refresh()
@@ -87,10 +78,7 @@ class DashboardModes(DashboardBase):
         return bool(self._entered)
 
     def draw(self, state):
-        if self._needs_full_refresh:
-            self.ensure_header(force=True)
-        else:
-            self.ensure_header()
+        header = self.ensure_header(force=self._needs_full_refresh)
 
         modes = list(getattr(state, "throttle_modes", []))
         if not modes:
@@ -128,12 +116,15 @@ class DashboardModes(DashboardBase):
 
         snapshot = (tuple(normalized_modes), selection_idx, candidate, active, recent_confirm, self._entered)
         if not self._needs_full_refresh and snapshot == self._snapshot:
+            if header:
+                self.lcd.show()
             return
 
-        self._render(normalized_modes, selection_idx, candidate, active, recent_confirm)
+        drawn = self._render(normalized_modes, selection_idx, candidate, active, recent_confirm)
         self._snapshot = snapshot
         self._needs_full_refresh = False
-        self.lcd.show()
+        if drawn or header:
+            self.lcd.show()
 
     def handle_event(self, event, state, **kwargs):
         if event == "page_short":
@@ -169,32 +160,23 @@ class DashboardModes(DashboardBase):
         return False
 
     def _render(self, modes, selection_idx, candidate, active, recent_confirm):
-        lcd = self.lcd
-        top = self.header_height
-        lcd.fill_rect(0, top, lcd.width, lcd.height - top, _BG)
-
-        status_area_height = self.font_small.height() * 2 + _STATUS_GAP + 4
-        status_y = lcd.height - status_area_height
-        if status_y < top:
-            status_y = top
-        list_bottom = status_y - _STATUS_GAP
-
-        y = top + _PADDING_Y
-        for idx, mode in enumerate(modes):
-            label = _mode_label(mode)
-            if y + self.font_mode.height() > list_bottom:
-                break
-            width = _text_width(self.font_mode, label)
-            x = max(0, (lcd.width - width) // 2)
-            Writer.set_textpos(lcd.framebuf, y, x)
+        full = self._needs_full_refresh
+        if full:
+            lcd = self.lcd
+            top = self.header_height
+            lcd.fill_rect(0, top, lcd.width, lcd.height - top, _BG)
+
+        for idx, row in enumerate(self.w_modes):
+            if idx >= len(modes):
+                row.set("")
+                continue
+            mode = modes[idx]
             if self._entered:
                 invert = idx == selection_idx
             else:
                 invert = _normalize(mode) == active
-            self.writer_mode.printstring(label, invert=invert)
-            y += self.font_mode.height() + _ROW_GAP
+            row.set(_mode_label(mode), invert)
 
-        lcd.fill_rect(0, status_y, lcd.width, lcd.height - status_y, _BG)
         if candidate == active:
             status_label = "ACTIVE {}".format(_mode_label(active))
         elif recent_confirm:
@@ -207,15 +189,33 @@ class DashboardModes(DashboardBase):
         else:
             instructions = "PAGE SHORT ENTER  UP NEXT  DOWN PREV"
 
-        self._draw_small_line(status_label, status_y + 2)
-        self._draw_small_line(instructions, status_y + 2 + self.font_small.height())
+        self.w_status.set(status_label)
+        self.w_help.set(instructions)
+        return self.render_widgets(full)
 
-    def _draw_small_line(self, text, y):
+    def _build_widgets(self):
         lcd = self.lcd
-        width = _text_width(self.font_small, text)
-        x = max(0, (lcd.width - width) // 2)
-        Writer.set_textpos(lcd.framebuf, y, x)
-        self.writer_small.printstring(text)
+        width = lcd.width
+        top = self.header_height
+        small_height = self.font_small.height()
+        status_area_height = small_height * 2 + _STATUS_GAP + 4
+        status_y = lcd.height - status_area_height
+        if status_y < top:
+            status_y = top
+        list_bottom = status_y - _STATUS_GAP
+
+        mode_height = self.font_mode.height()
+        self.w_modes = []
+        y = top + _PADDING_Y
+        while y + mode_height <= list_bottom:
+            self.w_modes.append(Label(lcd, self.font_mode, 0, y, width, align="center", writer=self.writer_mode))
+            y += mode_height + _ROW_GAP
+
+        self.w_status = Label(lcd, self.font_small, 0, status_y + 2, width, align="center", writer=self.writer_small)
+        self.w_help = Label(
+            lcd, self.font_small, 0, status_y + 2 + small_height, width, align="center", writer=self.writer_small
+        )
+        return Row(*self.w_modes, self.w_status, self.w_help)
 
     def _invoke_move(self, delta):
         handler = self._move_handler
@@ -3,10 +3,12 @@
 from time import ticks_diff, ticks_ms
 
 import fonts
+from pr_store import PR_BRAKE_VOLTAGE_1, PR_THROTTLE_VOLTAGE
 from .writer import Writer
 
 from .dashboard_base import DashboardBase
 from .line_meter import HorizontalSegmentMeter
+from .widgets import Label, Meter, Row
 
 try:
     from motor_control import DEFAULTS as MOTOR_DEFAULTS
@@ -15,7 +17,7 @@ except Exception:  # pragma: no cover - optional dependency during host tooling
 
 FG_COLOR = 0xFFFF
 BG_COLOR = 0x0000
-_VALUE_TEMPLATE = "88.88"
+_VALUE_TEMPLATE = "8.88"  # ADC/DAC volts stay below 10 V
 
 _FONT_NAME_LABEL = "sevenSegment_20"
 _FONT_NAME_VALUE = "sevenSegment_40"
@@ -39,6 +41,13 @@ _LABELS = (
 class DashboardSignals(DashboardBase):
     """Render ADC and output throttle/brake signals."""
 
+    PR_FIELDS_FAST = (
+        "motor_current",
+        "phase_a_current",
+        "phase_b_current",
+        "phase_c_current",
+    )
+
     def __init__(self, ui_display):
         super().__init__(ui_display, title="SIGNALS", sep_color=0xFFE0)
         self.lcd = ui_display.display
@@ -66,7 +75,6 @@ class DashboardSignals(DashboardBase):
             segments=((0.0, 1.0, FG_COLOR),),
         )
 
-        self._last_values = None
         self._last_tick = None
         self._last_draw_ms = 0
         self._last_frame_interval_ms = 0
@@ -97,11 +105,11 @@ class DashboardSignals(DashboardBase):
         else:
             self._unit_x = None
         self._unit_y_offset = self.font_value.height() - self.font_unit.height()
+        self.widgets = self._build_widgets()
 
     def request_full_refresh(self):
         super().request_full_refresh()
         self._last_tick = None
-        self._last_values = None
         self._needs_full_refresh = True
 
     def draw(self, state):
@@ -115,21 +123,17 @@ class DashboardSignals(DashboardBase):
             if elapsed < self._tick_ms:
                 return
         values = self._collect_values(state)
-        if not self._needs_full_refresh and not self._values_changed(values):
-            if elapsed <= 0:
-                elapsed = self._tick_ms
-            self._last_frame_interval_ms = elapsed
-            return
 
         start = _ticks_ms_int()
-        if self._needs_full_refresh:
+        full = self._needs_full_refresh
+        if full:
             self.lcd.fill(BG_COLOR)
-            self.ensure_header(force=True)
             self._needs_full_refresh = False
-        else:
-            self.ensure_header()
-        self._draw_rows(state, values)
-        self.lcd.show()
+        header = self.ensure_header(force=full)
+        self._set_rows(state, values)
+        # Unchanged readings draw nothing, so there is nothing to flush.
+        if self.render_widgets(full) or header:
+            self.lcd.show()
         end = _ticks_ms_int()
         try:
             self._last_draw_ms = ticks_diff(end, start)
@@ -139,7 +143,6 @@ class DashboardSignals(DashboardBase):
             elapsed = self._tick_ms
         self._last_tick = now
         self._last_frame_interval_ms = elapsed
-        self._last_values = values
         if self._debug_timing and self._last_draw_ms >= self._debug_threshold_ms:
             stamp = _ticks_ms_int()
             try:
@@ -201,82 +204,96 @@ class DashboardSignals(DashboardBase):
             next_idx = 0
         return {"handled": True, "switch_screen": next_idx}
 
-    def _draw_rows(self, state, values):
-        y = self.header_height + _EDGE_PADDING
-        width = self.lcd.width
+    def _set_rows(self, state, values):
+        for row, value in zip(self.w_rows, values):
+            row.children[0].set(self._format_value(value))
+        self.w_meter.set(values[0])
 
+        footer_lines = self._mode_footer_lines(state)
+        if not footer_lines:
+            footer_lines = ("", None, None)
+        line1, line2_left, line2_right = footer_lines
+        if not (line2_left and line2_right):
+            line2_left = line2_right = ""
+        self.w_footer.set(line1, line2_left, line2_right)
+
+    def _build_widgets(self):
+        lcd = self.lcd
+        width = lcd.width
+        y = self.header_height + _EDGE_PADDING
+        value_area_width = min(self._value_area_width, width - self._value_x)
+        self.w_rows = []
+        self.w_meter = None
         for idx, (label, unit) in enumerate(_LABELS):
-            value = values[idx]
-            y = self._draw_row(width, y, label, value, unit)
-            gap_mid = y + (_ROW_GAP // 2)
+            row = Row(
+                Label(lcd, self.font_value, self._value_x, y, value_area_width, align="right", writer=self.writer_value),
+                Label(
+                    lcd,
+                    self.font_label,
+                    self._label_x,
+                    y,
+                    min(self._label_area_width, width - self._label_x),
+                    writer=self.writer_label,
+                    text=label,
+                ),
+            )
+            if unit and self._unit_x is not None:
+                space = max(0, self._value_x - self._unit_x - 2)
+                unit_area_width = min(self._unit_area_width, space, width - self._unit_x)
+                if unit_area_width > 0:
+                    row.add(
+                        Label(
+                            lcd,
+                            self.font_unit,
+                            self._unit_x,
+                            y + self._unit_y_offset,
+                            unit_area_width,
+                            writer=self.writer_unit,
+                            text=unit,
+                        )
+                    )
+            self.w_rows.append(row)
+            y += self._row_height + _ROW_GAP
 
             if idx == 0:
-                meter_y = max(self.header_height + _EDGE_PADDING, gap_mid - (_METER_HEIGHT // 2))
-                self.meter_throttle.draw(
+                # The throttle meter gets its own band below the first row.
+                self.w_meter = Meter(
+                    lcd,
+                    self.meter_throttle,
                     self._meter_x,
-                    meter_y,
-                    values[0],
+                    y,
                     min_value=0.0,
                     max_value=3.3,
                     neutral_range=(0.8, 1.2),
                 )
+                y += _METER_HEIGHT + _ROW_GAP
 
-            y += _ROW_GAP
-
-        self._draw_mode_footer(state, y)
-
-    def _draw_mode_footer(self, state, used_height):
-        footer_lines = self._mode_footer_lines(state)
-        if not footer_lines:
-            return
-
-        line1, line2_left, line2_right = footer_lines
+        # Footer: placed for its two-line form so it never moves.
         line_height = self.font_label.height()
         spacing = 2
-        num_lines = 1 + (1 if line2_left and line2_right else 0)
-        total_height = (line_height * num_lines) + (spacing if num_lines > 1 else 0)
-        footer_top = used_height + max(_ROW_GAP, 4)
-        lcd = self.lcd
-        max_top = lcd.height - total_height - 1
+        footer_top = y + max(_ROW_GAP, 4)
+        max_top = lcd.height - (line_height * 2 + spacing) - 1
         if footer_top > max_top:
             footer_top = max_top
         if footer_top < self.header_height:
             footer_top = self.header_height
-        if footer_top >= lcd.height:
-            return
-        lcd.fill_rect(0, footer_top, lcd.width, lcd.height - footer_top, BG_COLOR)
-
-        self._draw_footer_text(line1, footer_top, align="left")
-        if num_lines > 1:
-            line2_y = footer_top + line_height + spacing
-            self._draw_footer_dual(line2_left, line2_right, line2_y)
-
-    def _draw_footer_text(self, text, y, *, align="left"):
-        if not text:
-            return
-        width = self._text_width(self.font_label, text)
-        if align == "right":
-            x = max(_EDGE_PADDING, self.lcd.width - width - _EDGE_PADDING)
-        else:
-            x = _EDGE_PADDING
-        self.lcd.fill_rect(x, y, min(width + 4, self.lcd.width - x), self.font_label.height(), BG_COLOR)
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        self.writer_label.printstring(text)
-
-    def _draw_footer_dual(self, left_text, right_text, y):
-        if not left_text and not right_text:
-            return
-        height = self.font_label.height()
-        lcd = self.lcd
-        lcd.fill_rect(0, y, lcd.width, height, BG_COLOR)
-        if left_text:
-            Writer.set_textpos(lcd.framebuf, y, _EDGE_PADDING)
-            self.writer_label.printstring(left_text)
-        if right_text:
-            width = self._text_width(self.font_label, right_text)
-            x = max(_EDGE_PADDING, lcd.width - width - _EDGE_PADDING)
-            Writer.set_textpos(lcd.framebuf, y, x)
-            self.writer_label.printstring(right_text)
+        line2_y = footer_top + line_height + spacing
+        text_width = width - (_EDGE_PADDING * 2)
+        half = text_width // 2
+        self.w_footer = Row(
+            Label(lcd, self.font_label, _EDGE_PADDING, footer_top, text_width, writer=self.writer_label),
+            Label(lcd, self.font_label, _EDGE_PADDING, line2_y, half, writer=self.writer_label),
+            Label(
+                lcd,
+                self.font_label,
+                _EDGE_PADDING + half,
+                line2_y,
+                text_width - half,
+                align="right",
+                writer=self.writer_label,
+            ),
+        )
+        return Row(*self.w_rows, self.w_meter, self.w_footer)
 
     def _mode_footer_lines(self, state):
         details = self._mode_metric_details(state)
@@ -390,7 +407,7 @@ class DashboardSignals(DashboardBase):
 
         if mode_lower == "power":
             max_value = self._safe_float(self._get_cfg_value(state, "throttle_power_max_w", 0.0))
-            actual = self._safe_float(self._get_pr_value(state, "motor_input_power"))
+            actual = state.pr_frame().power_w
             if actual is None:
                 actual = self._safe_float(getattr(state, "battery_power_w", None))
             target = self._compute_target(raw_ratio, max_value)
@@ -403,7 +420,7 @@ class DashboardSignals(DashboardBase):
             return _pack("Speed", "km/h", target, actual)
 
         if mode_lower == "torque" or (mode_lower == "mix" and not mix_speed):
-            power = self._safe_float(self._get_pr_value(state, "motor_input_power"))
+            power = state.pr_frame().power_w
             if power is None:
                 power = self._safe_float(getattr(state, "battery_power_w", None))
             speed = self._safe_float(self._safe_vehicle_speed(state))
@@ -437,14 +454,6 @@ class DashboardSignals(DashboardBase):
             return MOTOR_DEFAULTS.get(key)
         return default
 
-    @staticmethod
-    def _get_pr_value(state, name):
-        getter = getattr(state, "get_pr", None)
-        if not callable(getter):
-            return None
-        value, _unit = getter(name, (None, ""))
-        return value
-
     def _safe_vehicle_speed(self, state):
         speed_getter = getattr(state, "vehicle_speed", None)
         if callable(speed_getter):
@@ -511,36 +520,6 @@ class DashboardSignals(DashboardBase):
         except Exception:
             return None
 
-    def _draw_row(self, width, y, label, value, unit):
-        lcd = self.lcd
-        lcd.fill_rect(self._label_x, y, min(self._label_area_width, width - self._label_x), self._row_height, BG_COLOR)
-        Writer.set_textpos(lcd.framebuf, y, self._label_x)
-        self.writer_label.printstring(label)
-
-        value_text = self._format_value(value)
-        value_width = self._text_width(self.font_value, value_text)
-        area_width = min(self._value_area_width, width - self._value_x)
-        lcd.fill_rect(self._value_x, y, area_width, self._row_height, BG_COLOR)
-        value_x = self._value_x + area_width - value_width
-        if value_x < self._value_x:
-            value_x = self._value_x
-        Writer.set_textpos(lcd.framebuf, y, value_x)
-        self.writer_value.printstring(value_text)
-
-        if unit and self._unit_x is not None:
-            space = max(0, self._value_x - self._unit_x - 2)
-            unit_area_width = min(self._unit_area_width, space, width - self._unit_x)
-            if unit_area_width > 0:
-                lcd.fill_rect(self._unit_x, y, unit_area_width, self._row_height, BG_COLOR)
-                Writer.set_textpos(
-                    lcd.framebuf,
-                    y + self._unit_y_offset,
-                    self._unit_x,
-                )
-                self.writer_unit.printstring(unit)
-
-        return y + self._row_height
-
     def _text_width(self, font_mod, text):
         width = 0
         for ch in text:
@@ -566,33 +545,15 @@ class DashboardSignals(DashboardBase):
         adc_br = getattr(state, "brake_v", None)
 
         if adc_tr is None:
-            adc_tr = state.get_pr("throttle_voltage", (None, "V"))[0]
+            adc_tr = state.pr_value(PR_THROTTLE_VOLTAGE)
         if adc_br is None:
-            adc_br = state.get_pr("brake_voltage_1", (None, "V"))[0]
+            adc_br = state.pr_value(PR_BRAKE_VOLTAGE_1)
 
         out_tr = getattr(state, "dac_throttle_v", None)
         out_br = getattr(state, "dac_brake_v", None)
 
         return (adc_tr, adc_br, out_tr, out_br)
 
-    def _values_changed(self, values):
-        previous = self._last_values
-        if previous is None:
-            return True
-        for before, after in zip(previous, values):
-            if not self._nearly_equal(before, after):
-                return True
-        return False
-
-    @staticmethod
-    def _nearly_equal(a, b, eps=0.005):
-        if a is None or b is None:
-            return (a is None) != (b is None)
-        try:
-            return abs(float(a) - float(b)) <= eps
-        except Exception:
-            return True
-
     @property
     def last_draw_ms(self):
         return self._last_draw_ms
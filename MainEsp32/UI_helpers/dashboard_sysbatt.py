@@ -5,6 +5,7 @@ from time import ticks_ms, ticks_diff
 import fonts
 
 from .dashboard_base import DashboardBase
+from .widgets import Label, Row, Switcher
 from .writer import Writer
 
 FG_COLOR = 0xFFFF
@@ -44,6 +45,7 @@ class DashboardSysBatt(DashboardBase):
         self._last_tick = None
         self._last_values = None
         self._needs_full_refresh = True
+        self.widgets = self._build_widgets()
 
     def request_full_refresh(self):
         super().request_full_refresh()
@@ -80,14 +82,14 @@ class DashboardSysBatt(DashboardBase):
             self._last_tick = now
             return
 
-        if self._needs_full_refresh:
+        full = self._needs_full_refresh
+        if full:
             self.lcd.fill(BG_COLOR)
-            self.ensure_header(force=True)
             self._needs_full_refresh = False
-        else:
-            self.ensure_header()
+        header = self.ensure_header(force=full)
         self._draw_content(values)
-        self.lcd.show()
+        if self.render_widgets(full) or header:
+            self.lcd.show()
         self._last_tick = now
         self._last_values = values
 
@@ -145,16 +147,8 @@ class DashboardSysBatt(DashboardBase):
             age_s,
         ) = values
 
-        lcd = self.lcd
-        width = lcd.width
-        height = lcd.height
-        content_top = self.header_height
-        if content_top < height:
-            lcd.fill_rect(0, content_top, width, height - content_top, BG_COLOR)
-
-        y = content_top + 4
         if not available:
-            self._draw_text(self.writer_main, self.font_main, "PMU OFFLINE", _PADDING_X, y + 20)
+            self.view.show("offline")
             return
 
         lines = [
@@ -169,27 +163,32 @@ class DashboardSysBatt(DashboardBase):
             tail.append("PMU 0x{:02X}".format(int(addr) & 0xFF))
         if age_s is not None:
             tail.append("AGE {:>4.1f}s".format(age_s))
-        if tail:
-            lines.append(" ".join(tail))
+        lines.append(" ".join(tail))
+
+        self.view.show("lines")
+        for label, text in zip(self.w_lines, lines):
+            label.set(text)
 
-        for text in lines:
-            self._draw_text(self.writer_small, self.font_small, text, _PADDING_X, y)
+    def _build_widgets(self):
+        lcd = self.lcd
+        width = lcd.width
+        content_top = self.header_height
+        y = content_top + 4
+        line_w = width - _PADDING_X
+        self.w_lines = []
+        for _ in range(6):
+            self.w_lines.append(Label(lcd, self.font_small, _PADDING_X, y, line_w, writer=self.writer_small))
             y += self.font_small.height() + _ROW_GAP
+        offline = Label(
+            lcd, self.font_main, _PADDING_X, content_top + 24, line_w, writer=self.writer_main, text="PMU OFFLINE"
+        )
+        self.view = Switcher(
+            lcd,
+            0,
+            content_top,
+            width,
+            lcd.height - content_top,
+            {"lines": Row(*self.w_lines), "offline": Row(offline)},
+        )
+        return self.view
 
-    def _draw_text(self, writer, font_mod, text, x, y):
-        width = self._text_width(font_mod, text)
-        height = font_mod.height()
-        self.lcd.fill_rect(x, y, width + 4, height, BG_COLOR)
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        writer.printstring(text)
-
-    @staticmethod
-    def _text_width(font_mod, text):
-        total = 0
-        for ch in text:
-            try:
-                _, _, adv = font_mod.get_ch(ch)
-            except Exception:
-                adv = 0
-            total += adv
-        return total
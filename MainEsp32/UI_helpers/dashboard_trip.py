@@ -5,6 +5,7 @@ from time import ticks_diff, ticks_ms
 import fonts
 from .writer import Writer
 from .dashboard_base import DashboardBase
+from .widgets import Label, Row, Switcher
 
 FG_COLOR = 0xFFFF
 BG_COLOR = 0x0000
@@ -59,6 +60,7 @@ class DashboardTrip(DashboardBase):
         self._last_tick = None
         self._last_drawn = None
         self._tick_ms = int(_DEFAULT_TICK_MS)
+        self.widgets = self._build_widgets()
 
     def request_full_refresh(self):
         super().request_full_refresh()
@@ -87,10 +89,7 @@ class DashboardTrip(DashboardBase):
         distance_km = round(_safe_float(distance_km, 0.0), 3)
 
         trip_speed = _safe_float(getattr(state, "trip_speed_kmh", None), 0.0)
-        pr_raw = state.get_pr("vehicle_speed_PR", (None, ""))[0]
-        if pr_raw is None:
-            pr_raw = state.get_pr("vehicle_speed", (None, ""))[0]
-        pr_speed = _safe_float(pr_raw, 0.0)
+        pr_speed = state.pr_frame().speed_kmh or 0.0
 
         trip_speed_disp = round(min(max(trip_speed, 0.0), 199.9), 1)
         pr_speed_disp = round(min(max(pr_speed, 0.0), 199.9), 1)
@@ -110,18 +109,24 @@ class DashboardTrip(DashboardBase):
             self._last_tick = now
             return
 
-        if self._needs_full_refresh:
-            self.ensure_header(force=True)
-        else:
-            self.ensure_header()
+        full = self._needs_full_refresh
+        if full:
+            self.lcd.fill(BG_COLOR)
+        header = self.ensure_header(force=full)
 
         if available:
-            self._draw_trip(pulses, distance_km, trip_speed_disp, pr_speed_disp)
+            self.view.show("trip")
+            self.w_pulses.set(f"{pulses:07d}" if pulses < 1_000_000 else f"{pulses:d}")
+            self.w_km.set(f"{distance_km:07.3f}km")
+            self.w_trip_speed.set(f"{trip_speed_disp:05.1f}")
+            self.w_pr_speed.set(f"{pr_speed_disp:05.1f}")
         else:
             message = (error_msg.upper() if isinstance(error_msg, str) else "CNT ERR")[:10] if error_msg else "WAIT CNT"
-            self._draw_status(message)
+            self.view.show("status")
+            self.w_status.set(message)
 
-        self.lcd.show()
+        if self.render_widgets(full) or header:
+            self.lcd.show()
         self._last_tick = now
         self._last_drawn = data
         self._needs_full_refresh = False
@@ -141,109 +146,54 @@ class DashboardTrip(DashboardBase):
     def get_tick_interval(self):
         return int(self._tick_ms)
 
-    def _draw_trip(self, pulses, distance_km, trip_speed_kmh, pr_speed_kmh):
+    def _build_widgets(self):
         lcd = self.lcd
         width = lcd.width
         height = lcd.height
         margin = min(_TOP_MARGIN, max(0, height // 16))
-        base_y = self.header_height
-        if base_y < height:
-            lcd.fill_rect(0, base_y, width, height - base_y, BG_COLOR)
-        top = base_y + margin
-        usable_height = max(0, height - top)
-
-        pulses_text = f"{pulses:07d}" if pulses < 1_000_000 else f"{pulses:d}"
-        km_text = f"{distance_km:07.3f}km"
-
+        top = self.header_height + margin
         value_height = self.font_value.height()
         spacing = max(6, value_height // 4)
         line1_y = top + spacing
         line2_y = line1_y + value_height + spacing
 
-        self._draw_centered(pulses_text, line1_y)
-        self._draw_centered(km_text, line2_y)
-        self._draw_bottom_speeds(trip_speed_kmh, pr_speed_kmh)
-
-    def _draw_status(self, message):
-        lcd = self.lcd
-        lcd.fill_rect(0, self.header_height, lcd.width, lcd.height - self.header_height, BG_COLOR)
-
-        message_y = max(self.header_height + _TOP_MARGIN, (lcd.height - self.font_value.height()) // 2)
-        self._draw_centered(message, message_y)
-
-    def _draw_bottom_speeds(self, trip_speed_kmh, pr_speed_kmh):
-        lcd = self.lcd
-        font = self.font_bottom
-        writer = self.writer_bottom
-        label_font = self.font_small
-        label_writer = self.writer_small
+        self.w_pulses = Label(lcd, self.font_value, 0, line1_y, width, align="center", writer=self.writer_value)
+        self.w_km = Label(lcd, self.font_value, 0, line2_y, width, align="center", writer=self.writer_value)
 
         label_gap = 2
         padding = 4
-        label_height = label_font.height()
-        value_height = font.height()
-        area_height = label_height + value_height + (padding * 2) + label_gap
-        if area_height > lcd.height:
-            area_height = lcd.height
-        area_y = max(self.header_height, lcd.height - area_height)
-        lcd.fill_rect(0, area_y, lcd.width, area_height, BG_COLOR)
-
-        half_width = lcd.width // 2
-        right_width = lcd.width - half_width
-
+        label_height = self.font_small.height()
+        area_height = label_height + self.font_bottom.height() + (padding * 2) + label_gap
+        if area_height > height:
+            area_height = height
+        area_y = max(self.header_height, height - area_height)
+        half_width = width // 2
         label_y = area_y + padding
-        trip_label = "TRIP"
-        pr_label = "PR"
-        trip_label_width = self._text_width(label_font, trip_label)
-        pr_label_width = self._text_width(label_font, pr_label)
-        trip_label_x = max(0, (half_width - trip_label_width) // 2)
-        pr_label_x = half_width + max(0, (right_width - pr_label_width) // 2)
-
-        Writer.set_textpos(lcd.framebuf, label_y, trip_label_x)
-        label_writer.printstring(trip_label)
-        Writer.set_textpos(lcd.framebuf, label_y, pr_label_x)
-        label_writer.printstring(pr_label)
-
         value_y = label_y + label_height + label_gap
-        trip_text = f"{trip_speed_kmh:05.1f}"
-        pr_text = f"{pr_speed_kmh:05.1f}"
-        trip_width = self._text_width(font, trip_text)
-        pr_width = self._text_width(font, pr_text)
-        trip_x = max(0, (half_width - trip_width) // 2)
-        pr_x = half_width + max(0, (right_width - pr_width) // 2)
-
-        Writer.set_textpos(lcd.framebuf, value_y, trip_x)
-        writer.printstring(trip_text)
-        Writer.set_textpos(lcd.framebuf, value_y, pr_x)
-        writer.printstring(pr_text)
-
-    def _draw_centered(self, text, y):
-        font = self.font_value
-        writer = self.writer_value
-        width = self._text_width(font, text)
-        area_width = width + 6
-        x = max(0, (self.lcd.width - area_width) // 2)
-        self.lcd.fill_rect(x, y, area_width, font.height(), BG_COLOR)
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        writer.printstring(text)
-
-    def _draw_centered_small(self, text, y):
-        font = self.font_small
-        writer = self.writer_small
-        width = self._text_width(font, text)
-        area_width = width + 6
-        x = max(0, (self.lcd.width - area_width) // 2)
-        self.lcd.fill_rect(x, y, area_width, font.height(), BG_COLOR)
-        Writer.set_textpos(self.lcd.framebuf, y, x)
-        writer.printstring(text)
-
-    @staticmethod
-    def _text_width(font_mod, text):
-        width = 0
-        for ch in text:
-            try:
-                _, _, adv = font_mod.get_ch(ch)
-            except Exception:
-                adv = 0
-            width += adv
-        return width
\ No newline at end of file
+        self.w_trip_speed = Label(lcd, self.font_bottom, 0, value_y, half_width, align="center", writer=self.writer_bottom)
+        self.w_pr_speed = Label(
+            lcd, self.font_bottom, half_width, value_y, width - half_width, align="center", writer=self.writer_bottom
+        )
+        trip_view = Row(
+            self.w_pulses,
+            self.w_km,
+            Label(lcd, self.font_small, 0, label_y, half_width, align="center", writer=self.writer_small, text="TRIP"),
+            Label(
+                lcd, self.font_small, half_width, label_y, width - half_width, align="center", writer=self.writer_small, text="PR"
+            ),
+            self.w_trip_speed,
+            self.w_pr_speed,
+        )
+
+        message_y = max(self.header_height + _TOP_MARGIN, (height - value_height) // 2)
+        self.w_status = Label(lcd, self.font_value, 0, message_y, width, align="center", writer=self.writer_value)
+        content_y = self.header_height
+        self.view = Switcher(
+            lcd,
+            0,
+            content_y,
+            width,
+            height - content_y,
+            {"trip": trip_view, "status": Row(self.w_status)},
+        )
+        return self.view
@@ -0,0 +1,120 @@
+"""Pre-rendered RGB565 glyphs shared by every Writer on an RGB565 device.
+
+Entries are keyed by ``(font, char, fg, bg)`` and hold a ready-to-blit
+``FrameBuffer``, so a repeated digit costs one native blit instead of a glyph
+copy plus palette expansion. The cache keeps its pixel bytes under
+``budget`` and evicts the least recently used glyphs first.
+
+Install it once at boot with ``Writer.glyph_cache = GlyphCache(...)`` and
+warm the big seven-segment digits with :func:`warm_digits`.
+"""
+
+import framebuf
+
+import fonts
+
+DEFAULT_BUDGET = 128 * 1024
+DIGITS = "0123456789"
+# Large readout fonts whose digits are worth pre-rendering at boot.
+WARM_FONTS = ("sevenSegment_80", "sevenSegment_40", "sevenSegment_30")
+
+
+class GlyphCache:
+    """LRU cache of RGB565 glyph framebuffers under a byte budget."""
+
+    def __init__(self, budget=DEFAULT_BUDGET):
+        self.budget = int(budget)
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = {}  # key -> [fb, nbytes, last_use]
+        self._clock = 0
+        self._palette_buf = bytearray(4)
+        self._palette = framebuf.FrameBuffer(self._palette_buf, 2, 1, framebuf.RGB565)
+
+    def get(self, font, char, fg, bg):
+        """Return the RGB565 ``FrameBuffer`` for ``char``, rendering on a miss.
+
+        Returns ``None`` when the glyph does not fit the budget at all.
+        """
+        key = (font, char, fg, bg)
+        self._clock += 1
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[2] = self._clock
+            self.hits += 1
+            return entry[0]
+        self.misses += 1
+        glyph, height, width = font.get_ch(char)
+        nbytes = width * height * 2
+        if nbytes == 0 or nbytes > self.budget:
+            return None
+        while self.used + nbytes > self.budget:
+            self._evict()
+        fb = self._render(glyph, width, height, font, fg, bg)
+        self._entries[key] = [fb, nbytes, self._clock]
+        self.used += nbytes
+        return fb
+
+    def warm(self, font, chars, fg, bg):
+        for char in chars:
+            self.get(font, char, fg, bg)
+
+    def clear(self):
+        self._entries = {}
+        self.used = 0
+
+    def stats(self):
+        return {
+            "entries": len(self._entries),
+            "used": self.used,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def _evict(self):
+        oldest_key = None
+        oldest_use = 0
+        for key, entry in self._entries.items():
+            if oldest_key is None or entry[2] < oldest_use:
+                oldest_key = key
+                oldest_use = entry[2]
+        if oldest_key is None:
+            self.used = 0
+            return
+        self.used -= self._entries.pop(oldest_key)[1]
+        self.evictions += 1
+
+    def _render(self, glyph, width, height, font, fg, bg):
+        buf = bytearray(width * height * 2)
+        fb = framebuf.FrameBuffer(buf, width, height, framebuf.RGB565)
+        fmt = framebuf.MONO_HMSB if font.reverse() else framebuf.MONO_HLSB
+        src = framebuf.FrameBuffer(bytearray(glyph), width, height, fmt)
+        palette = self._palette
+        palette.pixel(0, 0, bg)
+        palette.pixel(1, 0, fg)
+        try:
+            fb.blit(src, 0, 0, -1, palette)
+        except TypeError:  # firmware < 1.17: blit() takes no palette
+            for y in range(height):
+                for x in range(width):
+                    fb.pixel(x, y, fg if src.pixel(x, y) else bg)
+        return fb
+
+
+def warm_digits(cache, fg=0xFFFF, bg=0x0000, font_names=WARM_FONTS, chars=DIGITS):
+    """Pre-render ``chars`` for the fonts in ``font_names`` that are loaded."""
+    warmed = 0
+    for name in font_names:
+        font = fonts.loaded(name)
+        if font is None:
+            continue
+        cache.warm(font, chars, fg, bg)
+        warmed += len(chars)
+    return warmed
+
+
+__all__ = ["GlyphCache", "warm_digits", "DEFAULT_BUDGET", "DIGITS", "WARM_FONTS"]
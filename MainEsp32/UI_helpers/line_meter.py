@@ -1,4 +1,12 @@
-"""Reusable horizontal progress line widget for the ST7789 dashboard."""
+"""Reusable horizontal progress line widget for the ST7789 dashboard.
+
+Every column's colour depends only on the meter configuration, so it is
+computed once into an RGB565 strip (shared by meters with the same config).
+Drawing blits the filled span out of that strip and, while the meter stays in
+place, only touches the columns between the previous and the new fill level.
+"""
+
+import framebuf
 
 _BG = 0x0000
 _TICK = 0x4208  # dark grey for guide ticks
@@ -26,6 +34,10 @@ def _blend_rgb565(color_a, color_b, ratio):
     return _combine_rgb565(r, g, b)
 
 
+# (mode, length, height, direction, colours) -> (colours, strip buffer)
+_STRIP_CACHE = {}
+
+
 class HorizontalSegmentMeter:
     """Draw a 2-pixel tall, multi-color progress line.
 
@@ -64,6 +76,68 @@ class HorizontalSegmentMeter:
         else:
             self.gradient = None
         self.direction = -1 if direction < 0 else 1
+        self._strip = None
+        self._last = None  # (x, y, kind, lo, hi) of what is on screen
+
+    def invalidate(self):
+        """Forget what is on screen (call after clearing the area)."""
+        self._last = None
+
+    def column_colors(self):
+        """Return the per-column colour table (built on first use)."""
+        return self._ensure_strip()[0]
+
+    def _config_key(self):
+        if self.gradient:
+            mode, payload = "gradient", self.gradient
+        elif self.color_stops:
+            mode, payload = "stops", self.color_stops
+        elif self.segments:
+            mode, payload = "segments", (self.segments, self.bg_color)
+        else:
+            mode, payload = "flat", self.tick_color
+        return (mode, self.length, self.height, self.direction, payload)
+
+    def _ensure_strip(self):
+        key = self._config_key()
+        strip = self._strip
+        if strip is not None and strip[2] == key:
+            return strip
+        cached = _STRIP_CACHE.get(key)
+        if cached is None:
+            colors = self._build_colors(key[0])
+            length = self.length
+            height = self.height
+            # One spare row so a FrameBuffer view can start at any column
+            # and still cover ``height`` rows of ``length`` stride.
+            buf = bytearray((length * height + length) * 2)
+            row = framebuf.FrameBuffer(buf, length, 1, framebuf.RGB565)
+            for pos in range(length):
+                row.pixel(pos, 0, colors[pos])
+            row_bytes = length * 2
+            for line in range(1, height):
+                buf[line * row_bytes : (line + 1) * row_bytes] = buf[:row_bytes]
+            cached = (colors, buf)
+            _STRIP_CACHE[key] = cached
+        strip = (cached[0], cached[1], key)
+        self._strip = strip
+        return strip
+
+    def _build_colors(self, mode):
+        length = self.length
+        if mode == "gradient":
+            return [self._gradient_color(pos) for pos in range(length)]
+        if mode == "stops":
+            return [self._stop_color(pos) for pos in range(length)]
+        if mode == "segments":
+            colors = [self.bg_color] * length
+            for start, end, color in self.segments:
+                seg_start = max(0, int(start * length))
+                seg_end = min(length, int(end * length))
+                for pos in range(seg_start, seg_end):
+                    colors[pos] = color & 0xFFFF
+            return colors
+        return [self.tick_color] * length
 
     def draw(self, x, y, value, *, min_value, max_value, neutral_range=None):
         """Render the meter at ``(x, y)``.
@@ -77,9 +151,9 @@ class HorizontalSegmentMeter:
         lcd = self.lcd
         length = self.length
         height = self.height
-        lcd.fill_rect(x, y, length, height, self.bg_color)
 
         if max_value <= min_value:
+            self._show_static(x, y, "blank")
             return
 
         try:
@@ -94,17 +168,19 @@ class HorizontalSegmentMeter:
         if neutral_range:
             low, high = neutral_range
             if numeric >= low and numeric <= high:
-                stub = max(3, min(length // 16, length))
-                if self.direction > 0:
-                    lcd.fill_rect(x, y, stub, height, self.neutral_color)
-                else:
-                    lcd.fill_rect(x + length - stub, y, stub, height, self.neutral_color)
+                if self._show_static(x, y, "neutral"):
+                    stub = max(3, min(length // 16, length))
+                    if self.direction > 0:
+                        lcd.fill_rect(x, y, stub, height, self.neutral_color)
+                    else:
+                        lcd.fill_rect(x + length - stub, y, stub, height, self.neutral_color)
                 return
 
         span = max_value - min_value
         ratio = (numeric - min_value) / span
         if ratio <= 0:
-            self._draw_ticks(x, y)
+            if self._show_static(x, y, "ticks"):
+                self._draw_ticks(x, y)
             return
 
         if ratio > 1:
@@ -112,115 +188,102 @@ class HorizontalSegmentMeter:
 
         filled = int(round(ratio * length))
         if filled <= 0:
-            self._draw_ticks(x, y)
+            if self._show_static(x, y, "ticks"):
+                self._draw_ticks(x, y)
             return
         if filled > length:
             filled = length
 
         start_index = 0 if self.direction > 0 else length - filled
+        self._draw_fill(x, y, start_index, start_index + filled)
 
-        if self.gradient:
-            self._draw_gradient(x, y, filled, start_index)
-            return
+    def _show_static(self, x, y, kind):
+        """Clear the strip for ``kind`` unless it is already shown; True = draw."""
+        last = self._last
+        if last is not None and last[0] == x and last[1] == y and last[2] == kind:
+            return False
+        self.lcd.fill_rect(x, y, self.length, self.height, self.bg_color)
+        self._last = (x, y, kind, 0, 0)
+        return True
 
-        if self.color_stops:
-            self._draw_color_stops(x, y, filled, start_index)
-            return
+    def _draw_fill(self, x, y, lo, hi):
+        """Show columns ``[lo, hi)`` filled, redrawing only what changed."""
+        last = self._last
+        if last is not None and last[0] == x and last[1] == y and last[2] == "fill":
+            plo = last[3]
+            phi = last[4]
+            # The filled span is anchored at one end, so only the moving edge
+            # differs: extend it from the strip or clear back to background.
+            if lo < plo:
+                self._blit_columns(x, y, lo, plo)
+            elif lo > plo:
+                self.lcd.fill_rect(x + plo, y, lo - plo, self.height, self.bg_color)
+            if hi > phi:
+                self._blit_columns(x, y, phi, hi)
+            elif hi < phi:
+                self.lcd.fill_rect(x + hi, y, phi - hi, self.height, self.bg_color)
+        else:
+            self.lcd.fill_rect(x, y, self.length, self.height, self.bg_color)
+            self._blit_columns(x, y, lo, hi)
+        self._last = (x, y, "fill", lo, hi)
 
-        if not self.segments:
-            self._draw_flat(x, y, filled, self.tick_color, start_index)
+    def _blit_columns(self, x, y, lo, hi):
+        if hi <= lo:
             return
-
-        self._draw_segments(x, y, filled, start_index)
+        buf = self._ensure_strip()[1]
+        view = framebuf.FrameBuffer(
+            memoryview(buf)[lo * 2 :], hi - lo, self.height, framebuf.RGB565, self.length
+        )
+        self.lcd.blit(view, x + lo, y, hi - lo, self.height)
 
     def _draw_ticks(self, x, y):
         step = 8
         for offset in range(0, self.length, step):
             self.lcd.fill_rect(x + offset, y, 2, self.height, self.tick_color)
 
-    def _draw_gradient(self, x, y, filled, start_index):
-        if not self.gradient:
-            return
-        start, end = self.gradient
-        r0, g0, b0 = _split_rgb565(start)
-        r1, g1, b1 = _split_rgb565(end)
+    def _ratio_at(self, pos):
         denom = self.length - 1
         if denom <= 0:
             denom = 1
-        lcd = self.lcd
-        for i in range(filled):
-            pos = start_index + i
-            base = pos / denom
-            if self.direction > 0:
-                ratio = base
-            else:
-                ratio = 1.0 - base
-            r = int(r0 + (r1 - r0) * ratio + 0.5)
-            g = int(g0 + (g1 - g0) * ratio + 0.5)
-            b = int(b0 + (b1 - b0) * ratio + 0.5)
-            color = _combine_rgb565(r, g, b)
-            lcd.fill_rect(x + pos, y, 1, self.height, color)
-
-    def _draw_flat(self, x, y, filled, color, start_index):
-        if filled <= 0:
-            return
-        self.lcd.fill_rect(x + start_index, y, filled, self.height, color & 0xFFFF)
+        base = pos / denom
+        return base if self.direction > 0 else 1.0 - base
 
-    def _draw_color_stops(self, x, y, filled, start_index):
+    def _gradient_color(self, pos):
+        start, end = self.gradient
+        r0, g0, b0 = _split_rgb565(start)
+        r1, g1, b1 = _split_rgb565(end)
+        ratio = self._ratio_at(pos)
+        r = int(r0 + (r1 - r0) * ratio + 0.5)
+        g = int(g0 + (g1 - g0) * ratio + 0.5)
+        b = int(b0 + (b1 - b0) * ratio + 0.5)
+        return _combine_rgb565(r, g, b)
+
+    def _stop_color(self, pos):
         stops = self.color_stops
-        if filled <= 0 or len(stops) < 2:
-            return
-        denom = self.length - 1
-        if denom <= 0:
-            denom = 1
-        lcd = self.lcd
+        if len(stops) < 2:
+            return self.bg_color
         last_index = len(stops) - 1
-        for px in range(filled):
-            pos = start_index + px
-            base = pos / denom
-            if self.direction > 0:
-                ratio = base
-            else:
-                ratio = 1.0 - base
-            if ratio <= stops[0][0]:
-                color = stops[0][1]
-            elif ratio >= stops[last_index][0]:
-                color = stops[last_index][1]
-            else:
-                color = stops[last_index][1]
-                for idx in range(last_index):
-                    start_pos, start_color = stops[idx]
-                    end_pos, end_color = stops[idx + 1]
-                    if ratio <= end_pos:
-                        span = end_pos - start_pos
-                        if span <= 0:
-                            color = end_color
-                        else:
-                            local = (ratio - start_pos) / span
-                            if local < 0:
-                                local = 0
-                            elif local > 1:
-                                local = 1
-                            color = _blend_rgb565(start_color, end_color, local)
-                        break
-            lcd.fill_rect(x + pos, y, 1, self.height, color & 0xFFFF)
-
-    def _draw_segments(self, x, y, filled, start_index):
-        if filled <= 0 or not self.segments:
-            return
-        lcd = self.lcd
-        segment_start = start_index
-        segment_end = start_index + filled
-        length = self.length
-        for start, end, color in self.segments:
-            seg_start = int(start * length)
-            seg_end = int(end * length)
-            if seg_end <= seg_start:
-                continue
-            if seg_start >= segment_end or seg_end <= segment_start:
-                continue
-            draw_start = max(seg_start, segment_start)
-            draw_end = min(seg_end, segment_end)
-            if draw_end <= draw_start:
-                continue
-            lcd.fill_rect(x + draw_start, y, draw_end - draw_start, self.height, color & 0xFFFF)
+        ratio = self._ratio_at(pos)
+        if ratio <= stops[0][0]:
+            color = stops[0][1]
+        elif ratio >= stops[last_index][0]:
+            color = stops[last_index][1]
+        else:
+            color = stops[last_index][1]
+            for idx in range(last_index):
+                start_pos, start_color = stops[idx]
+                end_pos, end_color = stops[idx + 1]
+                if ratio <= end_pos:
+                    span = end_pos - start_pos
+                    if span <= 0:
+                        color = end_color
+                    else:
+                        local = (ratio - start_pos) / span
+                        if local < 0:
+                            local = 0
+                        elif local > 1:
+                            local = 1
+                        color = _blend_rgb565(start_color, end_color, local)
+                    break
+        return color & 0xFFFF
+
@@ -0,0 +1,322 @@
+"""Retained-mode widgets for the dashboards.
+
+A widget owns a rectangle of the LCD and remembers the value it last drew.
+Dashboards build their widget tree once, feed fresh values with ``set()``
+every frame and call ``render()`` on the root. Only widgets whose value
+changed draw, and the LCD's dirty-rect tracking turns that into a flush of
+just those rectangles. A full refresh is ``lcd.fill(bg)`` followed by
+``invalidate()`` on the root.
+
+Widgets in one tree must not overlap. Views that share screen space (for
+example a status message in place of the readings) go in a :class:`Switcher`,
+which clears its area when the visible view changes.
+
+``render(deadline)`` stops a :class:`Row` once ``ticks_ms()`` passes
+``deadline`` (after at least one widget drew). Widgets it did not reach stay
+invalid, so the next ``render()`` picks up where this one stopped; the UI
+scheduler uses that to spread a full refresh over several frame slots.
+"""
+
+from time import ticks_diff, ticks_ms
+
+from .writer import Writer
+
+FG = 0xFFFF
+BG = 0x0000
+
+_writers = {}  # (lcd, font, fg, bg) -> Writer shared by every widget
+
+
+def text_width(font, text):
+    width = 0
+    for ch in text:
+        try:
+            width += font.get_ch(ch)[2]
+        except Exception:
+            pass
+    return width
+
+
+def digit_pitch(font, chars="0123456789-"):
+    """Widest advance among ``chars``: the cell width of tabular numerals."""
+    pitch = 0
+    for ch in chars:
+        try:
+            advance = font.get_ch(ch)[2]
+        except Exception:
+            continue
+        if advance > pitch:
+            pitch = advance
+    return pitch
+
+
+def fit_text(font, text, max_width):
+    while text and text_width(font, text) > max_width:
+        text = text[:-1]
+    return text
+
+
+def writer_for(lcd, font, fg=FG, bg=BG):
+    """Return a clipped, non-wrapping Writer for ``font`` in ``fg``/``bg``."""
+    key = (id(lcd), id(font), fg, bg)
+    writer = _writers.get(key)
+    if writer is None:
+        writer = Writer(lcd.framebuf, font, verbose=False)
+        writer.setcolor(fg, bg)
+        writer.set_clip(col_clip=True, wrap=False)
+        _writers[key] = writer
+    return writer
+
+
+class Widget:
+    """Base class: a rectangle that redraws when its value changes."""
+
+    def __init__(self, lcd, x, y, w, h, bg=BG):
+        self.lcd = lcd
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.bg = bg
+        self.value = None
+        self._drawn = None
+        self._valid = False
+
+    def set(self, value):
+        self.value = value
+
+    def invalidate(self):
+        """Forget what is on screen; the next render draws from scratch."""
+        self._valid = False
+
+    def render(self, deadline=None):
+        """Draw if the value changed; return the number of widgets drawn."""
+        value = self.value
+        if self._valid and self._drawn == value:
+            return 0
+        self._draw(value, self._drawn if self._valid else None)
+        self._drawn = value
+        self._valid = True
+        return 1
+
+    def clear(self):
+        self.lcd.fill_rect(self.x, self.y, self.w, self.h, self.bg)
+
+    def _draw(self, value, previous):
+        """Paint ``value``; ``previous`` is what is on screen (None: unknown)."""
+        raise NotImplementedError
+
+
+class Label(Widget):
+    """One line of text aligned in a fixed box (``align``: left/center/right).
+
+    Text wider than the box is cut. On change only the part of the old text
+    the new one does not cover is cleared, since glyphs paint their own
+    background.
+    """
+
+    def __init__(self, lcd, font, x, y, w, *, align="left", fg=FG, bg=BG, writer=None, text=None):
+        super().__init__(lcd, x, y, w, font.height(), bg)
+        self.font = font
+        self.align = align
+        self.writer = writer if writer is not None else writer_for(lcd, font, fg, bg)
+        self._box = None  # (x, width) of the text on screen
+        self.value = text
+
+    def set(self, text, invert=False):
+        self.value = (text, True) if invert else text
+
+    def _draw(self, value, previous):
+        if isinstance(value, tuple):
+            text, invert = value
+        else:
+            text, invert = value, False
+        text = fit_text(self.font, "" if text is None else str(text), self.w)
+        width = text_width(self.font, text)
+        if self.align == "center":
+            x = self.x + (self.w - width) // 2
+        elif self.align == "right":
+            x = self.x + self.w - width
+        else:
+            x = self.x
+        lcd = self.lcd
+        box = self._box if previous is not None else None
+        if box is None:
+            self.clear()
+        else:
+            old_x, old_w = box
+            if old_x < x:
+                lcd.fill_rect(old_x, self.y, min(old_w, x - old_x), self.h, self.bg)
+            old_end = old_x + old_w
+            if old_end > x + width:
+                start = max(old_x, x + width)
+                lcd.fill_rect(start, self.y, old_end - start, self.h, self.bg)
+        if text:
+            Writer.set_textpos(lcd.framebuf, self.y, x)
+            self.writer.printstring(text, invert=invert)
+        self._box = (x, width)
+
+
+class BigNumber(Widget):
+    """Right-aligned numerals on a fixed grid of ``cells`` digit cells.
+
+    Only cells whose character changed are redrawn, so a ticking value
+    touches one or two cells instead of the whole number.
+    """
+
+    def __init__(self, lcd, font, x, y, cells, *, fg=FG, bg=BG, writer=None, pitch=None):
+        self.pitch = pitch if pitch is not None else digit_pitch(font)
+        super().__init__(lcd, x, y, cells * self.pitch, font.height(), bg)
+        self.font = font
+        self.cells = cells
+        self.writer = writer if writer is not None else writer_for(lcd, font, fg, bg)
+        self._text = None
+
+    def _draw(self, value, previous):
+        text = "" if value is None else str(value)
+        cells = self.cells
+        if len(text) > cells:
+            text = text[:cells]
+        text = " " * (cells - len(text)) + text
+        old = self._text if previous is not None else None
+        lcd = self.lcd
+        font = self.font
+        pitch = self.pitch
+        x = self.x
+        for idx in range(cells):
+            ch = text[idx]
+            if old is None or old[idx] != ch:
+                lcd.fill_rect(x, self.y, pitch, self.h, self.bg)
+                if ch != " ":
+                    try:
+                        advance = min(font.get_ch(ch)[2], pitch)
+                    except Exception:
+                        advance = pitch
+                    Writer.set_textpos(lcd.framebuf, self.y, x + pitch - advance)
+                    self.writer.printstring(ch)
+            x += pitch
+        self._text = text
+
+
+class Meter(Widget):
+    """A :class:`HorizontalSegmentMeter` bound to a position and value range."""
+
+    def __init__(self, lcd, meter, x, y, *, min_value, max_value, neutral_range=None):
+        super().__init__(lcd, x, y, meter.length, meter.height, meter.bg_color)
+        self.meter = meter
+        self.min_value = min_value
+        self.max_value = max_value
+        self.neutral_range = neutral_range
+
+    def invalidate(self):
+        super().invalidate()
+        self.meter.invalidate()
+
+    def _draw(self, value, previous):
+        self.meter.draw(
+            self.x,
+            self.y,
+            value,
+            min_value=self.min_value,
+            max_value=self.max_value,
+            neutral_range=self.neutral_range,
+        )
+
+
+class Icon(Widget):
+    """A static RGB565 bitmap, drawn once per full refresh."""
+
+    def __init__(self, lcd, x, y, w, h, data, bg=BG):
+        super().__init__(lcd, x, y, w, h, bg)
+        self.value = data
+
+    def _draw(self, value, previous):
+        if value is None:
+            self.clear()
+            return
+        self.lcd.blit_buffer(value, self.x, self.y, self.w, self.h)
+
+
+class Row:
+    """A group of widgets rendered, invalidated and (optionally) set together."""
+
+    def __init__(self, *children):
+        self.children = [child for child in children if child is not None]
+
+    def add(self, child):
+        self.children.append(child)
+        return child
+
+    def set(self, *values):
+        """Set the children's values in order; ``None`` leaves one unchanged."""
+        for child, value in zip(self.children, values):
+            if value is not None:
+                child.set(value)
+
+    def invalidate(self):
+        for child in self.children:
+            child.invalidate()
+
+    def render(self, deadline=None):
+        drawn = 0
+        for child in self.children:
+            if drawn and deadline is not None and ticks_diff(ticks_ms(), deadline) >= 0:
+                break
+            drawn += child.render(deadline)
+        return drawn
+
+
+class Switcher:
+    """Shows one of several named views sharing the rectangle it owns."""
+
+    def __init__(self, lcd, x, y, w, h, views, *, bg=BG, active=None):
+        self.lcd = lcd
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.bg = bg
+        self.views = views
+        self.active = active
+        self._shown = None
+
+    def show(self, name):
+        self.active = name
+
+    def view(self, name=None):
+        return self.views.get(self.active if name is None else name)
+
+    def invalidate(self):
+        self._shown = None
+        for view in self.views.values():
+            view.invalidate()
+
+    def render(self, deadline=None):
+        name = self.active
+        view = self.views.get(name)
+        drawn = 0
+        if name != self._shown:
+            if self._shown is not None:
+                self.lcd.fill_rect(self.x, self.y, self.w, self.h, self.bg)
+                drawn = 1
+            if view is not None:
+                view.invalidate()
+            self._shown = name
+        if view is not None:
+            drawn += view.render(deadline)
+        return drawn
+
+
+__all__ = [
+    "Widget",
+    "Label",
+    "BigNumber",
+    "Meter",
+    "Icon",
+    "Row",
+    "Switcher",
+    "text_width",
+    "digit_pitch",
+    "fit_text",
+    "writer_for",
+]
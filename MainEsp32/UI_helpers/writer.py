@@ -44,6 +44,7 @@ def _get_id(device):
 class Writer:
 
     state = {}  # Holds a display state for each device
+    glyph_cache = None  # Shared glyph_cache.GlyphCache, installed at boot
 
     @staticmethod
     def set_textpos(device, row=None, col=None):
@@ -84,6 +85,10 @@ class Writer:
             )
         self.screenwidth = device.width  # In pixels
         self.screenheight = device.height
+        # Dirty-tracking framebuffers (drivers/lcd1p69) need the glyph size.
+        self._blit_sized = getattr(device, "blit_sized", None)
+        # Pre-rendered RGB565 glyphs only suit RGB565 devices.
+        self._rgb565 = getattr(device, "format", None) == framebuf.RGB565
         self._palette_fb = None
         self._palette_buf = None
         self._palette_dirty = False
@@ -119,9 +124,17 @@ class Writer:
         self._bgcolor = int(value) & 0xFFFF
         self._palette_dirty = True
 
+    # Two-entry RGB565 palette (0 -> bgcolor, 1 -> fgcolor) so a glyph is
+    # blitted straight to its final colours in one call. Monochrome devices
+    # only see the low bit, so 0/1 colours behave as before.
     def _update_palette(self):
         self._palette_dirty = False
-        self._palette_fb = None
+        if self._palette_fb is None:
+            self._palette_buf = bytearray(4)
+            self._palette_fb = framebuf.FrameBuffer(self._palette_buf, 2, 1, framebuf.RGB565)
+        self._palette_fb.pixel(0, 0, self._bgcolor)
+        self._palette_fb.pixel(1, 0, self._fgcolor)
+        self._use_palette = True
 
     def _getstate(self):
         return Writer.state[self.devid]
@@ -261,22 +274,50 @@ class Writer:
         self._get_char(char, recurse)
         if self.glyph is None:
             return  # All done
+        if self._blit_cached(s, char, invert):
+            return
         buf = bytearray(self.glyph)
         if invert:
             for i, v in enumerate(buf):
                 buf[i] = 0xFF & ~v
         if self._palette_dirty:
             self._update_palette()
-        palette = getattr(self, "_palette_fb", None)
+        palette = self._palette_fb
         if self._use_palette and palette is not None:
-            row_bytes = (self.char_width + 7) // 8
-            fbc = framebuf.FrameBuffer(buf, self.char_width, self.char_height, self.map, row_bytes)
-            self.device.blit(fbc, s.text_col, s.text_row, -1, palette)
+            fbc = framebuf.FrameBuffer(buf, self.char_width, self.char_height, self.map)
+            try:
+                if self._blit_sized is not None:
+                    self._blit_sized(fbc, s.text_col, s.text_row, self.char_width, self.char_height, -1, palette)
+                else:
+                    self.device.blit(fbc, s.text_col, s.text_row, -1, palette)
+            except TypeError:  # firmware < 1.17: blit() takes no palette
+                self._use_palette = False
+                self._blit_manual(buf, s.text_col, s.text_row)
         else:
             self._blit_manual(buf, s.text_col, s.text_row)
         s.text_col += self.char_width
         self.cpos += 1
 
+    # Blit a cached RGB565 rendering of the glyph; False if there is none.
+    def _blit_cached(self, s, char, invert):
+        cache = Writer.glyph_cache
+        if cache is None or not self._rgb565:
+            return False
+        fg = self._fgcolor
+        bg = self._bgcolor
+        if invert:
+            fg, bg = bg, fg
+        fbc = cache.get(self.font, char, fg, bg)
+        if fbc is None:
+            return False
+        if self._blit_sized is not None:
+            self._blit_sized(fbc, s.text_col, s.text_row, self.char_width, self.char_height)
+        else:
+            self.device.blit(fbc, s.text_col, s.text_row)
+        s.text_col += self.char_width
+        self.cpos += 1
+        return True
+
     def _blit_manual(self, buf, x, y):
         width = self.char_width
         height = self.char_height
@@ -338,13 +379,17 @@ class CWriter(Writer):
         self._get_char(char, recurse)
         if self.glyph is None:
             return  # All done
+        if self._blit_cached(s, char, invert):
+            return
         buf = bytearray_at(addressof(self.glyph), len(self.glyph))
-        row_bytes = (self.char_width + 7) // 8
-        fbc = framebuf.FrameBuffer(buf, self.char_width, self.char_height, self.map, row_bytes)
+        fbc = framebuf.FrameBuffer(buf, self.char_width, self.char_height, self.map)
         palette = self.device.palette
         palette.bg(self.fgcolor if invert else self.bgcolor)
         palette.fg(self.bgcolor if invert else self.fgcolor)
-        self.device.blit(fbc, s.text_col, s.text_row, -1, palette)
+        if self._blit_sized is not None:
+            self._blit_sized(fbc, s.text_col, s.text_row, self.char_width, self.char_height, -1, palette)
+        else:
+            self.device.blit(fbc, s.text_col, s.text_row, -1, palette)
         s.text_col += self.char_width
         self.cpos += 1
 
@@ -6,6 +6,7 @@ from time import ticks_ms, ticks_diff
 import bats
 from HW import ADC_THROTTLE_PIN, ADC_BRAKE_PIN, make_adc
 from motor_control import DEFAULTS as MOTOR_DEFAULTS, compute_output_voltages
+from pr_store import PRStore
 
 THROTTLE_MODES_DEFAULT = ["direct", "power", "speed", "torque", "mix"]
 _CELL_FULL_DEFAULT = 4.15
@@ -19,7 +20,7 @@ class AppState:
     def __init__(self):
         self.screen = 0
         self._lock = _thread.allocate_lock()
-        self.pr = {}  # name -> (value, unit)
+        self.pr = PRStore()  # slot-indexed PR values; see pr_store.PR_* constants
         self.boot_ms = ticks_ms()
         self._last_int_ms = self.boot_ms
         self.km_total = 0.0
@@ -148,18 +149,25 @@ class AppState:
         self.battery_power_w = 0.0
 
     def set_pr(self, name, value, unit):
-        with self._lock:
-            self.pr[name] = (value, unit)
-            if name == "vehicle_speed_PR":
-                self.pr["vehicle_speed"] = (value, unit)
+        self.pr.set(name, value, unit)
+
+    def attach_pr_ring(self, ring):
+        """Serve bridge fields from ``ring`` (lock-free); its fields are ``PR_FIELDS``."""
+        self.pr.attach_ring(ring)
+
+    def pr_value(self, slot, default=None):
+        """Fast read of a ``pr_store.PR_*`` slot: the value or ``default``."""
+        return self.pr.value(slot, default)
+
+    def pr_frame(self):
+        """Shared ``TelemetryFrame`` of the latest PR sample (do not mutate)."""
+        return self.pr.frame()
 
     def get_pr(self, name, default=(None, "")):
-        with self._lock:
-            return self.pr.get(name, default)
+        return self.pr.get(name, default)
 
     def snapshot_pr(self):
-        with self._lock:
-            return dict(self.pr)
+        return self.pr.snapshot()
 
     def init_local_adcs(self, *, force=False):
         if not force and self.motor_control is not None and self.adc_throttle is not None and self.adc_brake is not None:
@@ -373,58 +381,34 @@ class AppState:
         if dt_ms <= 0:
             return
         self._last_int_ms = now
-        v = self.vehicle_speed()
-        try:
-            v_float = float(v)
-        except Exception:
-            v_float = 0.0
-        self.km_total += v_float * (dt_ms / 3600000.0)
-        p = self.get_pr("motor_input_power", (None, ""))[0]
-        if p is None:
-            bv = self.get_pr("battery_voltage", (None, ""))[0]
-            bc = self.get_pr("battery_current", (None, ""))[0]
-            if bv is None or bc is None:
-                bv = self.get_pr("batt_voltage_calc", (None, ""))[0]
-            if bv is not None and bc is not None:
-                try:
-                    p = float(bv) * float(bc)
-                except Exception:
-                    p = 0.0
-            else:
-                p = 0.0
-        try:
-            p_float = float(p)
-        except Exception:
-            p_float = 0.0
-        self.wh_total += p_float * (dt_ms / 3600000.0)
+        frame = self.pr.frame()
+        self.km_total += self.vehicle_speed(frame) * (dt_ms / 3600000.0)
+        p = frame.power_w
+        if p is not None:
+            self.wh_total += p * (dt_ms / 3600000.0)
 
     def battery_voltage(self):
         if self.battery_voltage_v:
             return float(self.battery_voltage_v)
-        bv = self.get_pr("battery_voltage", (None, ""))[0]
-        if bv is None:
-            bv = self.get_pr("batt_voltage_calc", (None, ""))[0]
-        try:
-            value = float(bv)
-        except Exception:
+        value = self.pr.frame().battery_voltage_v
+        if value is None:
             value = 0.0
         self.battery_voltage_v = value
         return value
 
-    def vehicle_speed(self):
-        candidates = (
-            self.get_pr("vehicle_speed_PR", (None, ""))[0],
-            self.get_pr("vehicle_speed", (None, ""))[0],
-            getattr(self, "trip_speed_kmh", None),
-        )
-        for value in candidates:
-            if value is None:
-                continue
-            try:
-                return float(value)
-            except Exception:
-                continue
-        return 0.0
+    def vehicle_speed(self, frame=None):
+        if frame is None:
+            frame = self.pr.frame()
+        value = frame.speed_kmh
+        if value is not None:
+            return value
+        value = getattr(self, "trip_speed_kmh", None)
+        if value is None:
+            return 0.0
+        try:
+            return float(value)
+        except Exception:
+            return 0.0
 
     def battery_percent(self, voltage=None):
         if voltage is None:
@@ -0,0 +1,122 @@
+"""Table-driven checksums for the Modbus and MSP links.
+
+Every algorithm has a one-shot helper and an ``*_update(crc, buf, start, end)``
+form that continues a running value over ``buf[start:end]`` so parsers can
+checksum a frame in place without slicing. On MicroPython builds with viper the
+inner loops are compiled natively; elsewhere the pure-Python table loops run.
+"""
+
+try:
+    from array import array
+except ImportError:  # pragma: no cover
+    from uarray import array  # type: ignore
+
+CRC16_MODBUS_INIT = 0xFFFF
+
+
+def _make_crc16_table(poly=0xA001):
+    table = array("H", [0] * 256)
+    for idx in range(256):
+        crc = idx
+        for _ in range(8):
+            if crc & 1:
+                crc = (crc >> 1) ^ poly
+            else:
+                crc >>= 1
+        table[idx] = crc
+    return table
+
+
+CRC16_TABLE = _make_crc16_table()
+
+
+def _span(buf, start, end):
+    if start == 0 and end == len(buf):
+        return buf
+    if isinstance(buf, (bytes, bytearray)):
+        return memoryview(buf)[start:end]
+    return buf[start:end]
+
+
+def _crc16_update_py(crc, buf, start, end):
+    table = CRC16_TABLE
+    for byte in _span(buf, start, end):
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+    return crc
+
+
+def _xor8_update_py(value, buf, start, end):
+    for byte in _span(buf, start, end):
+        value ^= byte
+    return value
+
+
+_crc16_update = _crc16_update_py
+_xor8_update = _xor8_update_py
+VIPER = False
+
+try:
+    import micropython  # type: ignore
+
+    @micropython.viper
+    def _crc16_update_viper(crc: int, buf, start: int, end: int) -> int:
+        table = ptr16(CRC16_TABLE)  # type: ignore  # noqa: F821
+        data = ptr8(buf)  # type: ignore  # noqa: F821
+        idx = start
+        while idx < end:
+            crc = (crc >> 8) ^ table[(crc ^ data[idx]) & 0xFF]
+            idx += 1
+        return crc
+
+    @micropython.viper
+    def _xor8_update_viper(value: int, buf, start: int, end: int) -> int:
+        data = ptr8(buf)  # type: ignore  # noqa: F821
+        idx = start
+        while idx < end:
+            value ^= data[idx]
+            idx += 1
+        return value & 0xFF
+
+    _crc16_update = _crc16_update_viper
+    _xor8_update = _xor8_update_viper
+    VIPER = True
+except Exception:  # CPython, or firmware without the native emitter
+    pass
+
+
+def _is_buffer(buf):
+    # ptr8() needs an object exposing the buffer protocol, not a list/iterable.
+    return isinstance(buf, (bytes, bytearray, memoryview))
+
+
+def crc16_update(crc, buf, start=0, end=None):
+    """Continue a CRC-16/MODBUS over ``buf[start:end]``."""
+    if end is None:
+        end = len(buf)
+    if _is_buffer(buf):
+        return _crc16_update(crc, buf, start, end)
+    return _crc16_update_py(crc, buf, start, end)
+
+
+def crc16_modbus(buf, start=0, end=None):
+    """Return the CRC-16/MODBUS of ``buf[start:end]`` as an int (low byte first on the wire)."""
+    return crc16_update(CRC16_MODBUS_INIT, buf, start, end)
+
+
+def xor8_update(value, buf, start=0, end=None):
+    """Continue the MSP XOR checksum over ``buf[start:end]``."""
+    if end is None:
+        end = len(buf)
+    if _is_buffer(buf):
+        return _xor8_update(value, buf, start, end) & 0xFF
+    return _xor8_update_py(value, buf, start, end) & 0xFF
+
+
+__all__ = [
+    "CRC16_MODBUS_INIT",
+    "CRC16_TABLE",
+    "VIPER",
+    "crc16_update",
+    "crc16_modbus",
+    "xor8_update",
+]
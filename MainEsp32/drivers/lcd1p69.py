@@ -1,21 +1,206 @@
 """MicroPython driver for the 1.69 inch 240x280 ST7789 LCD.
 
 Tested with MicroPython v1.27 on ESP32-WROVER.
+
+Drawing through the framebuffer records dirty rectangles, so ``show()`` only
+sends the windows that changed. Writers and widgets that draw on
+``lcd.framebuf`` directly are tracked as well; ``show(full=True)`` (or an
+explicit window) still pushes the requested area unconditionally.
+
+``await lcd.show_async()`` sends the same windows but yields to the event loop
+between 4 KB chunks, keeping CS low and DC high for the whole burst. While
+``defer_show`` is set (the UI task sets it around ``draw()``) or an async
+flush is running, ``show()`` only leaves the areas pending for the next flush.
 """
 
 import time
 from machine import Pin, SPI
 import framebuf
 
+try:
+    import uasyncio as asyncio  # type: ignore
+except ImportError:  # pragma: no cover
+    import asyncio  # type: ignore
+
+_CHUNK_SIZE = 4096
+_DIRTY_MAX = 6  # rects kept before the cheapest pair is merged
+# A window costs three commands plus two 4-byte arguments on top of its pixels;
+# merging two rects is accepted while it adds at most this many pixels.
+_MERGE_SLACK_PX = 192
+_FULL_RATIO_PCT = 70  # dirty area above this share of the screen -> full flush
+
 
 class _FrameBuffer(framebuf.FrameBuffer):
+    """RGB565 framebuffer that records the bounding boxes of what is drawn.
+
+    Rects are kept as ``[x0, y0, x1, y1]`` (end exclusive), clipped to the
+    screen. A new rect is folded into an existing one when the union wastes
+    less than ``_MERGE_SLACK_PX`` pixels; past ``_DIRTY_MAX`` rects the pair
+    with the cheapest union is merged.
+    """
+
     def __init__(self, buffer, width, height):
         super().__init__(buffer, width, height, framebuf.RGB565)
         self.width = width
         self.height = height
+        self.format = framebuf.RGB565
+        self.dirty = []
+        self.dirty_full = False
+        self._area = width * height
+        self._last = None
 
+    # -- dirty tracking -------------------------------------------------------
 
-_CHUNK_SIZE = 4096
+    def mark_dirty(self, x, y, w, h):
+        """Record that ``(x, y, w, h)`` changed; clipped to the screen."""
+        if self.dirty_full:
+            return
+        x1 = x + w
+        y1 = y + h
+        if x < 0:
+            x = 0
+        if y < 0:
+            y = 0
+        if x1 > self.width:
+            x1 = self.width
+        if y1 > self.height:
+            y1 = self.height
+        if x >= x1 or y >= y1:
+            return
+        last = self._last
+        if last is not None and last[0] <= x and last[1] <= y and x1 <= last[2] and y1 <= last[3]:
+            return
+        rects = self.dirty
+        area = (x1 - x) * (y1 - y)
+        for rect in rects:
+            ux0 = rect[0] if rect[0] < x else x
+            uy0 = rect[1] if rect[1] < y else y
+            ux1 = rect[2] if rect[2] > x1 else x1
+            uy1 = rect[3] if rect[3] > y1 else y1
+            waste = (ux1 - ux0) * (uy1 - uy0) - (rect[2] - rect[0]) * (rect[3] - rect[1]) - area
+            if waste <= _MERGE_SLACK_PX:
+                rect[0] = ux0
+                rect[1] = uy0
+                rect[2] = ux1
+                rect[3] = uy1
+                self._last = rect
+                self._check_full()
+                return
+        rect = [x, y, x1, y1]
+        rects.append(rect)
+        self._last = rect
+        if len(rects) > _DIRTY_MAX:
+            self._merge_cheapest()
+        self._check_full()
+
+    def mark_all(self):
+        self.dirty_full = True
+        self.dirty = []
+        self._last = None
+
+    def take_dirty(self):
+        """Return ``(full, rects)`` and reset the tracker."""
+        full = self.dirty_full
+        rects = self.dirty
+        self.dirty_full = False
+        self.dirty = []
+        self._last = None
+        return full, rects
+
+    def _merge_cheapest(self):
+        rects = self.dirty
+        best = None
+        best_waste = 0
+        count = len(rects)
+        for i in range(count):
+            a = rects[i]
+            area_a = (a[2] - a[0]) * (a[3] - a[1])
+            for j in range(i + 1, count):
+                b = rects[j]
+                waste = (
+                    (max(a[2], b[2]) - min(a[0], b[0])) * (max(a[3], b[3]) - min(a[1], b[1]))
+                    - area_a
+                    - (b[2] - b[0]) * (b[3] - b[1])
+                )
+                if best is None or waste < best_waste:
+                    best = (i, j)
+                    best_waste = waste
+        a = rects[best[0]]
+        b = rects.pop(best[1])
+        a[0] = min(a[0], b[0])
+        a[1] = min(a[1], b[1])
+        a[2] = max(a[2], b[2])
+        a[3] = max(a[3], b[3])
+        self._last = a
+
+    def _check_full(self):
+        total = 0
+        for rect in self.dirty:
+            total += (rect[2] - rect[0]) * (rect[3] - rect[1])
+        if total * 100 >= self._area * _FULL_RATIO_PCT:
+            self.mark_all()
+
+    # -- tracked drawing primitives ------------------------------------------
+
+    def fill(self, c):
+        super().fill(c)
+        self.mark_all()
+
+    def pixel(self, x, y, c=None):
+        if c is None:
+            return super().pixel(x, y)
+        super().pixel(x, y, c)
+        self.mark_dirty(x, y, 1, 1)
+
+    def hline(self, x, y, w, c):
+        super().hline(x, y, w, c)
+        self.mark_dirty(x, y, w, 1)
+
+    def vline(self, x, y, h, c):
+        super().vline(x, y, h, c)
+        self.mark_dirty(x, y, 1, h)
+
+    def line(self, x1, y1, x2, y2, c):
+        super().line(x1, y1, x2, y2, c)
+        self.mark_dirty(min(x1, x2), min(y1, y2), abs(x2 - x1) + 1, abs(y2 - y1) + 1)
+
+    def rect(self, x, y, w, h, c, f=False):
+        super().rect(x, y, w, h, c, f)
+        self.mark_dirty(x, y, w, h)
+
+    def fill_rect(self, x, y, w, h, c):
+        super().fill_rect(x, y, w, h, c)
+        self.mark_dirty(x, y, w, h)
+
+    def ellipse(self, x, y, xr, yr, c, f=False, m=0xF):
+        super().ellipse(x, y, xr, yr, c, f, m)
+        self.mark_dirty(x - xr, y - yr, 2 * xr + 1, 2 * yr + 1)
+
+    def poly(self, x, y, coords, c, f=False):
+        super().poly(x, y, coords, c, f)
+        self.mark_all()
+
+    def text(self, s, x, y, c=1):
+        super().text(s, x, y, c)
+        self.mark_dirty(x, y, 8 * len(s), 8)
+
+    def scroll(self, xstep, ystep):
+        super().scroll(xstep, ystep)
+        self.mark_all()
+
+    def blit(self, source, x, y, key=-1, palette=None):
+        super().blit(source, x, y, key, palette)
+        width = getattr(source, "width", None)
+        height = getattr(source, "height", None)
+        if width is None or height is None:
+            self.mark_all()  # plain FrameBuffer sources do not expose their size
+            return
+        self.mark_dirty(x, y, width, height)
+
+    def blit_sized(self, source, x, y, width, height, key=-1, palette=None):
+        """``blit`` for sources whose size the caller knows (e.g. font glyphs)."""
+        super().blit(source, x, y, key, palette)
+        self.mark_dirty(x, y, width, height)
 
 
 def rgb565(r: int, g: int, b: int) -> int:
@@ -63,6 +248,11 @@ class LCD1p69:
         self._bl = self._ensure_output(bl, 0) if bl is not None else None
         self._cmd_buf = bytearray(1)
         self.buffer = bytearray(self.raw_width * self.raw_height * 2)
+        self._scratch = bytearray(_CHUNK_SIZE)
+        self.flush_bytes = 0  # pixel bytes sent by the last show()
+        self.flush_rects = 0
+        self.defer_show = False
+        self._flushing = False
         self.framebuf = None
         self._rotation = None
         self._config = None
@@ -70,7 +260,7 @@ class LCD1p69:
         self.reset()
         self._init_display()
         self.fill(0x0000)
-        self.show()
+        self.show(full=True)
         if self._bl is not None:
             self.set_backlight(backlight_on)
 
@@ -102,6 +292,13 @@ class LCD1p69:
         self._spi.write(data)
         self._cs.value(1)
 
+    def _begin_data(self) -> None:
+        self._dc.value(1)
+        self._cs.value(0)
+
+    def _end_data(self) -> None:
+        self._cs.value(1)
+
     def _write_u8(self, value: int) -> None:
         self._cmd_buf[0] = value & 0xFF
         self._write_data(self._cmd_buf)
@@ -171,6 +368,7 @@ class LCD1p69:
         self._x_offset = cfg["x_offset"]
         self._y_offset = cfg["y_offset"]
         self.framebuf = _FrameBuffer(self.buffer, self.width, self.height)
+        self.framebuf.mark_all()
         if send:
             self._write_cmd(0x36)
             self._write_u8(cfg["madctl"])
@@ -198,33 +396,137 @@ class LCD1p69:
         self._write_data(bytes((y0 >> 8, y0 & 0xFF, y1 >> 8, y1 & 0xFF)))
         self._write_cmd(0x2C)
 
-    def show(self, *, x: int = 0, y: int = 0, width: int = None, height: int = None) -> None:
-        if width is None:
-            width = self.width
-        if height is None:
-            height = self.height
-        x1 = x + width - 1
-        y1 = y + height - 1
-        self._set_window(x, y, x1, y1)
+    def show(
+        self,
+        *,
+        x: int = 0,
+        y: int = 0,
+        width: int = None,
+        height: int = None,
+        full: bool = False,
+    ) -> None:
+        """Flush the dirty windows, or an explicit window / the whole screen.
+
+        With no arguments only the rects recorded since the last flush are
+        sent. ``full=True`` sends the whole framebuffer; an explicit window
+        sends just that area and leaves the dirty set untouched.
+        """
+        fb = self.framebuf
+        explicit = width is not None or height is not None or x or y
+        if explicit:
+            if width is None:
+                width = self.width - x
+            if height is None:
+                height = self.height - y
+        if self.defer_show or self._flushing:
+            if full:
+                fb.mark_all()
+            elif explicit:
+                fb.mark_dirty(x, y, width, height)
+            return
+        if explicit:
+            self.flush_bytes = self._flush_window(x, y, width, height)
+            self.flush_rects = 1
+            return
+        rects = self._take_windows(full)
+        sent = 0
+        for rect in rects:
+            sent += self._flush_window(rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1])
+        self.flush_bytes = sent
+        self.flush_rects = len(rects)
+
+    async def show_async(self, *, full: bool = False) -> None:
+        """Flush the dirty windows, yielding to the event loop between chunks.
+
+        ``machine.SPI.write`` blocks, so each 4 KB chunk still holds the CPU
+        for its transfer time (~0.8 ms at 40 MHz) but other tasks run between
+        chunks instead of after the whole frame. Drawing that happens meanwhile
+        is marked dirty again and goes out with the next flush.
+        """
+        if self._flushing:
+            if full:
+                self.framebuf.mark_all()
+            return
+        rects = self._take_windows(full)
+        self._flushing = True
+        sent = 0
+        try:
+            for rect in rects:
+                self._set_window(rect[0], rect[1], rect[2] - 1, rect[3] - 1)
+                self._begin_data()
+                write = self._spi.write
+                for chunk in self._window_chunks(rect[0], rect[1], rect[2] - rect[0], rect[3] - rect[1]):
+                    write(chunk)
+                    sent += len(chunk)
+                    await asyncio.sleep(0)
+                self._end_data()
+        finally:
+            self._end_data()
+            self._flushing = False
+        self.flush_bytes = sent
+        self.flush_rects = len(rects)
+
+    def _take_windows(self, full: bool):
+        dirty_full, rects = self.framebuf.take_dirty()
+        if full or dirty_full:
+            return [[0, 0, self.width, self.height]]
+        return rects
+
+    def _flush_window(self, x: int, y: int, width: int, height: int) -> int:
+        if width <= 0 or height <= 0:
+            return 0
+        self._set_window(x, y, x + width - 1, y + height - 1)
+        sent = 0
+        write = self._spi.write
+        self._begin_data()
+        try:
+            for chunk in self._window_chunks(x, y, width, height):
+                write(chunk)
+                sent += len(chunk)
+        finally:
+            self._end_data()
+        return sent
+
+    def _window_chunks(self, x: int, y: int, width: int, height: int):
+        """Yield the window's pixels as buffers of at most ``_CHUNK_SIZE`` bytes."""
+        if width <= 0 or height <= 0:
+            return
         mv = memoryview(self.buffer)
-        start = (y * self.width + x) * 2
         row_stride = self.width * 2
+        start = y * row_stride + x * 2
         if x == 0 and width == self.width:
-            span = height * row_stride
-            block = mv[start : start + span]
-            for idx in range(0, len(block), _CHUNK_SIZE):
-                self._write_data(block[idx : idx + _CHUNK_SIZE])
+            end = start + height * row_stride
+            for idx in range(start, end, _CHUNK_SIZE):
+                yield mv[idx : min(idx + _CHUNK_SIZE, end)]
             return
-        for row in range(height):
-            offset = start + row * row_stride
-            line = mv[offset : offset + width * 2]
-            self._write_data(line)
+        # Partial-width windows: pack rows into the scratch buffer so narrow
+        # rects go out in a few large writes instead of one per row.
+        line_bytes = width * 2
+        scratch = self._scratch
+        scratch_mv = memoryview(scratch)
+        rows_per_chunk = _CHUNK_SIZE // line_bytes
+        row = 0
+        while row < height:
+            rows = min(rows_per_chunk, height - row)
+            if rows <= 1:
+                offset = start + row * row_stride
+                yield mv[offset : offset + line_bytes]
+                row += 1
+                continue
+            pos = 0
+            for idx in range(rows):
+                offset = start + (row + idx) * row_stride
+                scratch[pos : pos + line_bytes] = mv[offset : offset + line_bytes]
+                pos += line_bytes
+            yield scratch_mv[:pos]
+            row += rows
 
     def write_rect(self, x: int, y: int, width: int, height: int, data) -> None:
-        self._set_window(x, y, x + width - 1, y + height - 1)
-        mv = memoryview(data)
-        for idx in range(0, len(mv), _CHUNK_SIZE):
-            self._write_data(mv[idx : idx + _CHUNK_SIZE])
+        """Copy RGB565 ``data`` into the framebuffer and flush it immediately."""
+        buf = data if isinstance(data, bytearray) else bytearray(data)
+        tmp = framebuf.FrameBuffer(buf, width, height, framebuf.RGB565)
+        self.framebuf.blit_sized(tmp, x, y, width, height)
+        self.show()
 
     def fill(self, color: int) -> None:
         self.framebuf.fill(color)
@@ -246,14 +548,20 @@ class LCD1p69:
     def text(self, string: str, x: int, y: int, color: int = 0xFFFF) -> None:
         self.framebuf.text(string, x, y, color)
 
-    def blit(self, source, x: int, y: int) -> None:
-        self.framebuf.blit(source, x, y)
+    def blit(self, source, x: int, y: int, width: int = None, height: int = None) -> None:
+        if width is None or height is None:
+            self.framebuf.blit(source, x, y)
+        else:
+            self.framebuf.blit_sized(source, x, y, width, height)
 
     def blit_buffer(self, data, x: int, y: int, width: int, height: int) -> None:
         buf = data if isinstance(data, bytearray) else bytearray(data)
         tmp = framebuf.FrameBuffer(buf, width, height, framebuf.RGB565)
-        self.framebuf.blit(tmp, x, y)
+        self.framebuf.blit_sized(tmp, x, y, width, height)
+
+    def mark_dirty(self, x: int, y: int, width: int, height: int) -> None:
+        self.framebuf.mark_dirty(x, y, width, height)
 
     def clear(self, color: int = 0x0000) -> None:
         self.fill(color)
-        self.show()
+        self.show(full=True)
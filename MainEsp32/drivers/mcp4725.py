@@ -12,11 +12,15 @@ class MCP4725:
         self.address = address
         self._write_buffer = bytearray(2)
 
-    def write(self, value: int) -> bool:
+    def frame(self, value: int) -> bytearray:
+        """Fill and return the 2-byte fast-mode write frame for ``value``."""
         value = max(0, value & 0xFFF)
         self._write_buffer[0] = (value >> 8) & 0xFF
         self._write_buffer[1] = value & 0xFF
-        return self.i2c.writeto(self.address, self._write_buffer) == 2
+        return self._write_buffer
+
+    def write(self, value: int) -> bool:
+        return self.i2c.writeto(self.address, self.frame(value)) == 2
 
     def read(self):
         buf = bytearray(5)
@@ -42,3 +46,15 @@ class MCP4725:
             if item == value:
                 return key
         return "Off"
+
+
+def write_pair(first: MCP4725, value_a: int, second: MCP4725, value_b: int) -> bool:
+    """Fast-write two DACs on the same bus back to back.
+
+    The first frame ends without a STOP, so the second address goes out
+    after a repeated START and the pair costs one bus transaction.
+    """
+    i2c = first.i2c
+    acked = i2c.writeto(first.address, first.frame(value_a), False)
+    acked += i2c.writeto(second.address, second.frame(value_b))
+    return acked == 4
@@ -21,10 +21,37 @@ _FONT_ALIASES = {
 }
 
 
+try:
+    _FONT_DIR = __file__.rsplit("/", 1)[0] if "/" in __file__ else "fonts"
+except NameError:  # frozen into firmware
+    _FONT_DIR = "fonts"
+
+
+def _load_binary(module_name):
+    # A converted .bfn container (test/font_to_bin.py) wins over the module:
+    # only its index stays in RAM and glyphs are read from flash on demand.
+    try:
+        from fonts.binfont import BinaryFont
+
+        return BinaryFont(_FONT_DIR + "/" + module_name + ".bfn")
+    except OSError:
+        return None
+    except Exception as exc:
+        print("[fonts] {}.bfn unusable:".format(module_name), exc)
+        return None
+
+
 def load(name):
     module_name = _FONT_ALIASES.get(name, name)
     if module_name in globals():
         return globals()[module_name]
-    mod = __import__("fonts." + module_name, None, None, (module_name,))
+    mod = _load_binary(module_name)
+    if mod is None:
+        mod = __import__("fonts." + module_name, None, None, (module_name,))
     globals()[module_name] = mod
     return mod
+
+
+def loaded(name):
+    """Return the font module if it has already been loaded, else ``None``."""
+    return globals().get(_FONT_ALIASES.get(name, name))
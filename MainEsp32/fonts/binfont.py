@@ -0,0 +1,226 @@
+"""Binary font containers read glyph by glyph from flash.
+
+A ``.bfn`` file holds what a ``font_to_py`` module holds, but only the header
+and the glyph index are loaded; bitmaps are read on demand and the most
+recently used ones kept in a small cache. ``BinaryFont`` exposes the same
+functions as the generated modules (``height()``, ``get_ch()``, ...) so
+``Writer`` and ``fonts.load()`` callers cannot tell them apart.
+
+Layout, little endian::
+
+    header  "<4sBBHHHHHH"  magic b"BFN1", version, flags, height, baseline,
+                           max_width, min_ch, max_ch, glyph count
+    index   count * "<HHI" char code, width, offset into the data section;
+                           entry 0 is the default glyph, the rest sorted by code
+    data    glyph bitmaps, ((width - 1) // 8 + 1) * height bytes each,
+            horizontally mapped exactly as font_to_py emits them
+
+``test/font_to_bin.py`` converts the existing modules, optionally keeping
+only a subset such as the digits.
+"""
+
+try:
+    import ustruct as struct  # type: ignore
+except ImportError:  # CPython fallback
+    import struct  # type: ignore
+
+try:
+    from array import array
+except ImportError:  # pragma: no cover
+    from uarray import array  # type: ignore
+
+MAGIC = b"BFN1"
+VERSION = 1
+HEADER = "<4sBBHHHHHH"
+HEADER_SIZE = struct.calcsize(HEADER)
+ENTRY = "<HHI"
+ENTRY_SIZE = struct.calcsize(ENTRY)
+
+FLAG_HMAP = 0x01
+FLAG_REVERSE = 0x02
+FLAG_MONOSPACED = 0x04
+
+DEFAULT_CACHE_GLYPHS = 12
+
+
+class BinaryFont:
+    """``font_to_py``-compatible font backed by a ``.bfn`` file."""
+
+    def __init__(self, path, cache_glyphs=DEFAULT_CACHE_GLYPHS):
+        f = open(path, "rb")
+        try:
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE:
+                raise ValueError("truncated font header")
+            magic, version, flags, height, baseline, max_width, min_ch, max_ch, count = struct.unpack(
+                HEADER, header
+            )
+            if magic != MAGIC or version != VERSION:
+                raise ValueError("not a BFN1 font")
+            if count < 1:
+                raise ValueError("font has no glyphs")
+            raw = f.read(count * ENTRY_SIZE)
+            if len(raw) != count * ENTRY_SIZE:
+                raise ValueError("truncated font index")
+        except Exception:
+            f.close()
+            raise
+        self.path = path
+        self._file = f
+        self._flags = flags
+        self._height = height
+        self._baseline = baseline
+        self._max_width = max_width
+        self._min_ch = min_ch
+        self._max_ch = max_ch
+        self._count = count
+        self._codes = array("H", [0] * count)
+        self._widths = array("H", [0] * count)
+        self._offsets = array("I", [0] * count)
+        for idx in range(count):
+            code, width, offset = struct.unpack_from(ENTRY, raw, idx * ENTRY_SIZE)
+            self._codes[idx] = code
+            self._widths[idx] = width
+            self._offsets[idx] = offset
+        self._data_start = HEADER_SIZE + count * ENTRY_SIZE
+        self._cache_max = max(1, cache_glyphs)
+        self._cache = {}  # index entry -> [bitmap, last_use]
+        self._clock = 0
+        self.reads = 0
+
+    # -- font_to_py module API ------------------------------------------------
+
+    def height(self):
+        return self._height
+
+    def baseline(self):
+        return self._baseline
+
+    def max_width(self):
+        return self._max_width
+
+    def hmap(self):
+        return bool(self._flags & FLAG_HMAP)
+
+    def reverse(self):
+        return bool(self._flags & FLAG_REVERSE)
+
+    def monospaced(self):
+        return bool(self._flags & FLAG_MONOSPACED)
+
+    def min_ch(self):
+        return self._min_ch
+
+    def max_ch(self):
+        return self._max_ch
+
+    def get_ch(self, ch):
+        entry = self._find(ord(ch))
+        width = self._widths[entry]
+        self._clock += 1
+        cached = self._cache.get(entry)
+        if cached is not None:
+            cached[1] = self._clock
+            return cached[0], self._height, width
+        bitmap = bytearray(((width - 1) // 8 + 1) * self._height if width else 0)
+        if bitmap:
+            f = self._file
+            f.seek(self._data_start + self._offsets[entry])
+            f.readinto(bitmap)
+            self.reads += 1
+        if len(self._cache) >= self._cache_max:
+            self._evict()
+        self._cache[entry] = [bitmap, self._clock]
+        return bitmap, self._height, width
+
+    # -- helpers ------------------------------------------------------------
+
+    def has_char(self, ch):
+        return self._find(ord(ch)) != 0
+
+    def close(self):
+        try:
+            self._file.close()
+        except Exception:
+            pass
+        self._cache = {}
+
+    def _find(self, code):
+        codes = self._codes
+        lo = 1
+        hi = self._count - 1
+        while lo <= hi:
+            mid = (lo + hi) >> 1
+            value = codes[mid]
+            if value == code:
+                return mid
+            if value < code:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+        return 0
+
+    def _evict(self):
+        oldest = None
+        oldest_use = 0
+        for entry, cached in self._cache.items():
+            if oldest is None or cached[1] < oldest_use:
+                oldest = entry
+                oldest_use = cached[1]
+        if oldest is not None:
+            del self._cache[oldest]
+
+
+def pack(font_mod, chars=None):
+    """Return the ``.bfn`` bytes for a ``font_to_py`` module.
+
+    ``chars`` limits the container to those characters (plus the default
+    glyph); ``None`` keeps the module's whole ``min_ch()..max_ch()`` range.
+    """
+    height = font_mod.height()
+    if chars is None:
+        codes = list(range(font_mod.min_ch(), font_mod.max_ch() + 1))
+    else:
+        codes = sorted(set(ord(ch) for ch in chars))
+    # font_to_py modules map any code outside their range to the default glyph.
+    default, _, default_width = font_mod.get_ch(chr(0))
+    glyphs = [(0, default_width, bytes(default))]
+    for code in codes:
+        if code == 0:
+            continue
+        bitmap, glyph_height, width = font_mod.get_ch(chr(code))
+        if glyph_height != height:
+            raise ValueError("glyph height mismatch for %r" % chr(code))
+        glyphs.append((code, width, bytes(bitmap)))
+    flags = 0
+    if font_mod.hmap():
+        flags |= FLAG_HMAP
+    if font_mod.reverse():
+        flags |= FLAG_REVERSE
+    if font_mod.monospaced():
+        flags |= FLAG_MONOSPACED
+    min_code = codes[0] if codes else 0
+    max_code = codes[-1] if codes else 0
+    out = bytearray(
+        struct.pack(
+            HEADER,
+            MAGIC,
+            VERSION,
+            flags,
+            height,
+            font_mod.baseline(),
+            font_mod.max_width(),
+            min_code,
+            max_code,
+            len(glyphs),
+        )
+    )
+    data = bytearray()
+    for code, width, bitmap in glyphs:
+        out += struct.pack(ENTRY, code, width, len(data))
+        data += bitmap
+    out += data
+    return bytes(out)
+
+
+__all__ = ["BinaryFont", "pack", "MAGIC", "VERSION", "DEFAULT_CACHE_GLYPHS"]
@@ -5,6 +5,7 @@
 import machine
 import uasyncio as asyncio
 import time
+from array import array
 
 try:
     from version import module_version
@@ -15,9 +16,9 @@ except ImportError:  # pragma: no cover
 __version__ = module_version("motor_control")
 
 try:
-    from drivers.mcp4725 import MCP4725
+    from drivers.mcp4725 import MCP4725, write_pair as dac_write_pair
 except ImportError:
-    from mcp4725 import MCP4725
+    from mcp4725 import MCP4725, write_pair as dac_write_pair
 
 from HW import (
     ADC_THROTTLE_PIN,
@@ -98,9 +99,35 @@ DEFAULTS = {
     "adc_tr_scale": 1.0,
     "adc_br_offset": 0.18,
     "adc_br_scale": 1.0,
+    "adc_oversample": 5,
+    "adc_filter": "median",
+    "adc_trim": 1,
+    "adc_read_uv": False,
+    "adc_tr_linearity": None,
+    "adc_br_linearity": None,
     "update_period_ms": 20,
+    "dac_refresh_ms": 500,
+    "dac_chain_writes": True,
+    "dac_output_lut": True,
+    "control_timer_enabled": False,
+    "control_timer_id": 0,
 }
 
+# Upper edges (ms) of the tick lateness histogram; the last bucket is open.
+JITTER_BUCKETS_MS = (1, 2, 5, 10, 20, 50)
+
+_ADC_FILTERS = {"median": 0, "trimmed": 1, "mean": 2}
+_ADC_MAX_SAMPLES = 32
+_LINEARITY_KEYS = {"throttle": "adc_tr_linearity", "brake": "adc_br_linearity"}
+
+# Output LUT: 256 segments per channel, ratios in 8.8 fixed point, table
+# entries in 1/16 DAC LSB.
+_LUT_FRAC_BITS = 8
+_LUT_SEGMENTS = 256
+_LUT_ONE = _LUT_SEGMENTS << _LUT_FRAC_BITS
+_LUT_FRAC_MASK = (1 << _LUT_FRAC_BITS) - 1
+_LUT_SUB = 16
+
 
 def _clamp(value, low, high):
     if value < low:
@@ -110,6 +137,56 @@ def _clamp(value, low, high):
     return value
 
 
+class _DeadlineStats:
+    """Lateness of each control tick against its deadline."""
+
+    def __init__(self):
+        self.period_ms = None
+        self.reset()
+
+    def reset(self):
+        self.ticks = 0
+        self.missed = 0
+        self.overruns = 0
+        self.late_avg_us = None
+        self.late_max_us = 0
+        self.hist = [0] * (len(JITTER_BUCKETS_MS) + 1)
+
+    def record(self, late_us, run_us, period_us, *, count_missed=False):
+        if late_us < 0:
+            late_us = 0
+        self.ticks += 1
+        if late_us > self.late_max_us:
+            self.late_max_us = late_us
+        self.late_avg_us = _low_pass(self.late_avg_us, late_us, 0.1)
+        if count_missed and late_us >= period_us:
+            # Coroutine pacing has no IRQ to count skipped deadlines for it.
+            self.missed += late_us // period_us
+        if run_us > period_us:
+            self.overruns += 1
+        late_ms = late_us // 1000
+        idx = 0
+        for edge in JITTER_BUCKETS_MS:
+            if late_ms < edge:
+                break
+            idx += 1
+        self.hist[idx] += 1
+
+    def snapshot(self, pacing):
+        avg = self.late_avg_us
+        return {
+            "pacing": pacing,
+            "period_ms": self.period_ms,
+            "ticks": self.ticks,
+            "missed": self.missed,
+            "overruns": self.overruns,
+            "avg_ms": None if avg is None else avg / 1000.0,
+            "max_ms": self.late_max_us / 1000.0,
+            "buckets_ms": JITTER_BUCKETS_MS,
+            "hist": list(self.hist),
+        }
+
+
 def _volts_to_dac12(volts, vref):
     clipped = _clamp(volts, 0.0, vref)
     return int((clipped / vref) * 4095 + 0.5)
@@ -132,15 +209,247 @@ def _to_float(value):
     return None
 
 
-def _throttle_ratio_from_adc(vt, cfg):
-    throttle_min = float(cfg.get("throttle_input_min", 0.85))
-    throttle_max = float(cfg.get("throttle_input_max", 1.85))
-    throttle_span = (throttle_max - throttle_min) or 1.0
+def _reduce_samples(buf, mode, trim):
+    """Median (0), trimmed mean (1) or mean (2) of one ADC burst; sorts ``buf``."""
+    count = len(buf)
+    if mode == 2:
+        return sum(buf) / count
+    buf.sort()
+    if mode == 1:
+        acc = 0
+        for idx in range(trim, count - trim):
+            acc += buf[idx]
+        return acc / (count - 2 * trim)
+    mid = count >> 1
+    if count & 1:
+        return buf[mid]
+    return (buf[mid - 1] + buf[mid]) / 2
+
+
+def _linearity_table(points):
+    """``(raw_volts, true_volts)`` tuples sorted by raw volts, or None."""
+    if not points:
+        return None
+    pairs = []
+    for point in points:
+        try:
+            pairs.append((float(point[0]), float(point[1])))
+        except Exception:
+            continue
+    if len(pairs) < 2:
+        return None
+    pairs.sort()
+    return tuple(p[0] for p in pairs), tuple(p[1] for p in pairs)
+
+
+def _apply_linearity(table, value):
+    # Piecewise linear; the end segments extrapolate outside the table.
+    xs, ys = table
+    last = len(xs) - 1
+    idx = 1
+    while idx < last and value > xs[idx]:
+        idx += 1
+    x0 = xs[idx - 1]
+    span = xs[idx] - x0
+    if span <= 0.0:
+        return ys[idx]
+    return ys[idx - 1] + (value - x0) * (ys[idx] - ys[idx - 1]) / span
+
+
+def _cfg_float(cfg, key, default):
+    value = cfg.get(key, default)
     try:
-        vt_val = float(vt)
+        return float(value)
     except (TypeError, ValueError):
-        vt_val = 0.0
-    return _clamp((vt_val - throttle_min) / throttle_span, 0.0, 1.0)
+        return float(default)
+
+
+class _PidGains:
+    __slots__ = ("kp", "ki", "kd", "i_limit", "d_alpha", "output_alpha", "enabled")
+
+    def __init__(self, cfg, mode):
+        prefix = mode + "_pid"
+        self.kp = float(cfg.get(prefix + "_kp", cfg.get("throttle_control_gain", 0.25) or 0.0) or 0.0)
+        self.ki = float(cfg.get(prefix + "_ki", 0.0) or 0.0)
+        self.kd = float(cfg.get(prefix + "_kd", 0.0) or 0.0)
+        self.i_limit = abs(float(cfg.get(prefix + "_integral_limit", 0.5) or 0.0))
+        self.d_alpha = _clamp(float(cfg.get(prefix + "_d_alpha", 0.3) or 0.0), 0.0, 1.0)
+        self.output_alpha = _clamp(
+            float(cfg.get(prefix + "_output_alpha", cfg.get("throttle_ratio_alpha", 0.4) or 0.0) or 0.0),
+            0.0,
+            1.0,
+        )
+        self.enabled = self.kp > 0.0 or self.ki > 0.0 or self.kd > 0.0
+
+
+class _OutputConfig:
+    """The cfg keys ``compute_output_voltages`` reads, as floats.
+
+    Cheap enough to build per call for callers that pass a plain cfg dict
+    (the dashboards, the signals terminal); the control tick uses the
+    :class:`_ControlConfig` subclass compiled once per reload.
+    """
+
+    __slots__ = (
+        "dac_vref",
+        "throttle_in_min",
+        "throttle_in_span",
+        "throttle_out_min",
+        "throttle_out_max",
+        "throttle_factor",
+        "brake_threshold",
+        "brake_span",
+        "brake_out_min",
+        "brake_out_max",
+        "brake_factor",
+        "max_tr_v",
+        "max_br_v",
+    )
+
+    def __init__(self, cfg):
+        dac_vref = self.dac_vref = _cfg_float(cfg, "dac_vref", 3.3)
+        throttle_min = _cfg_float(cfg, "throttle_input_min", 0.85)
+        throttle_max = _cfg_float(cfg, "throttle_input_max", 1.85)
+        self.throttle_in_min = throttle_min
+        self.throttle_in_span = (throttle_max - throttle_min) or 1.0
+        self.throttle_out_min = _cfg_float(cfg, "throttle_output_min", 1.4)
+        self.throttle_out_max = _cfg_float(cfg, "throttle_output_max", dac_vref)
+        self.throttle_factor = _clamp(_cfg_float(cfg, "throttle_factor", 1.0), 0.0, 1.0)
+
+        brake_threshold = _cfg_float(cfg, "brake_input_threshold", cfg.get("brake_threshold", 1.6))
+        self.brake_threshold = brake_threshold
+        self.brake_span = (_cfg_float(cfg, "brake_input_max", 1.85) - brake_threshold) or 1.0
+        self.brake_out_min = _cfg_float(cfg, "brake_output_min", 1.5)
+        self.brake_out_max = _cfg_float(cfg, "brake_output_max", dac_vref)
+        self.brake_factor = _clamp(_cfg_float(cfg, "brake_factor", 1.0), 0.0, 1.0)
+        self.max_tr_v = dac_vref
+        self.max_br_v = min(self.brake_out_max, dac_vref)
+
+
+class _ControlConfig(_OutputConfig):
+    """Typed copy of the cfg keys read by the control tick.
+
+    ``MotorControl.reload_config`` rebuilds it whenever cfg changes, so the
+    tick touches plain attributes instead of dict lookups and float() calls.
+    """
+
+    __slots__ = (
+        "mode",
+        "adc_vref",
+        "tr_scale",
+        "tr_offset",
+        "br_scale",
+        "br_offset",
+        "tr_linearity",
+        "br_linearity",
+        "adc_samples",
+        "adc_filter",
+        "adc_trim",
+        "adc_read_uv",
+        "power_max_w",
+        "speed_max_kmh",
+        "torque_max",
+        "mix_speed_kmh",
+        "mix_hyst_kmh",
+        "pid",
+        "pid_debug",
+        "monitor_enabled",
+        "monitor_period_ms",
+        "timer_enabled",
+        "dac_refresh_ms",
+        "dac_chain",
+        "dac_lsb_v",
+        "lut",
+    )
+
+    def __init__(self, cfg):
+        _OutputConfig.__init__(self, cfg)
+        try:
+            self.mode = str(cfg.get("throttle_mode", "power") or "").strip().lower()
+        except Exception:
+            self.mode = ""
+        self.adc_vref = _cfg_float(cfg, "adc_vref", 3.3)
+        dac_vref = self.dac_vref
+        self.tr_scale = float(cfg.get("adc_tr_scale", 1.0) or 1.0)
+        self.tr_offset = float(cfg.get("adc_tr_offset", 0.0) or 0.0)
+        self.br_scale = float(cfg.get("adc_br_scale", 1.0) or 1.0)
+        self.br_offset = float(cfg.get("adc_br_offset", 0.0) or 0.0)
+        self.tr_linearity = _linearity_table(cfg.get("adc_tr_linearity"))
+        self.br_linearity = _linearity_table(cfg.get("adc_br_linearity"))
+        try:
+            samples = int(cfg.get("adc_oversample", 1) or 1)
+        except Exception:
+            samples = 1
+        samples = max(1, min(samples, _ADC_MAX_SAMPLES))
+        self.adc_samples = samples
+        try:
+            self.adc_filter = _ADC_FILTERS[str(cfg.get("adc_filter", "median")).lower()]
+        except Exception:
+            self.adc_filter = 0
+        try:
+            trim = int(cfg.get("adc_trim", 1) or 0)
+        except Exception:
+            trim = 1
+        self.adc_trim = max(0, min(trim, (samples - 1) // 2))
+        self.adc_read_uv = bool(cfg.get("adc_read_uv"))
+
+        max_power = max(1.0, float(cfg.get("throttle_power_max_w", 500.0) or 1.0))
+        max_speed = max(1.0, float(cfg.get("throttle_speed_max_kmh", 50.0) or 1.0))
+        ref_speed = max(0.1, float(cfg.get("throttle_torque_ref_speed_kmh", 10.0) or 0.1))
+        ref_speed_mps = max(ref_speed / 3.6, 0.3)
+        self.power_max_w = max_power
+        self.speed_max_kmh = max_speed
+        self.torque_max = max_power / max(max_speed / 3.6, ref_speed_mps)
+        self.mix_speed_kmh = float(cfg.get("throttle_mix_speed_kmh", 20.0) or 0.0)
+        self.mix_hyst_kmh = abs(float(cfg.get("throttle_mix_hyst_kmh", 3.0) or 0.0))
+        self.pid = {mode: _PidGains(cfg, mode) for mode in ("power", "speed", "torque")}
+
+        self.pid_debug = bool(cfg.get("pid_timing_debug_enabled"))
+        self.monitor_enabled = bool(cfg.get("monitor_control_enabled"))
+        try:
+            self.monitor_period_ms = max(200, int(cfg.get("monitor_control_period_ms", 1000)))
+        except Exception:
+            self.monitor_period_ms = 1000
+        self.timer_enabled = bool(cfg.get("control_timer_enabled"))
+        try:
+            self.dac_refresh_ms = max(0, int(cfg.get("dac_refresh_ms", 500)))
+        except Exception:
+            self.dac_refresh_ms = 500
+        self.dac_chain = bool(cfg.get("dac_chain_writes", True))
+        self.dac_lsb_v = dac_vref / 4095
+
+        self.lut = None
+
+    def build_lut(self, cfg, prev=None):
+        """Attach the output LUT, reusing ``prev`` when its settings match.
+
+        Only ``MotorControl.reload_config`` calls this; ad-hoc configs stay
+        on the float path.
+        """
+        # An inverted throttle output range makes the float path's clamp
+        # non-monotonic; leave that (mis)configuration on the float path.
+        self.lut = None
+        dac_vref = self.dac_vref
+        if dac_vref > 0.0 and self.throttle_out_max >= self.throttle_out_min and cfg.get("dac_output_lut", True):
+            key = (
+                dac_vref,
+                self.throttle_out_min,
+                self.throttle_out_max,
+                self.throttle_factor,
+                self.brake_threshold,
+                self.brake_span,
+                self.brake_out_min,
+                self.brake_out_max,
+                self.brake_factor,
+            )
+            lut = prev.lut if prev is not None else None
+            if lut is None or lut.key != key:
+                lut = _OutputLut(self, key)
+            self.lut = lut
+        return self.lut
+
+def _throttle_ratio_from_adc(vt, cc):
+    return _clamp((vt - cc.throttle_in_min) / cc.throttle_in_span, 0.0, 1.0)
 
 
 def _low_pass(prev, value, alpha):
@@ -163,54 +472,132 @@ def compute_output_voltages(vt, vb, cfg, *, control_ratio=None, raw_ratio=None):
         vb = float(vb)
     except (TypeError, ValueError):
         vb = 0.0
+    cc = cfg if isinstance(cfg, _OutputConfig) else _OutputConfig(cfg)
 
-    throttle_min = float(cfg.get("throttle_input_min", 0.85))
-    throttle_max = float(cfg.get("throttle_input_max", 1.85))
-    throttle_out_min = float(cfg.get("throttle_output_min", 1.4))
-    throttle_out_max = float(cfg.get("throttle_output_max", cfg.get("dac_vref", 3.3)))
-    try:
-        throttle_factor = float(cfg.get("throttle_factor", 1.0))
-    except (TypeError, ValueError):
-        throttle_factor = 1.0
-    throttle_factor = _clamp(throttle_factor, 0.0, 1.0)
-
-    brake_threshold = float(cfg.get("brake_input_threshold", cfg.get("brake_threshold", 1.6)))
-    brake_max = float(cfg.get("brake_input_max", 1.85))
-    brake_out_min = float(cfg.get("brake_output_min", 1.5))
-    brake_out_max = float(cfg.get("brake_output_max", cfg.get("dac_vref", 3.3)))
-    try:
-        brake_factor = float(cfg.get("brake_factor", 1.0))
-    except (TypeError, ValueError):
-        brake_factor = 1.0
-    brake_factor = _clamp(brake_factor, 0.0, 1.0)
-
-    max_tr_v = float(cfg.get("dac_vref", 3.3))
-    max_br_v = min(brake_out_max, float(cfg.get("dac_vref", 3.3)))
-
-    brake_span = (brake_max - brake_threshold) or 1.0
-
-    if vb < brake_threshold:
+    throttle_out_min = cc.throttle_out_min
+    brake_out_min = cc.brake_out_min
+    if vb < cc.brake_threshold:
         if raw_ratio is None:
-            raw_ratio = _throttle_ratio_from_adc(vt, cfg)
+            raw_ratio = _throttle_ratio_from_adc(vt, cc)
         ratio_tr = control_ratio if control_ratio is not None else raw_ratio
         ratio_tr = _clamp(ratio_tr, 0.0, 1.0)
-        out_tr = throttle_out_min + ratio_tr * throttle_factor * (throttle_out_max - throttle_out_min)
+        throttle_out_max = cc.throttle_out_max
+        out_tr = throttle_out_min + ratio_tr * cc.throttle_factor * (throttle_out_max - throttle_out_min)
         out_tr = _clamp(out_tr, throttle_out_min, throttle_out_max)
         out_br = brake_out_min
     else:
         out_tr = throttle_out_min
-        ratio_br = _clamp((vb - brake_threshold) / brake_span, 0.0, 1.0)
-        out_br = brake_out_min + ratio_br * brake_factor * (brake_out_max - brake_out_min)
+        ratio_br = _clamp((vb - cc.brake_threshold) / cc.brake_span, 0.0, 1.0)
+        out_br = brake_out_min + ratio_br * cc.brake_factor * (cc.brake_out_max - brake_out_min)
 
-    out_tr = _clamp(out_tr, 0.0, max_tr_v)
-    out_br = _clamp(out_br, 0.0, max_br_v)
+    out_tr = _clamp(out_tr, 0.0, cc.max_tr_v)
+    out_br = _clamp(out_br, 0.0, cc.max_br_v)
     return out_tr, out_br
 
 
+def _lut_table(out_min, out_step, to_sub):
+    table = array("i", [0] * (_LUT_SEGMENTS + 1))
+    for idx in range(_LUT_SEGMENTS + 1):
+        volts = out_min + (idx / _LUT_SEGMENTS) * out_step
+        table[idx] = int(volts * to_sub + (0.5 if volts >= 0.0 else -0.5))
+    return table
+
+
+def _lut_lookup(table, pos, lo, hi):
+    if pos <= 0:
+        idx = 0
+        frac = 0
+    elif pos >= _LUT_ONE:
+        idx = _LUT_SEGMENTS - 1
+        frac = 1 << _LUT_FRAC_BITS
+    else:
+        idx = pos >> _LUT_FRAC_BITS
+        frac = pos & _LUT_FRAC_MASK
+    base = table[idx]
+    code = (base + (((table[idx + 1] - base) * frac) >> _LUT_FRAC_BITS) + (_LUT_SUB >> 1)) // _LUT_SUB
+    if code < lo:
+        return lo
+    if code > hi:
+        return hi
+    return code
+
+
+class _OutputLut:
+    """Ratio -> DAC code tables for both channels.
+
+    Built by ``_ControlConfig.build_lut`` and kept across reloads until one of the
+    output or brake input settings changes. A lookup costs one float multiply
+    and integer interpolation, and lands within one LSB of
+    ``_volts_to_dac12(compute_output_voltages(...))``.
+    """
+
+    __slots__ = (
+        "key",
+        "brake_threshold",
+        "brake_scale",
+        "tr",
+        "tr_lo",
+        "tr_hi",
+        "tr_idle",
+        "br",
+        "br_lo",
+        "br_hi",
+        "br_idle",
+    )
+
+    def __init__(self, cc, key):
+        vref = cc.dac_vref
+        to_sub = 4095 * _LUT_SUB / vref
+        self.key = key
+        self.brake_threshold = cc.brake_threshold
+        self.brake_scale = _LUT_ONE / cc.brake_span
+
+        # Both mappings are affine in the ratio and then clamped, so the
+        # tables hold the unclamped line and the clamp happens on the code.
+        tr_min = cc.throttle_out_min
+        self.tr = _lut_table(tr_min, cc.throttle_factor * (cc.throttle_out_max - tr_min), to_sub)
+        idle_vb = cc.brake_threshold - 1.0
+        tr_zero, br_idle = compute_output_voltages(0.0, idle_vb, cc, control_ratio=0.0)
+        tr_full = compute_output_voltages(0.0, idle_vb, cc, control_ratio=1.0)[0]
+        self.tr_lo, self.tr_hi = _sorted_codes(tr_zero, tr_full, vref)
+        self.tr_idle = _volts_to_dac12(_clamp(tr_min, 0.0, cc.max_tr_v), vref)
+
+        br_min = cc.brake_out_min
+        br_step = cc.brake_factor * (cc.brake_out_max - br_min)
+        self.br = _lut_table(br_min, br_step, to_sub)
+        self.br_lo, self.br_hi = _sorted_codes(
+            _clamp(br_min, 0.0, cc.max_br_v), _clamp(br_min + br_step, 0.0, cc.max_br_v), vref
+        )
+        self.br_idle = _volts_to_dac12(br_idle, vref)
+
+    def codes(self, vb, ratio):
+        """``(code_th, code_br)`` for calibrated brake volts and throttle ratio."""
+        if vb < self.brake_threshold:
+            return _lut_lookup(self.tr, int(ratio * _LUT_ONE), self.tr_lo, self.tr_hi), self.br_idle
+        pos = int((vb - self.brake_threshold) * self.brake_scale)
+        return self.tr_idle, _lut_lookup(self.br, pos, self.br_lo, self.br_hi)
+
+
+def _sorted_codes(volts_a, volts_b, vref):
+    code_a = _volts_to_dac12(volts_a, vref)
+    code_b = _volts_to_dac12(volts_b, vref)
+    if code_a > code_b:
+        return code_b, code_a
+    return code_a, code_b
+
+
 class MotorControl:
     def __init__(self, **kwargs):
         self.cfg = DEFAULTS.copy()
         self.cfg.update(kwargs)
+        self._cc = None
+        self.reload_config()
+        self._adc_buf = [0] * self._cc.adc_samples
+        # Last code each DAC acknowledged; None forces the next write.
+        self._dac_code_th = None
+        self._dac_code_br = None
+        self._dac_written_ms = 0
+        self._dac_chain_failures = 0
 
         self.is_stub = False
 
@@ -251,7 +638,7 @@ class MotorControl:
         self._loop_period_avg_ms = None
         self._timing_stats = {
             "adc": {"avg": None, "last": 0.0},
-            "dac": {"avg": None, "last": 0.0},
+            "dac": {"avg": None, "last": 0.0, "writes": 0, "skipped": 0},
             "compute": {"avg": None, "last": 0.0},
             "sections": {
                 "sensors": {"avg": None, "last": 0.0},
@@ -263,6 +650,13 @@ class MotorControl:
         }
         self._monitor_task = None
         self._pid_debug_data = {}
+        self._deadline = _DeadlineStats()
+        self._pacing = None
+        self._control_timer = None
+        self._timer_flag = None
+        self._timer_pending = False
+        self._timer_fired_us = 0
+        self._timer_failed = False
 
     def _update_section_timing(self, section, elapsed_ms):
         sections = self._timing_stats.setdefault("sections", {})
@@ -427,40 +821,129 @@ class MotorControl:
         self._ensure_adcs()
         self._ensure_dacs()
 
-    def _adc_read_volts(self, adc):
+    def _adc_read_volts(self, adc, buf=None):
+        # ``buf`` defaults to the control tick's burst buffer; callers on
+        # another thread (REPL calibration) must pass their own.
         if adc is None:
             return None
-        reader = getattr(adc, "read", None) or getattr(adc, "read_u16", None)
-        if reader is None:
-            return None
-        try:
-            raw = reader()
-        except Exception:
-            return None
+        cc = self._cc
+        reader = getattr(adc, "read_uv", None) if cc.adc_read_uv else None
+        if reader is not None:
+            scale = 0.000001
+        else:
+            reader = getattr(adc, "read", None) or getattr(adc, "read_u16", None)
+            if reader is None:
+                return None
+            scale = cc.adc_vref / 4095.0
+        samples = cc.adc_samples
         try:
-            numeric = float(raw)
+            if samples <= 1:
+                return float(reader()) * scale
+            if buf is None:
+                buf = self._adc_buf
+                if len(buf) != samples:
+                    buf = self._adc_buf = [0] * samples
+            elif len(buf) != samples:
+                buf = [0] * samples
+            # One burst per channel so the ADC is not switching inputs mid-way.
+            for idx in range(samples):
+                buf[idx] = reader()
+            return _reduce_samples(buf, cc.adc_filter, cc.adc_trim) * scale
         except Exception:
             return None
-        return (numeric * float(self.cfg.get("adc_vref", 3.3))) / 4095.0
 
     def _calibrate_adc(self, value, kind):
         if value is None:
             return None
+        cc = self._cc
         if kind == "throttle":
-            scale = float(self.cfg.get("adc_tr_scale", 1.0) or 1.0)
-            offset = float(self.cfg.get("adc_tr_offset", 0.0) or 0.0)
+            table = cc.tr_linearity
+            scale = cc.tr_scale
+            offset = cc.tr_offset
         else:
-            scale = float(self.cfg.get("adc_br_scale", 1.0) or 1.0)
-            offset = float(self.cfg.get("adc_br_offset", 0.0) or 0.0)
+            table = cc.br_linearity
+            scale = cc.br_scale
+            offset = cc.br_offset
         try:
+            if table is not None:
+                return _apply_linearity(table, value)
             return value * scale + offset
         except Exception:
             return value
 
-    def _extract_speed_kmh(self):
+    async def calibrate_adc_point(self, kind, volts, samples=32, delay_ms=5):
+        """Add a (raw ADC volts, reference volts) point to the linearity table.
+
+        Feed a known voltage (checked with a meter) into the throttle or brake
+        input and call once per voltage. With two or more points the table
+        replaces ``adc_*_scale``/``adc_*_offset`` for that channel.
+        """
+        key = _LINEARITY_KEYS.get(kind)
+        if key is None:
+            raise ValueError("kind must be throttle or brake")
+        true_v = float(volts)
+        samples = max(1, int(samples))
+        self._ensure_adcs()
+        adc = self._adc_t if kind == "throttle" else self._adc_b
+        # t.calibrate_adc_point runs this from the REPL thread while the
+        # control loop keeps ticking, so it must not share _adc_buf.
+        buf = [0] * self._cc.adc_samples
+        acc = 0.0
+        count = 0
+        for idx in range(samples):
+            value = self._adc_read_volts(adc, buf)
+            if value is not None:
+                acc += value
+                count += 1
+            if delay_ms and idx + 1 < samples:
+                await asyncio.sleep_ms(delay_ms)
+        if not count:
+            raise RuntimeError("{} ADC not readable".format(kind))
+        raw_v = acc / count
+        points = []
+        for point in self.cfg.get(key) or ():
+            try:
+                if abs(float(point[1]) - true_v) > 0.005:
+                    points.append([float(point[0]), float(point[1])])
+            except Exception:
+                continue
+        points.append([round(raw_v, 4), true_v])
+        points.sort()
+        self.cfg[key] = points
+        self.reload_config()
+        return raw_v
+
+    def clear_adc_linearity(self, kind=None):
+        kinds = (kind,) if kind is not None else ("throttle", "brake")
+        for label in kinds:
+            key = _LINEARITY_KEYS.get(label)
+            if key is None:
+                raise ValueError("kind must be throttle or brake")
+            self.cfg[key] = None
+        self.reload_config()
+
+    def _pr_frame(self):
         st = self._state
         if st is None:
             return None
+        frame_fn = getattr(st, "pr_frame", None)
+        if frame_fn is None:
+            return None
+        return frame_fn()
+
+    def _extract_speed_kmh(self, frame=None):
+        st = self._state
+        if st is None:
+            return None
+        if frame is None:
+            frame = self._pr_frame()
+        if frame is not None:
+            if frame.speed_kmh is not None:
+                return frame.speed_kmh
+            try:
+                return float(getattr(st, "trip_speed_kmh", 0.0) or 0.0)
+            except Exception:
+                return 0.0
         vehicle_speed_fn = getattr(st, "vehicle_speed", None)
         if callable(vehicle_speed_fn):
             try:
@@ -501,10 +984,14 @@ class MotorControl:
                     pass
         return None
 
-    def _extract_power_w(self):
+    def _extract_power_w(self, frame=None):
         st = self._state
         if st is None:
             return None
+        if frame is None:
+            frame = self._pr_frame()
+        if frame is not None:
+            return frame.power_w
         get_pr = getattr(st, "get_pr", None)
         if not callable(get_pr):
             return None
@@ -559,35 +1046,27 @@ class MotorControl:
             state["last_error"] = 0.0
             state["last_output"] = None
 
-    def _get_pid_cfg(self, mode):
-        prefix = f"{mode}_pid"
-        kp = float(self.cfg.get(f"{prefix}_kp", self.cfg.get("throttle_control_gain", 0.25) or 0.0) or 0.0)
-        ki = float(self.cfg.get(f"{prefix}_ki", 0.0) or 0.0)
-        kd = float(self.cfg.get(f"{prefix}_kd", 0.0) or 0.0)
-        i_limit = float(self.cfg.get(f"{prefix}_integral_limit", 0.5) or 0.0)
-        d_alpha = _clamp(float(self.cfg.get(f"{prefix}_d_alpha", 0.3) or 0.0), 0.0, 1.0)
-        output_alpha = _clamp(
-            float(self.cfg.get(f"{prefix}_output_alpha", self.cfg.get("throttle_ratio_alpha", 0.4) or 0.0) or 0.0),
-            0.0,
-            1.0,
-        )
-        return {
-            "kp": kp,
-            "ki": ki,
-            "kd": kd,
-            "i_limit": abs(i_limit),
-            "d_alpha": d_alpha,
-            "output_alpha": output_alpha,
-        }
+    def reload_config(self, cfg=None):
+        """Merge ``cfg`` (if given) and recompile the settings the tick reads.
+
+        Call after editing ``self.cfg`` directly; the setters here do it.
+        """
+        if cfg:
+            self.cfg.update(cfg)
+        cc = _ControlConfig(self.cfg)
+        cc.build_lut(self.cfg, self._cc)
+        self._cc = cc
+        return cc
 
     def _control_pid_with_metric(self, mode, desired_ratio, metric_value, metric_max, dt_ms):
         pid_start = _ticks_ms_int()
-        cfg = self._get_pid_cfg(mode)
-        kp = cfg["kp"]
-        ki = cfg["ki"]
-        kd = cfg["kd"]
-        enabled = kp > 0.0 or ki > 0.0 or kd > 0.0
-        throttle_factor = _clamp(float(self.cfg.get("throttle_factor", 1.0) or 1.0), 0.0, 1.0)
+        cc = self._cc
+        gains = cc.pid[mode]
+        kp = gains.kp
+        ki = gains.ki
+        kd = gains.kd
+        enabled = gains.enabled
+        throttle_factor = cc.throttle_factor
         base_ratio = _clamp(desired_ratio, 0.0, 1.0)
         # Point 4 optimization: reduce float conversions by normalizing inputs once.
         try:
@@ -615,14 +1094,14 @@ class MotorControl:
         use_derivative = kd > 0.0
         if use_integral:
             integral = state["integral"] + error * dt_s
-            integral = _clamp(integral, -cfg["i_limit"], cfg["i_limit"])
+            integral = _clamp(integral, -gains.i_limit, gains.i_limit)
             state["integral"] = integral
         else:
             integral = 0.0
             state["integral"] = 0.0
         if use_derivative:
             deriv_raw = (error - state["last_error"]) / dt_s
-            derivative = state["derivative"] + cfg["d_alpha"] * (deriv_raw - state["derivative"])
+            derivative = state["derivative"] + gains.d_alpha * (deriv_raw - state["derivative"])
             state["derivative"] = derivative
         else:
             derivative = 0.0
@@ -634,7 +1113,7 @@ class MotorControl:
         if use_derivative:
             output += kd * derivative
         prev = state["last_output"]
-        alpha = cfg["output_alpha"]
+        alpha = gains.output_alpha
         if prev is None or alpha <= 0.0:
             smoothed = output
         elif alpha >= 1.0:
@@ -646,7 +1125,7 @@ class MotorControl:
         self._control_ratio = smoothed
         pid_elapsed = _ticks_diff_int(_ticks_ms_int(), pid_start)
         self._update_controller_timing("pid_{}".format(mode), pid_elapsed)
-        if self.cfg.get("pid_timing_debug_enabled"):
+        if cc.pid_debug:
             self._record_pid_debug(
                 mode,
                 elapsed_ms=pid_elapsed,
@@ -693,7 +1172,8 @@ class MotorControl:
             self._reset_pid()
             return 0.0
 
-        mode = str(self.cfg.get("throttle_mode", "power") or "").lower()
+        cc = self._cc
+        mode = cc.mode
         if not mode or mode in {"basic", "none", "off"} or self._state is None:
             self._control_ratio = ratio_input
             self._reset_pid()
@@ -712,13 +1192,14 @@ class MotorControl:
             return ratio_input
 
         power_start = _ticks_ms_int()
-        power_w = self._extract_power_w()
+        frame = self._pr_frame()
+        power_w = self._extract_power_w(frame)
         self._update_controller_timing("power_fetch", _ticks_diff_int(_ticks_ms_int(), power_start))
         speed_start = _ticks_ms_int()
-        speed_kmh = self._extract_speed_kmh()
+        speed_kmh = self._extract_speed_kmh(frame)
         self._update_controller_timing("speed_fetch", _ticks_diff_int(_ticks_ms_int(), speed_start))
-        max_power = max(1.0, float(self.cfg.get("throttle_power_max_w", 500.0) or 1.0))
-        max_speed = max(1.0, float(self.cfg.get("throttle_speed_max_kmh", 50.0) or 1.0))
+        max_power = cc.power_max_w
+        max_speed = cc.speed_max_kmh
 
         forced_ratio = None
         if mode == "speed" and self._forced_speed_target_kmh is not None:
@@ -741,15 +1222,11 @@ class MotorControl:
             if power_w is not None:
                 speed_mps = max((speed_kmh or 0.0) / 3.6, 0.3)
                 torque = float(power_w) / speed_mps
-            ref_speed = max(0.1, float(self.cfg.get("throttle_torque_ref_speed_kmh", 10.0) or 0.1))
-            ref_speed_mps = max(ref_speed / 3.6, 0.3)
-            max_speed_mps = max(max_speed / 3.6, ref_speed_mps)
-            torque_max = max_power / max_speed_mps
-            return self._control_pid_with_metric("torque", ratio_input, torque, torque_max, dt_ms)
+            return self._control_pid_with_metric("torque", ratio_input, torque, cc.torque_max, dt_ms)
 
         if mode == "mix":
-            threshold = float(self.cfg.get("throttle_mix_speed_kmh", 20.0) or 0.0)
-            hyst = abs(float(self.cfg.get("throttle_mix_hyst_kmh", 3.0) or 0.0))
+            threshold = cc.mix_speed_kmh
+            hyst = cc.mix_hyst_kmh
             if self._mix_use_speed:
                 if speed_kmh is None or speed_kmh < (threshold - hyst):
                     self._mix_use_speed = False
@@ -762,11 +1239,7 @@ class MotorControl:
             if power_w is not None:
                 speed_mps = max((speed_kmh or 0.0) / 3.6, 0.3)
                 torque = float(power_w) / speed_mps
-            ref_speed = max(0.1, float(self.cfg.get("throttle_torque_ref_speed_kmh", 10.0) or 0.1))
-            ref_speed_mps = max(ref_speed / 3.6, 0.3)
-            max_speed_mps = max(max_speed / 3.6, ref_speed_mps)
-            torque_max = max_power / max_speed_mps
-            return self._control_pid_with_metric("torque", ratio_input, torque, torque_max, dt_ms)
+            return self._control_pid_with_metric("torque", ratio_input, torque, cc.torque_max, dt_ms)
 
         self._control_ratio = ratio_input
         return ratio_input
@@ -793,6 +1266,7 @@ class MotorControl:
         if not label:
             return False
         self.cfg["throttle_mode"] = label
+        self.reload_config()
         self._control_ratio = None
         self._filtered_power = None
         self._filtered_speed = None
@@ -839,172 +1313,243 @@ class MotorControl:
         period_ms = max(1, period_ms)
         self._ensure_hw()
         self._refresh_monitor_task()
+        self._deadline.period_ms = period_ms
         while True:
+            flag = self._start_control_timer(period_ms) if self._timer_wanted() else None
+            if flag is not None:
+                try:
+                    await self._run_timer_paced(period_ms, flag)
+                finally:
+                    self._stop_control_timer()
+            await self._run_sleep_paced(period_ms)
+
+    async def _run_sleep_paced(self, period_ms):
+        # Default pacing: sleep for whatever is left of the period. Returns
+        # when timer pacing gets requested through ``set_control_timer``.
+        self._pacing = "sleep"
+        stats = self._deadline
+        period_us = period_ms * 1000
+        last_us = None
+        while not self._timer_wanted():
+            loop_started = _ticks_ms_int()
+            tick_us = _ticks_us_int()
+            self._refresh_monitor_task()
+            self._control_tick(loop_started, period_ms)
+            late_us = 0 if last_us is None else _ticks_diff_int(tick_us, last_us) - period_us
+            stats.record(late_us, _ticks_diff_int(_ticks_us_int(), tick_us), period_us, count_missed=True)
+            last_us = tick_us
+            elapsed = _ticks_diff_int(_ticks_ms_int(), loop_started)
+            wait_ms = period_ms - max(0, int(elapsed))
+            if wait_ms > 0:
+                await asyncio.sleep_ms(wait_ms)
+            else:
+                await asyncio.sleep_ms(0)
+
+    async def _run_timer_paced(self, period_ms, flag):
+        # The timer IRQ stamps the deadline and sets ``flag``; the tick itself
+        # still runs in the event loop so it never interleaves with other
+        # coroutines touching cfg or the PID state.
+        self._pacing = "timer"
+        stats = self._deadline
+        period_us = period_ms * 1000
+        while self._timer_wanted():
+            await flag.wait()
+            fired_us = self._timer_fired_us
+            self._timer_pending = False
             loop_started = _ticks_ms_int()
+            tick_us = _ticks_us_int()
             self._refresh_monitor_task()
+            self._control_tick(loop_started, period_ms)
+            stats.record(_ticks_diff_int(tick_us, fired_us), _ticks_diff_int(_ticks_us_int(), tick_us), period_us)
+
+    def _control_timer_irq(self, _timer):
+        # IRQ context: no allocation. A deadline that fires while the previous
+        # one is still waiting for the event loop is counted and dropped.
+        if self._timer_pending:
+            self._deadline.missed += 1
+            return
+        self._timer_pending = True
+        self._timer_fired_us = time.ticks_us()
+        self._timer_flag.set()
+
+    def _timer_wanted(self):
+        return self._cc.timer_enabled and not self._timer_failed
+
+    def _start_control_timer(self, period_ms):
+        timer_cls = getattr(machine, "Timer", None)
+        flag_cls = getattr(asyncio, "ThreadSafeFlag", None)
+        if timer_cls is None or flag_cls is None:
+            print("[MotorControl] control timer unsupported; using coroutine pacing")
+            self._timer_failed = True
+            return None
+        self._timer_flag = flag_cls()
+        self._timer_pending = False
+        try:
+            timer = timer_cls(int(self.cfg.get("control_timer_id", 0) or 0))
+            timer.init(mode=timer_cls.PERIODIC, period=period_ms, callback=self._control_timer_irq)
+        except Exception as exc:
+            print("[MotorControl] control timer error:", exc)
+            self._timer_failed = True
+            return None
+        self._control_timer = timer
+        return self._timer_flag
+
+    def _stop_control_timer(self):
+        timer = self._control_timer
+        self._control_timer = None
+        if timer is not None:
             try:
-                self._ensure_hw()
-                adc_start = _ticks_ms_int()
-                vt_raw = self._adc_read_volts(self._adc_t)
-                vb_raw = self._adc_read_volts(self._adc_b)
-                adc_elapsed = _ticks_diff_int(_ticks_ms_int(), adc_start)
-                self._timing_stats["adc"]["last"] = adc_elapsed
-                self._timing_stats["adc"]["avg"] = _low_pass(self._timing_stats["adc"].get("avg"), adc_elapsed, 0.2)
-
-                compute_start = _ticks_ms_int()
-                sensors_elapsed = 0
-                control_elapsed = 0
-                post_elapsed = 0
-                vt = self._calibrate_adc(vt_raw, "throttle")
-                vb = self._calibrate_adc(vb_raw, "brake")
-                if vt is None:
-                    vt = 0.0
-                if vb is None:
-                    vb = 0.0
-
-                raw_ratio = _throttle_ratio_from_adc(vt, self.cfg)
-                brake_threshold_cfg = self.cfg.get("brake_input_threshold", self.cfg.get("brake_threshold", 1.6))
-                try:
-                    brake_threshold = float(brake_threshold_cfg)
-                except Exception:
-                    brake_threshold = 1.6
-                brake_active = vb >= brake_threshold
-                if self._last_loop_ms is None:
+                timer.deinit()
+            except Exception:
+                pass
+
+    def set_control_timer(self, enabled=None):
+        """Switch between timer and coroutine pacing; applies on the next tick."""
+        if enabled is not None:
+            self.cfg["control_timer_enabled"] = bool(enabled)
+            self.reload_config()
+            self._timer_failed = False
+            self._deadline.reset()
+        return bool(self.cfg.get("control_timer_enabled"))
+
+    def _control_tick(self, loop_started, period_ms):
+        try:
+            self._ensure_hw()
+            adc_start = _ticks_ms_int()
+            vt_raw = self._adc_read_volts(self._adc_t)
+            vb_raw = self._adc_read_volts(self._adc_b)
+            adc_elapsed = _ticks_diff_int(_ticks_ms_int(), adc_start)
+            self._timing_stats["adc"]["last"] = adc_elapsed
+            self._timing_stats["adc"]["avg"] = _low_pass(self._timing_stats["adc"].get("avg"), adc_elapsed, 0.2)
+
+            compute_start = _ticks_ms_int()
+            sensors_elapsed = 0
+            control_elapsed = 0
+            post_elapsed = 0
+            vt = self._calibrate_adc(vt_raw, "throttle")
+            vb = self._calibrate_adc(vb_raw, "brake")
+            if vt is None:
+                vt = 0.0
+            if vb is None:
+                vb = 0.0
+
+            cc = self._cc
+            raw_ratio = _throttle_ratio_from_adc(vt, cc)
+            brake_threshold = cc.brake_threshold
+            brake_active = vb >= brake_threshold
+            if self._last_loop_ms is None:
+                dt_ms = period_ms
+            else:
+                dt_ms = _ticks_diff_int(loop_started, self._last_loop_ms)
+                if dt_ms <= 0:
                     dt_ms = period_ms
-                else:
-                    dt_ms = _ticks_diff_int(loop_started, self._last_loop_ms)
-                    if dt_ms <= 0:
-                        dt_ms = period_ms
-                self._last_loop_ms = loop_started
-                try:
-                    dt_float = float(dt_ms)
-                except Exception:
-                    dt_float = float(period_ms)
-                self._loop_period_avg_ms = _low_pass(self._loop_period_avg_ms, dt_float, 0.2)
-                sensors_elapsed = _ticks_diff_int(_ticks_ms_int(), compute_start)
-                self._update_section_timing("sensors", sensors_elapsed)
-
-                control_start = _ticks_ms_int()
-                control_ratio = self._apply_control_mode(raw_ratio, brake_active=brake_active, dt_ms=dt_ms)
-                control_elapsed = _ticks_diff_int(_ticks_ms_int(), control_start)
-                self._update_section_timing("controller", control_elapsed)
-                if control_ratio is None:
-                    control_ratio = raw_ratio
-                control_ratio = _clamp(control_ratio, 0.0, 1.0)
-                if self._raw_ratio_override is not None:
-                    raw_ratio = _clamp(self._raw_ratio_override, 0.0, 1.0)
-                raw_ratio = _clamp(raw_ratio, 0.0, 1.0)
-
-                post_start = _ticks_ms_int()
+            self._last_loop_ms = loop_started
+            try:
+                dt_float = float(dt_ms)
+            except Exception:
+                dt_float = float(period_ms)
+            self._loop_period_avg_ms = _low_pass(self._loop_period_avg_ms, dt_float, 0.2)
+            sensors_elapsed = _ticks_diff_int(_ticks_ms_int(), compute_start)
+            self._update_section_timing("sensors", sensors_elapsed)
+
+            control_start = _ticks_ms_int()
+            control_ratio = self._apply_control_mode(raw_ratio, brake_active=brake_active, dt_ms=dt_ms)
+            control_elapsed = _ticks_diff_int(_ticks_ms_int(), control_start)
+            self._update_section_timing("controller", control_elapsed)
+            if control_ratio is None:
+                control_ratio = raw_ratio
+            control_ratio = _clamp(control_ratio, 0.0, 1.0)
+            if self._raw_ratio_override is not None:
+                raw_ratio = _clamp(self._raw_ratio_override, 0.0, 1.0)
+            raw_ratio = _clamp(raw_ratio, 0.0, 1.0)
+
+            post_start = _ticks_ms_int()
+            lut = cc.lut
+            if lut is not None:
+                code_th, code_br = lut.codes(vb, control_ratio)
+            else:
                 out_tr, out_br = compute_output_voltages(
                     vt,
                     vb,
-                    self.cfg,
+                    cc,
                     control_ratio=control_ratio,
                     raw_ratio=raw_ratio,
                 )
-
-                state = self._state
-                guard_voltage = None
-                guard_active = False
-                if state is not None:
-                    guard_active = bool(getattr(state, "battery_guard_active", False))
-                    guard_voltage = getattr(state, "battery_guard_throttle_v", None)
-                if guard_active and guard_voltage is not None:
-                    try:
-                        guard_value = float(guard_voltage)
-                    except Exception:
-                        guard_value = None
-                    if guard_value is not None:
-                        if out_tr > guard_value:
-                            out_tr = guard_value
-                        if state is not None:
-                            state.battery_guard_applied = True
-                    else:
-                        if state is not None:
-                            state.battery_guard_applied = False
+                code_th = _volts_to_dac12(out_tr, cc.dac_vref)
+                code_br = _volts_to_dac12(out_br, cc.dac_vref)
+
+            state = self._state
+            guard_voltage = None
+            guard_active = False
+            if state is not None:
+                guard_active = bool(getattr(state, "battery_guard_active", False))
+                guard_voltage = getattr(state, "battery_guard_throttle_v", None)
+            if guard_active and guard_voltage is not None:
+                try:
+                    guard_value = float(guard_voltage)
+                except Exception:
+                    guard_value = None
+                if guard_value is not None:
+                    guard_code = _volts_to_dac12(guard_value, cc.dac_vref)
+                    if code_th > guard_code:
+                        code_th = guard_code
+                    if state is not None:
+                        state.battery_guard_applied = True
                 else:
                     if state is not None:
                         state.battery_guard_applied = False
-
-                code_th = _volts_to_dac12(out_tr, self.cfg["dac_vref"])
-                code_br = _volts_to_dac12(out_br, self.cfg["dac_vref"])
-                post_elapsed = _ticks_diff_int(_ticks_ms_int(), post_start)
-                self._update_section_timing("post", post_elapsed)
-
-                compute_elapsed = _ticks_diff_int(_ticks_ms_int(), compute_start)
-                self._timing_stats["compute"]["last"] = compute_elapsed
-                self._timing_stats["compute"]["avg"] = _low_pass(self._timing_stats["compute"].get("avg"), compute_elapsed, 0.2)
-                other_elapsed = compute_elapsed - (sensors_elapsed + control_elapsed + post_elapsed)
-                if other_elapsed < 0:
-                    other_elapsed = 0
-                self._update_section_timing("other", other_elapsed)
-
-                dac_start = _ticks_ms_int()
-                try:
-                    write_th = getattr(self._dac_th, "write", None)
-                    if callable(write_th):
-                        result = write_th(code_th)
-                        if result is False:
-                            raise RuntimeError("write returned False")
-                        self._report_dac_ok("throttle")
-                    elif self._dac_th is None:
-                        self._report_dac_error("throttle", "not available")
-                except Exception as exc:
-                    self._report_dac_error("throttle", exc)
-                try:
-                    write_br = getattr(self._dac_br, "write", None)
-                    if callable(write_br):
-                        result = write_br(code_br)
-                        if result is False:
-                            raise RuntimeError("write returned False")
-                        self._report_dac_ok("brake")
-                    elif self._dac_br is None:
-                        self._report_dac_error("brake", "not available")
-                except Exception as exc:
-                    self._report_dac_error("brake", exc)
-                dac_elapsed = _ticks_diff_int(_ticks_ms_int(), dac_start)
-                self._timing_stats["dac"]["last"] = dac_elapsed
-                self._timing_stats["dac"]["avg"] = _low_pass(self._timing_stats["dac"].get("avg"), dac_elapsed, 0.2)
-
-                self.last_vt_raw = vt_raw if vt_raw is not None else vt
-                self.last_vb_raw = vb_raw if vb_raw is not None else vb
-                self.last_vt = vt
-                self.last_vb = vb
-                self.last_code_th = code_th
-                self.last_code_br = code_br
-                self.last_dac_throttle_v = out_tr
-                self.last_dac_brake_v = out_br
-                self.brake_active = vb >= brake_threshold
-                self.last_ratio_raw = raw_ratio
-                self.last_ratio_control = control_ratio
-
-                if self._state is not None:
-                    try:
-                        self._state.throttle_v = vt
-                        self._state.brake_v = vb
-                        self._state.brake_v_raw = self.last_vb_raw
-                        self._state.throttle_v_raw = self.last_vt_raw
-                        self._state.dac_throttle_v = out_tr
-                        self._state.dac_brake_v = out_br
-                        self._state.throttle_ratio_raw = raw_ratio
-                        self._state.throttle_ratio_control = control_ratio
-                        try:
-                            current_mode = str(self.cfg.get("throttle_mode", "") or "")
-                        except Exception:
-                            current_mode = ""
-                        self._state.throttle_mode_active = current_mode.lower()
-                        self._state.motor_control = self
-                    except Exception:
-                        pass
-            except Exception as exc:
-                print("[MotorControl] loop error:", exc)
-            elapsed = _ticks_diff_int(_ticks_ms_int(), loop_started)
-            wait_ms = period_ms - max(0, int(elapsed))
-            if wait_ms > 0:
-                await asyncio.sleep_ms(wait_ms)
             else:
-                await asyncio.sleep_ms(0)
+                if state is not None:
+                    state.battery_guard_applied = False
+
+            out_tr = code_th * cc.dac_lsb_v
+            out_br = code_br * cc.dac_lsb_v
+            post_elapsed = _ticks_diff_int(_ticks_ms_int(), post_start)
+            self._update_section_timing("post", post_elapsed)
+
+            compute_elapsed = _ticks_diff_int(_ticks_ms_int(), compute_start)
+            self._timing_stats["compute"]["last"] = compute_elapsed
+            self._timing_stats["compute"]["avg"] = _low_pass(self._timing_stats["compute"].get("avg"), compute_elapsed, 0.2)
+            other_elapsed = compute_elapsed - (sensors_elapsed + control_elapsed + post_elapsed)
+            if other_elapsed < 0:
+                other_elapsed = 0
+            self._update_section_timing("other", other_elapsed)
+
+            dac_start = _ticks_us_int()
+            self._write_dacs(code_th, code_br, loop_started)
+            dac_elapsed = _ticks_diff_int(_ticks_us_int(), dac_start) / 1000.0
+            self._timing_stats["dac"]["last"] = dac_elapsed
+            self._timing_stats["dac"]["avg"] = _low_pass(self._timing_stats["dac"].get("avg"), dac_elapsed, 0.2)
+
+            self.last_vt_raw = vt_raw if vt_raw is not None else vt
+            self.last_vb_raw = vb_raw if vb_raw is not None else vb
+            self.last_vt = vt
+            self.last_vb = vb
+            self.last_code_th = code_th
+            self.last_code_br = code_br
+            self.last_dac_throttle_v = out_tr
+            self.last_dac_brake_v = out_br
+            self.brake_active = vb >= brake_threshold
+            self.last_ratio_raw = raw_ratio
+            self.last_ratio_control = control_ratio
+
+            if self._state is not None:
+                try:
+                    self._state.throttle_v = vt
+                    self._state.brake_v = vb
+                    self._state.brake_v_raw = self.last_vb_raw
+                    self._state.throttle_v_raw = self.last_vt_raw
+                    self._state.dac_throttle_v = out_tr
+                    self._state.dac_brake_v = out_br
+                    self._state.throttle_ratio_raw = raw_ratio
+                    self._state.throttle_ratio_control = control_ratio
+                    self._state.throttle_mode_active = cc.mode
+                    self._state.motor_control = self
+                except Exception:
+                    pass
+        except Exception as exc:
+            print("[MotorControl] loop error:", exc)
+
 
     def _monitor_adc_percent(self, voltage):
         if voltage is None:
@@ -1030,8 +1575,9 @@ class MotorControl:
         mode = str(self.cfg.get("throttle_mode", "power") or "").lower()
         throttle_factor = _clamp(float(self.cfg.get("throttle_factor", 1.0) or 1.0), 0.0, 1.0)
         target_ratio = _clamp(raw_ratio * throttle_factor, 0.0, 1.0)
-        power_w = self._extract_power_w()
-        speed_kmh = self._extract_speed_kmh()
+        frame = self._pr_frame()
+        power_w = self._extract_power_w(frame)
+        speed_kmh = self._extract_speed_kmh(frame)
         torque = None
         if power_w is not None:
             speed_mps = max((speed_kmh or 0.0) / 3.6, 0.3)
@@ -1108,10 +1654,13 @@ class MotorControl:
             "timing": {
                 "adc": self._timing_stats["adc"].get("avg"),
                 "dac": self._timing_stats["dac"].get("avg"),
+                "dac_writes": self._timing_stats["dac"].get("writes", 0),
+                "dac_skipped": self._timing_stats["dac"].get("skipped", 0),
                 "compute": self._timing_stats["compute"].get("avg"),
                 "sections": sections_snapshot,
                 "controller": controller_sections,
             },
+            "jitter": self._deadline.snapshot(self._pacing),
             "pid_debug": pid_debug,
         }
 
@@ -1187,7 +1736,10 @@ class MotorControl:
                 if comp is not None:
                     parts.append("CPU={:.0f}ms".format(comp))
                 if dac is not None:
-                    parts.append("DAC={:.0f}ms".format(dac))
+                    parts.append("DAC={:.2f}ms".format(dac))
+                dac_total = (timing.get("dac_writes") or 0) + (timing.get("dac_skipped") or 0)
+                if dac_total:
+                    parts.append("skip={:.0f}%".format(100.0 * (timing.get("dac_skipped") or 0) / dac_total))
                 sections = timing.get("sections") or {}
                 section_parts = []
                 for key, label in (("sensors", "sens"), ("controller", "ctrl"), ("post", "post"), ("other", "other")):
@@ -1222,6 +1774,16 @@ class MotorControl:
                         else:
                             body = "ctrl[{}]".format(ctrl_detail)
                     timing_desc = "timing[{}]".format(body)
+            jitter = snapshot.get("jitter") or {}
+            if jitter.get("ticks") and jitter.get("avg_ms") is not None:
+                jitter_desc = "jitter[{} avg={:.1f}ms max={:.1f}ms miss={} over={}]".format(
+                    jitter.get("pacing") or "?",
+                    jitter["avg_ms"],
+                    jitter.get("max_ms") or 0.0,
+                    jitter.get("missed", 0),
+                    jitter.get("overruns", 0),
+                )
+                timing_desc = "{} {}".format(timing_desc, jitter_desc) if timing_desc else jitter_desc
 
         if metric is not None:
             name = metric.get("name", "metric")
@@ -1324,13 +1886,9 @@ class MotorControl:
         return " | ".join(parts)
 
     def _refresh_monitor_task(self):
-        enabled = bool(self.cfg.get("monitor_control_enabled"))
-        period_ms_cfg = self.cfg.get("monitor_control_period_ms", 1000)
-        try:
-            period_ms = max(200, int(period_ms_cfg))
-        except Exception:
-            period_ms = 1000
-        if enabled:
+        cc = self._cc
+        period_ms = cc.monitor_period_ms
+        if cc.monitor_enabled:
             if self._monitor_task is not None:
                 return
             task = None
@@ -1371,6 +1929,7 @@ class MotorControl:
                 self.cfg["monitor_control_period_ms"] = max(200, int(period_ms))
             except Exception:
                 pass
+        self.reload_config()
         return bool(self.cfg["monitor_control_enabled"])
 
     def set_monitor_compact_mode(self, *, anomalies_only=None, delta_pct=None):
@@ -1401,6 +1960,7 @@ class MotorControl:
                 self.cfg["pid_timing_debug_period_ms"] = max(200, int(period_ms))
             except Exception:
                 pass
+        self.reload_config()
         return bool(self.cfg.get("pid_timing_debug_enabled"))
 
     async def monitor_control(self, period_ms=1000, *, once=False):
@@ -1434,6 +1994,64 @@ class MotorControl:
                 except Exception:
                     pass
 
+    def _write_dacs(self, code_th, code_br, now_ms):
+        # Codes the DACs already hold are skipped; every dac_refresh_ms both
+        # are rewritten anyway in case a DAC browned out and lost its value.
+        cc = self._cc
+        dac_th = self._dac_th
+        dac_br = self._dac_br
+        stats = self._timing_stats["dac"]
+        if dac_th is None:
+            self._report_dac_error("throttle", "not available")
+        if dac_br is None:
+            self._report_dac_error("brake", "not available")
+        refresh = _ticks_diff_int(now_ms, self._dac_written_ms) >= cc.dac_refresh_ms
+        need_th = dac_th is not None and (refresh or code_th != self._dac_code_th)
+        need_br = dac_br is not None and (refresh or code_br != self._dac_code_br)
+        if not (need_th or need_br):
+            stats["skipped"] += 1
+            return
+        stats["writes"] += 1
+        self._dac_written_ms = now_ms
+        chained = need_th and need_br and cc.dac_chain and self._dac_chain_failures < 3
+        if chained:
+            try:
+                if dac_write_pair(dac_th, code_th, dac_br, code_br):
+                    self._dac_chain_failures = 0
+                    self._dac_code_th = code_th
+                    self._dac_code_br = code_br
+                    self._report_dac_ok("throttle")
+                    self._report_dac_ok("brake")
+                    return
+            except Exception:
+                pass
+        ok_th = self._write_dac("throttle", dac_th, code_th) if need_th else True
+        ok_br = self._write_dac("brake", dac_br, code_br) if need_br else True
+        if chained and ok_th and ok_br:
+            # The DACs answer separately but not chained: likely no
+            # repeated-start support on this port.
+            self._dac_chain_failures += 1
+            if self._dac_chain_failures >= 3:
+                print("[MotorControl] chained DAC write failing; writing channels separately")
+
+    def _write_dac(self, kind, dac, code):
+        try:
+            if dac.write(code) is False:
+                raise RuntimeError("write returned False")
+        except Exception as exc:
+            if kind == "throttle":
+                self._dac_code_th = None
+            else:
+                self._dac_code_br = None
+            self._report_dac_error(kind, exc)
+            return False
+        if kind == "throttle":
+            self._dac_code_th = code
+        else:
+            self._dac_code_br = code
+        self._report_dac_ok(kind)
+        return True
+
     def _report_dac_error(self, kind, exc):
         self.dac_status[kind] = False
         if not self._dac_error_reported[kind]:
@@ -1457,6 +2075,16 @@ def _ticks_ms_int():
         return 0
 
 
+def _ticks_us_int():
+    value = time.ticks_us()
+    if value is None:
+        return 0
+    try:
+        return int(value)
+    except Exception:
+        return 0
+
+
 def _ticks_diff_int(now, then):
     try:
         return int(time.ticks_diff(int(now), int(then)))
@@ -0,0 +1,278 @@
+"""Array-backed store for the Phaserunner values held by AppState.
+
+Every known field has a fixed integer slot (``PR_*`` constants) into an
+``array('f')``; units come from a static table. Hot paths read
+``store.value(PR_BATTERY_CURRENT)`` without a lock, a dict lookup or a tuple.
+Names outside the table still work through a small locked dict so
+``get_pr``/``set_pr``/``snapshot_pr`` keep their ``(value, unit)`` contract.
+
+Consumers that need several values per tick take a :class:`TelemetryFrame`
+from ``store.frame()``: it is built once per new sample and then shared.
+"""
+
+import _thread
+
+try:
+    from array import array
+except ImportError:  # pragma: no cover
+    from uarray import array  # type: ignore
+
+from runtime.bridge_protocol import TELEMETRY_FIELDS
+
+NAN = float("nan")
+
+_UNITS = {
+    "battery_current": "A",
+    "vehicle_speed": "km/h",
+    "motor_input_power": "W",
+    "controller_temp": "C",
+    "motor_temp": "C",
+    "motor_rpm": "rpm",
+    "battery_voltage": "V",
+    "throttle_voltage": "V",
+    "brake_voltage_1": "V",
+    "digital_inputs": "",
+    "warnings": "",
+    "motor_current": "A",
+    "phase_a_current": "A",
+    "phase_b_current": "A",
+    "phase_c_current": "A",
+    "phase_a_voltage": "V",
+    "phase_b_voltage": "V",
+    "phase_c_voltage": "V",
+    "faults": "",
+    "soc": "%",
+    "battery_power": "W",
+    "last_fault": "",
+    "brake_voltage_2": "V",
+    "motor_speed_pct": "%",
+    "torque_command": "pu",
+    "torque_reference": "pu",
+    "speed_command": "pu",
+    "raw_temp_sensor_v": "V",
+}
+
+# Bridge catalogue order (so bridge field index == slot), AppState naming, plus
+# the pack voltage derived from power / current.
+PR_FIELDS = tuple("vehicle_speed_PR" if name == "vehicle_speed" else name for name in TELEMETRY_FIELDS) + (
+    "batt_voltage_calc",
+)
+PR_UNITS = tuple(_UNITS.get(name, "") for name in TELEMETRY_FIELDS) + ("V",)
+PR_SLOT_COUNT = len(PR_FIELDS)
+
+PR_SLOT = {name: idx for idx, name in enumerate(PR_FIELDS)}
+PR_SLOT["vehicle_speed"] = PR_SLOT["vehicle_speed_PR"]
+
+PR_BATTERY_CURRENT = PR_SLOT["battery_current"]
+PR_VEHICLE_SPEED = PR_SLOT["vehicle_speed_PR"]
+PR_MOTOR_INPUT_POWER = PR_SLOT["motor_input_power"]
+PR_CONTROLLER_TEMP = PR_SLOT["controller_temp"]
+PR_MOTOR_TEMP = PR_SLOT["motor_temp"]
+PR_MOTOR_RPM = PR_SLOT["motor_rpm"]
+PR_BATTERY_VOLTAGE = PR_SLOT["battery_voltage"]
+PR_THROTTLE_VOLTAGE = PR_SLOT["throttle_voltage"]
+PR_BRAKE_VOLTAGE_1 = PR_SLOT["brake_voltage_1"]
+PR_DIGITAL_INPUTS = PR_SLOT["digital_inputs"]
+PR_WARNINGS = PR_SLOT["warnings"]
+PR_MOTOR_CURRENT = PR_SLOT["motor_current"]
+PR_BATT_VOLTAGE_CALC = PR_SLOT["batt_voltage_calc"]
+
+
+class TelemetryFrame:
+    """Converted view of one PR sample; read-only, replaced rather than mutated.
+
+    Floats are ready to use; ``None`` means the value is not available.
+    ``battery_voltage_v`` falls back to the calculated pack voltage and
+    ``power_w`` to voltage * current when the controller does not report it.
+    """
+
+    __slots__ = (
+        "seq",
+        "stamp_ms",
+        "speed_kmh",
+        "power_w",
+        "battery_voltage_v",
+        "battery_current_a",
+        "batt_voltage_calc_v",
+        "controller_temp_c",
+        "motor_temp_c",
+        "motor_rpm",
+    )
+
+    def __init__(
+        self,
+        seq,
+        stamp_ms,
+        speed_kmh,
+        power_w,
+        battery_voltage_v,
+        battery_current_a,
+        batt_voltage_calc_v,
+        controller_temp_c,
+        motor_temp_c,
+        motor_rpm,
+    ):
+        self.seq = seq
+        self.stamp_ms = stamp_ms
+        self.speed_kmh = speed_kmh
+        self.power_w = power_w
+        self.battery_voltage_v = battery_voltage_v
+        self.battery_current_a = battery_current_a
+        self.batt_voltage_calc_v = batt_voltage_calc_v
+        self.controller_temp_c = controller_temp_c
+        self.motor_temp_c = motor_temp_c
+        self.motor_rpm = motor_rpm
+
+
+EMPTY_FRAME = TelemetryFrame(0, 0, None, None, None, None, None, None, None, None)
+
+
+class PRStore:
+    """Latest PR values by slot; optionally served from a :class:`TelemetryRing`.
+
+    When the bridge ring is attached (its fields must be ``PR_FIELDS``) reads
+    prefer its latest sample and fall back to values set locally.
+    """
+
+    def __init__(self):
+        self.values = array("f", [NAN] * PR_SLOT_COUNT)
+        self.extra = {}  # name -> (value, unit) for names without a slot
+        self.ring = None
+        self._lock = _thread.allocate_lock()
+        self._writes = 0
+        self._frame = EMPTY_FRAME
+        self._frame_key = (-1, -1)
+
+    def attach_ring(self, ring):
+        if ring is not None and tuple(ring.fields) != PR_FIELDS:
+            raise ValueError("ring fields do not match PR_FIELDS")
+        self.ring = ring
+
+    def value(self, slot, default=None):
+        ring = self.ring
+        if ring is not None:
+            value = ring.value(slot)
+            if value is not None:
+                return value
+        value = self.values[slot]
+        if value != value:
+            return default
+        return value
+
+    def set_value(self, slot, value):
+        self.values[slot] = NAN if value is None else value
+        self._writes += 1
+
+    def set(self, name, value, unit=""):
+        slot = PR_SLOT.get(name)
+        if slot is not None:
+            try:
+                self.values[slot] = NAN if value is None else value
+                self._writes += 1
+                return
+            except TypeError:
+                pass  # non-numeric payloads keep going through the dict
+        with self._lock:
+            self.extra[name] = (value, unit)
+
+    def get(self, name, default=(None, "")):
+        slot = PR_SLOT.get(name)
+        if slot is not None:
+            value = self.value(slot)
+            if value is not None:
+                return (value, PR_UNITS[slot])
+        with self._lock:
+            return self.extra.get(name, default)
+
+    def frame(self):
+        """Return the :class:`TelemetryFrame` for the latest sample (cached)."""
+        ring = self.ring
+        key = (ring.writes if ring is not None else 0, self._writes)
+        if key == self._frame_key:
+            return self._frame
+        seq = 0
+        stamp = 0
+        sample = None
+        if ring is not None:
+            latest = ring.latest()
+            if latest is not None:
+                sample, seq, _ts, stamp = latest
+        local = self.values
+
+        def pick(slot):
+            value = NAN
+            if sample is not None:
+                value = sample[slot]
+            if value != value:
+                value = local[slot]
+            if value != value:
+                return None
+            return value
+
+        current = pick(PR_BATTERY_CURRENT)
+        calc_v = pick(PR_BATT_VOLTAGE_CALC)
+        voltage = pick(PR_BATTERY_VOLTAGE)
+        if voltage is None:
+            voltage = calc_v
+        power = pick(PR_MOTOR_INPUT_POWER)
+        if power is None and voltage is not None and current is not None:
+            power = voltage * current
+        frame = TelemetryFrame(
+            seq,
+            stamp,
+            pick(PR_VEHICLE_SPEED),
+            power,
+            voltage,
+            current,
+            calc_v,
+            pick(PR_CONTROLLER_TEMP),
+            pick(PR_MOTOR_TEMP),
+            pick(PR_MOTOR_RPM),
+        )
+        self._frame = frame
+        self._frame_key = key
+        return frame
+
+    def snapshot(self):
+        with self._lock:
+            snap = dict(self.extra)
+        sample = None
+        ring = self.ring
+        if ring is not None:
+            sample = ring.latest()
+        local = self.values
+        for slot in range(PR_SLOT_COUNT):
+            value = NAN
+            if sample is not None:
+                value = sample[0][slot]
+            if value != value:
+                value = local[slot]
+            if value == value:
+                snap[PR_FIELDS[slot]] = (value, PR_UNITS[slot])
+        if "vehicle_speed_PR" in snap:
+            snap["vehicle_speed"] = snap["vehicle_speed_PR"]
+        return snap
+
+
+__all__ = [
+    "PRStore",
+    "TelemetryFrame",
+    "EMPTY_FRAME",
+    "PR_FIELDS",
+    "PR_UNITS",
+    "PR_SLOT",
+    "PR_SLOT_COUNT",
+    "PR_BATTERY_CURRENT",
+    "PR_VEHICLE_SPEED",
+    "PR_MOTOR_INPUT_POWER",
+    "PR_CONTROLLER_TEMP",
+    "PR_MOTOR_TEMP",
+    "PR_MOTOR_RPM",
+    "PR_BATTERY_VOLTAGE",
+    "PR_THROTTLE_VOLTAGE",
+    "PR_BRAKE_VOLTAGE_1",
+    "PR_DIGITAL_INPUTS",
+    "PR_WARNINGS",
+    "PR_MOTOR_CURRENT",
+    "PR_BATT_VOLTAGE_CALC",
+]
@@ -1,10 +1,24 @@
 """Minimal MSP (MultiWii Serial Protocol) helpers shared by both ESP32s."""
 
+try:
+    import ustruct as struct  # type: ignore
+except ImportError:  # pragma: no cover
+    import struct  # type: ignore
+
+try:
+    from array import array
+except ImportError:  # pragma: no cover
+    from uarray import array  # type: ignore
+
+from checksum import VIPER, xor8_update
+
 HEADER_0 = 0x24  # '$'
 HEADER_1 = 0x4D  # 'M'
 DIR_TO_DEVICE = 0x3C  # '<'
 DIR_FROM_DEVICE = 0x3E  # '>'
 MAX_PAYLOAD = 255
+FRAME_OVERHEAD = 6  # '$', 'M', direction, size, cmd, checksum
+MAX_FRAME = MAX_PAYLOAD + FRAME_OVERHEAD
 
 # Custom command identifiers (host<->offload)
 CMD_PING = 50
@@ -18,8 +32,58 @@ CMD_REBOOT = 57
 CMD_DEBUG = 58
 CMD_MAIN_ONLINE = 59
 CMD_SNAPSHOT = 60
+CMD_SET_FIELDS = 61
 CMD_TELEMETRY = 200
 
+# Link protocol revision exchanged through CMD_VERSION (2 = compact telemetry).
+PROTOCOL_VERSION = 2
+FEATURE_COMPACT_TELEMETRY = 0x01
+
+# CMD_TELEMETRY flags byte.
+TELEM_FLAG_SLOW = 0x01  # float frame carries the slow block
+TELEM_FLAG_COMPACT = 0x02  # int16 delta frame (CompactTelemetryCodec)
+TELEM_FLAG_KEYFRAME = 0x04  # compact frame carries every field
+TELEM_FLAG_LAYOUT = 0x08  # header is followed by a field-layout id byte
+TELEM_FLAG_MISSING = 0x10  # compact frame ends with a missing-field mask
+TELEMETRY_HEADER_LEN = 7  # flags, seq u16, ts u32
+COMPACT_KEYFRAME_EVERY = 20
+_RAW_MISSING = 0x10000  # outside int16 and uint16; never sent
+
+# Field catalogue for CMD_SET_FIELDS masks (bit n = TELEMETRY_FIELDS[n]).
+# Append only: the bit positions are part of the wire protocol.
+TELEMETRY_FIELDS = (
+    "battery_current",
+    "vehicle_speed",
+    "motor_input_power",
+    "controller_temp",
+    "motor_temp",
+    "motor_rpm",
+    "battery_voltage",
+    "throttle_voltage",
+    "brake_voltage_1",
+    "digital_inputs",
+    "warnings",
+    "motor_current",
+    "phase_a_current",
+    "phase_b_current",
+    "phase_c_current",
+    "phase_a_voltage",
+    "phase_b_voltage",
+    "phase_c_voltage",
+    "faults",
+    "soc",
+    "battery_power",
+    "last_fault",
+    "brake_voltage_2",
+    "motor_speed_pct",
+    "torque_command",
+    "torque_reference",
+    "speed_command",
+    "raw_temp_sensor_v",
+)
+FAST_DEFAULT_MASK = 0x007  # battery_current, vehicle_speed, motor_input_power
+SLOW_DEFAULT_MASK = 0x7F8  # controller_temp .. warnings
+
 RESP_OK = 0x00
 RESP_ERROR = 0x01
 RESP_UNSUPPORTED = 0x02
@@ -27,12 +91,42 @@ RESP_BUSY = 0x03
 
 
 def _checksum(size, cmd, payload):
+    # Without viper the call into checksum.py costs more than the XOR itself.
+    if VIPER:
+        return xor8_update(size ^ cmd, payload)
     checksum = size ^ cmd
     for byte in payload:
         checksum ^= byte
     return checksum & 0xFF
 
 
+def fields_to_mask(names):
+    """Return the CMD_SET_FIELDS bitmask for ``names`` (unknown names raise)."""
+    mask = 0
+    for name in names:
+        try:
+            mask |= 1 << TELEMETRY_FIELDS.index(name)
+        except ValueError:
+            raise ValueError("unknown telemetry field: {}".format(name))
+    return mask
+
+
+def mask_to_fields(mask):
+    """Return the catalogue names selected by ``mask`` in wire order."""
+    names = []
+    for idx, name in enumerate(TELEMETRY_FIELDS):
+        if mask & (1 << idx):
+            names.append(name)
+    return tuple(names)
+
+
+def telemetry_data_offset(payload):
+    """Return ``(layout_id, offset)`` of the field data after the telemetry header."""
+    if payload[0] & TELEM_FLAG_LAYOUT:
+        return payload[TELEMETRY_HEADER_LEN], TELEMETRY_HEADER_LEN + 1
+    return 0, TELEMETRY_HEADER_LEN
+
+
 def build_frame(direction, cmd, payload=b""):
     if payload is None:
         payload = b""
@@ -136,6 +230,388 @@ class MSPParser:
             self.reset()
 
 
+class MSPFrame:
+    """Reusable frame view handed out by :class:`MSPStreamParser`.
+
+    ``payload`` is a memoryview into the parser buffer, built on first access
+    (``offset``/``size`` locate it without one) and only valid until the next
+    frame is requested; copy it with ``bytes()`` to keep it. ``get()`` mirrors
+    the dict frames returned by :meth:`MSPParser.feed`.
+    """
+
+    __slots__ = ("direction", "cmd", "size", "offset", "_mv")
+
+    def __init__(self, mv=None):
+        self.direction = 0
+        self.cmd = 0
+        self.size = 0
+        self.offset = 0
+        self._mv = mv
+
+    @property
+    def payload(self):
+        if self._mv is None:
+            return b""
+        return self._mv[self.offset:self.offset + self.size]
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+class MSPStreamParser:
+    """Chunk-oriented MSP parser that avoids per-byte state and allocations.
+
+    Incoming UART chunks are copied into a preallocated ring-less buffer, the
+    buffer is scanned for ``$M`` headers and size/checksum are validated in
+    place. Complete frames are yielded as one reused :class:`MSPFrame` whose
+    payload is a memoryview slice of the buffer. Scanned bytes are only
+    compacted away when the tail of the buffer runs out of room. Error counters match
+    :class:`MSPParser` (a bad checksum discards the whole frame).
+    """
+
+    __slots__ = ("_buf", "_mv", "_len", "_pos", "_src", "_src_off", "_frame", "errors")
+
+    def __init__(self, capacity=MAX_FRAME * 2):
+        if capacity < MAX_FRAME:
+            capacity = MAX_FRAME
+        self._buf = bytearray(capacity)
+        self._mv = memoryview(self._buf)
+        self._len = 0
+        self._pos = 0
+        self._src = None
+        self._src_off = 0
+        self._frame = MSPFrame(self._mv)
+        self.errors = {"framing": 0, "checksum": 0}
+
+    def reset(self):
+        self._len = 0
+        self._pos = 0
+        self._src = None
+
+    def pending(self):
+        return self._len - self._pos
+
+    def push(self, data):
+        """Queue ``data`` for :meth:`next_frame`."""
+        if isinstance(data, int):
+            data = bytes([data])
+        total = len(data)
+        if total <= len(self._buf) - self._len:
+            # Common case: the chunk fits behind the pending bytes.
+            self._buf[self._len:self._len + total] = data
+            self._len += total
+        else:
+            self._src = data
+            self._src_off = 0
+            self._refill()
+
+    def next_frame(self):
+        """Return the next complete frame, or None once the pushed data is used up.
+
+        The frame is valid until the next call. Unlike iterating
+        :meth:`frames` this allocates neither a generator nor a StopIteration.
+        """
+        while True:
+            frame = self._scan()
+            if frame is not None or self._src is None:
+                return frame
+            self._refill()
+
+    def frames(self, data):
+        """Iterate the frames completed by ``data``; each view dies on the next step."""
+        self.push(data)
+        return self
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        frame = self.next_frame()
+        if frame is None:
+            raise StopIteration
+        return frame
+
+    def feed(self, data):
+        """Compatibility wrapper returning dict frames like :class:`MSPParser`."""
+        frames = []
+        for frame in self.frames(data):
+            frames.append(
+                {
+                    "direction": frame.direction,
+                    "cmd": frame.cmd,
+                    "payload": bytes(frame.payload),
+                }
+            )
+        return frames
+
+    def _refill(self):
+        # Move the unscanned tail to the front, then copy as much of the
+        # oversized chunk as fits.
+        pos = self._pos
+        end = self._len
+        mv = self._mv
+        if pos:
+            remaining = end - pos
+            if remaining:
+                mv[0:remaining] = mv[pos:end]
+            self._len = end = remaining
+            self._pos = 0
+        src = self._src
+        offset = self._src_off
+        take = len(src) - offset
+        room = len(self._buf) - end
+        if take > room:
+            take = room
+        mv[end:end + take] = memoryview(src)[offset:offset + take]
+        self._len = end + take
+        offset += take
+        if offset >= len(src):
+            self._src = None
+        else:
+            self._src_off = offset
+
+    def _scan(self):
+        buf = self._buf
+        end = self._len
+        errors = self.errors
+        pos = self._pos
+        while True:
+            while pos < end and buf[pos] != HEADER_0:
+                pos += 1
+            if pos + 1 >= end:
+                break
+            if buf[pos + 1] != HEADER_1:
+                pos += 1
+                continue
+            if pos + 5 > end:
+                break
+            size = buf[pos + 3]
+            if size > MAX_PAYLOAD:
+                errors["framing"] += 1
+                pos += 4
+                continue
+            stop = pos + 5 + size
+            if stop >= end:
+                break
+            if VIPER:
+                checksum = xor8_update(size ^ buf[pos + 4], buf, pos + 5, stop)
+            else:
+                checksum = size ^ buf[pos + 4]
+                for idx in range(pos + 5, stop):
+                    checksum ^= buf[idx]
+            if checksum != buf[stop]:
+                errors["checksum"] += 1
+                pos = stop + 1
+                continue
+            frame = self._frame
+            frame.direction = buf[pos + 2]
+            frame.cmd = buf[pos + 4]
+            frame.size = size
+            frame.offset = pos + 5
+            self._pos = stop + 1
+            return frame
+        if pos >= end:
+            self._len = 0
+            pos = 0
+        elif self._len == len(buf) and self._src is None:
+            # Full buffer holding one partial frame: make room for the next feed.
+            remaining = end - pos
+            self._mv[0:remaining] = self._mv[pos:end]
+            self._len = remaining
+            pos = 0
+        self._pos = pos
+        return None
+
+
+class CompactTelemetryCodec:
+    """Fixed-point delta codec for CMD_TELEMETRY.
+
+    Payload: the usual 7 byte header (flags carry ``TELEM_FLAG_COMPACT``), the
+    layout id byte when ``layout`` is non-zero, a change mask over ``names``
+    (``<H``, or ``<I`` above 16 fields) and one little-endian int16 per set bit,
+    in field order, holding the native Phaserunner register value (``value *
+    scale``). A set bit whose reading is missing carries no int16; instead the
+    frame sets ``TELEM_FLAG_MISSING`` and ends with a second mask of those
+    fields, so the full int16/uint16 range (e.g. a 0xFFFF fault bitmap) stays
+    usable. Keyframes set every bit. The encoder remembers the last raw value
+    per field; the decoder updates ``values`` in place and returns the mask
+    of fields that changed.
+    """
+
+    __slots__ = (
+        "names",
+        "fast_count",
+        "keyframe_every",
+        "values",
+        "seq",
+        "ts",
+        "flags",
+        "synced",
+        "layout",
+        "_mask_fmt",
+        "_mask_size",
+        "_scales",
+        "_signed",
+        "_raw",
+        "_since_key",
+        "_buf",
+    )
+
+    def __init__(self, names, registers, fast_count=0, keyframe_every=COMPACT_KEYFRAME_EVERY, layout=0):
+        count = len(names)
+        if count > 32:
+            raise ValueError("compact telemetry supports up to 32 fields")
+        self.names = tuple(names)
+        self.fast_count = fast_count
+        self.keyframe_every = keyframe_every
+        self.values = [None] * count
+        self.seq = 0
+        self.ts = 0
+        self.flags = 0
+        self.synced = False
+        self.layout = layout & 0xFF
+        if count > 16:
+            self._mask_fmt = "<I"
+            self._mask_size = 4
+        else:
+            self._mask_fmt = "<H"
+            self._mask_size = 2
+        scales = []
+        signed = []
+        for name in self.names:
+            meta = registers.get(name) or {}
+            scales.append(meta.get("scale", 1) or 1)
+            signed.append(bool(meta.get("signed", True)))
+        self._scales = tuple(scales)
+        self._signed = tuple(signed)
+        self._raw = array("l", [_RAW_MISSING] * count)
+        self._since_key = keyframe_every
+        self._buf = bytearray(TELEMETRY_HEADER_LEN + 1 + 2 * self._mask_size + 2 * count)
+
+    def reset(self):
+        """Force a keyframe on the next encode / wait for one when decoding."""
+        self._since_key = self.keyframe_every
+        self.synced = False
+        for idx in range(len(self.values)):
+            self.values[idx] = None
+
+    def _to_raw(self, idx, value):
+        if value is None or value != value:
+            return _RAW_MISSING
+        try:
+            raw = int(round(float(value) * self._scales[idx]))
+        except Exception:
+            return _RAW_MISSING
+        if self._signed[idx]:
+            if raw < -32768:
+                return -32768
+            if raw > 32767:
+                return 32767
+            return raw
+        if raw < 0:
+            return 0
+        if raw > 0xFFFF:
+            return 0xFFFF
+        return raw
+
+    def encode(self, seq, ts, fast, slow=None, keyframe=False):
+        """Encode the fields from ``fast`` (first ``fast_count``) and ``slow``."""
+        buf = self._buf
+        raw_prev = self._raw
+        if self._since_key >= self.keyframe_every:
+            keyframe = True
+        flags = TELEM_FLAG_COMPACT
+        if keyframe:
+            flags |= TELEM_FLAG_KEYFRAME
+            self._since_key = 0
+        else:
+            self._since_key += 1
+        if slow is not None:
+            flags |= TELEM_FLAG_SLOW
+        mask_at = TELEMETRY_HEADER_LEN
+        if self.layout:
+            flags |= TELEM_FLAG_LAYOUT
+            buf[mask_at] = self.layout
+            mask_at += 1
+        struct.pack_into("<BHI", buf, 0, flags, seq & 0xFFFF, ts & 0xFFFFFFFF)
+        mask = 0
+        missing = 0
+        offset = mask_at + self._mask_size
+        fast_count = self.fast_count
+        names = self.names
+        for idx in range(len(names)):
+            src = fast if idx < fast_count else slow
+            if src is None:
+                if not keyframe:
+                    continue
+                raw = raw_prev[idx]
+            else:
+                raw = self._to_raw(idx, src.get(names[idx]))
+                if not keyframe and raw == raw_prev[idx]:
+                    continue
+            raw_prev[idx] = raw
+            mask |= 1 << idx
+            if raw == _RAW_MISSING:
+                missing |= 1 << idx
+                continue
+            struct.pack_into("<h" if self._signed[idx] else "<H", buf, offset, raw)
+            offset += 2
+        struct.pack_into(self._mask_fmt, buf, mask_at, mask)
+        if missing:
+            buf[0] = flags | TELEM_FLAG_MISSING
+            struct.pack_into(self._mask_fmt, buf, offset, missing)
+            offset += self._mask_size
+        return bytes(memoryview(buf)[:offset])
+
+    def decode(self, payload):
+        """Apply a compact payload to ``values``; return the changed-field mask or None."""
+        size = len(payload)
+        if size < TELEMETRY_HEADER_LEN + self._mask_size:
+            return None
+        flags, seq, ts = struct.unpack_from("<BHI", payload, 0)
+        if not flags & TELEM_FLAG_COMPACT:
+            return None
+        layout, offset = telemetry_data_offset(payload)
+        if layout != self.layout or offset + self._mask_size > size:
+            return None
+        mask = struct.unpack_from(self._mask_fmt, payload, offset)[0]
+        offset += self._mask_size
+        missing = 0
+        if flags & TELEM_FLAG_MISSING:
+            size -= self._mask_size
+            if size < offset:
+                return None
+            missing = struct.unpack_from(self._mask_fmt, payload, size)[0]
+        values = self.values
+        count = len(values)
+        changed = 0
+        idx = 0
+        bits = mask
+        while bits:
+            if idx >= count:
+                return None
+            if bits & 1:
+                if missing & (1 << idx):
+                    value = None
+                else:
+                    if offset + 2 > size:
+                        return None
+                    raw = struct.unpack_from("<h" if self._signed[idx] else "<H", payload, offset)[0]
+                    value = raw / self._scales[idx]
+                    offset += 2
+                if values[idx] != value:
+                    values[idx] = value
+                    changed |= 1 << idx
+            bits >>= 1
+            idx += 1
+        if flags & TELEM_FLAG_KEYFRAME:
+            self.synced = True
+        self.flags = flags
+        self.seq = seq
+        self.ts = ts
+        return changed
+
+
 __all__ = [
     "DIR_TO_DEVICE",
     "DIR_FROM_DEVICE",
@@ -150,11 +626,29 @@ __all__ = [
     "CMD_DEBUG",
     "CMD_MAIN_ONLINE",
     "CMD_SNAPSHOT",
+    "CMD_SET_FIELDS",
     "CMD_TELEMETRY",
+    "PROTOCOL_VERSION",
+    "FEATURE_COMPACT_TELEMETRY",
+    "TELEM_FLAG_SLOW",
+    "TELEM_FLAG_COMPACT",
+    "TELEM_FLAG_KEYFRAME",
+    "TELEM_FLAG_LAYOUT",
+    "TELEM_FLAG_MISSING",
+    "TELEMETRY_HEADER_LEN",
+    "TELEMETRY_FIELDS",
+    "FAST_DEFAULT_MASK",
+    "SLOW_DEFAULT_MASK",
+    "fields_to_mask",
+    "mask_to_fields",
+    "telemetry_data_offset",
     "RESP_OK",
     "RESP_ERROR",
     "RESP_UNSUPPORTED",
     "RESP_BUSY",
     "build_frame",
     "MSPParser",
+    "MSPFrame",
+    "MSPStreamParser",
+    "CompactTelemetryCodec",
 ]
@@ -166,6 +166,12 @@ def save_motor_config(cfg, config_path=MOTOR_CONFIG_FILE):
     for key, value in cfg.items():
         if isinstance(value, (int, float, str, bool)) or value is None:
             payload[key] = value
+        elif isinstance(value, (list, tuple)):
+            # ADC linearity tables: [[raw_volts, true_volts], ...]
+            try:
+                payload[key] = [[float(a), float(b)] for a, b in value]
+            except Exception:
+                continue
         else:
             try:
                 payload[key] = float(value)
@@ -203,6 +209,9 @@ def create_motor_control(cfg, config_file=MOTOR_CONFIG_FILE):
                 current_cfg.update(cfg)
             except Exception:
                 pass
+        reload_fn = getattr(motor, "reload_config", None)
+        if callable(reload_fn):
+            reload_fn()
         return motor
     print("[Motor] init: unsupported constructor signature")
     return FallbackMotorControl(cfg, reason="unsupported constructor")
@@ -9,37 +9,54 @@ try:
 except Exception:  # pragma: no cover
     import struct  # type: ignore
 
-from HW import PR_UART_ID, PR_UART_TX, PR_UART_RX, PR_UART_BAUD
-from runtime import bridge_protocol as proto
+try:
+    import uasyncio as asyncio  # type: ignore
+except ImportError:  # pragma: no cover
+    import asyncio  # type: ignore
 
+try:
+    import uselect as select  # type: ignore
+except ImportError:  # pragma: no cover
+    try:
+        import select  # type: ignore
+    except ImportError:
+        select = None
 
-_REGISTER_UNITS = {
-    "battery_current": "A",
-    "vehicle_speed": "km/h",
-    "motor_input_power": "W",
-    "controller_temp": "C",
-    "motor_temp": "C",
-    "motor_rpm": "rpm",
-    "battery_voltage": "V",
-    "throttle_voltage": "V",
-    "brake_voltage_1": "V",
-    "digital_inputs": "",
-    "warnings": "",
-}
+from HW import PR_UART_ID, PR_UART_TX, PR_UART_RX, PR_UART_BAUD
+from phaserunner.registers import PR_REGISTERS
+from runtime import bridge_protocol as proto
+from runtime.telemetry_ring import TelemetryRing
+from pr_store import PR_FIELDS, PR_UNITS, PR_BATT_VOLTAGE_CALC
 
 
 _STATE_ALIAS = {"vehicle_speed": "vehicle_speed_PR"}
 
-_CMD_QUEUE = []
+# The ring uses the AppState slot layout (pr_store.PR_FIELDS) and keeps a short
+# history of full samples.
+PR_STATE_FIELDS = PR_FIELDS
+_RING_CAPACITY = 16
+_RING = TelemetryRing(PR_FIELDS, PR_UNITS, capacity=_RING_CAPACITY)
+_CALC_V_SLOT = PR_BATT_VOLTAGE_CALC
+# Catalogue index == ring slot for bridge fields.
+_FIELD_SLOT = {name: idx for idx, name in enumerate(proto.TELEMETRY_FIELDS)}
+
 _CMD_LOCK = _thread.allocate_lock()
 _PENDING_RESPONSES = {}
 _PENDING_LOCK = _thread.allocate_lock()
-_PAYLOAD_LOCK = _thread.allocate_lock()
+_LAYOUT_LOCK = _thread.allocate_lock()
 _STATUS_LOCK = _thread.allocate_lock()
+_TX_LOCK = _thread.allocate_lock()
 
 _NEXT_REQ_ID = 1
-_LAST_PAYLOAD = None
 _LAST_ERRORS = {}
+
+# Responses nobody is waiting for yet: req_id -> (resp, ticks_ms). Bounded and
+# expired after _RESPONSE_TTL_MS so unclaimed replies cannot pile up.
+_PENDING_MAX = 16
+_RESPONSE_TTL_MS = 3000
+# Async waiters: req_id -> _Completion, capped at _MAX_IN_FLIGHT.
+_WAITERS = {}
+_MAX_IN_FLIGHT = 8
 _BRIDGE_STATUS = {
     "rx_frames": 0,
     "rx_errors": 0,
@@ -48,29 +65,88 @@ _BRIDGE_STATUS = {
     "last_rx_ms": 0,
     "last_error": "",
     "last_event": None,
+    "layout_drops": 0,
+    "wait_mode": "",
+    "wakeups": 0,
+    "telemetry_age_ms": None,
+    "telemetry_interval_avg_ms": None,
+    "rx_latency_avg_ms": None,
+    "rx_latency_max_ms": 0,
+    "cmd_rtt_last_ms": None,
+    "cmd_rtt_avg_ms": None,
+    "cmd_rtt_max_ms": 0,
+    "cmd_rtt_samples": 0,
+    "cmd_queue_depth": 0,
+    "cmd_queue_max_depth": 0,
+    "cmd_drops": 0,
+    "cmd_coalesced": 0,
+    "tx_batches": 0,
+    "tx_frames": 0,
 }
 
-MSP_FLAG_SLOW_INCLUDED = 0x01
-
-FAST_REGS = (
-    "battery_current",
-    "vehicle_speed",
-    "motor_input_power",
-)
-
-SLOW_REGS = (
-    "controller_temp",
-    "motor_temp",
-    "motor_rpm",
-    "battery_voltage",
-    "throttle_voltage",
-    "brake_voltage_1",
-    "digital_inputs",
-    "warnings",
-)
+# "poll": block in select.poll() on the UART and wake on RX; "sleep": the old
+# read + sleep_ms(10) loop (for ports without a pollable UART).
+WAIT_MODE = "poll"
+_IDLE_WAIT_MS = 50
+_RX_BUF_SIZE = 256
+_RTT_TRACK_MAX = 32
+_TX_BATCH_BYTES = 256
+
+# Writer handle shared with send_command() so callers can flush immediately.
+_UART = None
+_TX_BUF = bytearray(_TX_BATCH_BYTES)
+# req_id (16-bit, as echoed by the offload) -> ticks_ms when queued.
+_INFLIGHT = {}
+_LAST_RX_IDLE_MS = None
+
+MSP_FLAG_SLOW_INCLUDED = proto.TELEM_FLAG_SLOW
+# Ask the offload for compact delta telemetry (negotiated through CMD_VERSION).
+COMPACT_TELEMETRY = True
+_RESYNC_INTERVAL_MS = 500
+
+# Active field layout; replaced by _apply_layout() once the offload acks set_fields.
+FAST_REGS = proto.mask_to_fields(proto.FAST_DEFAULT_MASK)
+SLOW_REGS = proto.mask_to_fields(proto.SLOW_DEFAULT_MASK)
+_LAYOUT_ID = 0
 
 _LAST_SLOW_VALUES = {name: None for name in SLOW_REGS}
 
+_COMPACT_CODEC = None
+_COMPACT_CURRENT_IDX = -1
+_COMPACT_POWER_IDX = -1
+_COMPACT_CALC_V_MASK = 0
+_COMPACT_SLOTS = ()
+
+# Field subscriptions: owner -> (fast_mask, slow_mask), merged over the base set.
+_BASE_FAST_MASK = proto.FAST_DEFAULT_MASK
+_BASE_SLOW_MASK = proto.SLOW_DEFAULT_MASK
+_SUBSCRIPTIONS = {}
+_REQUESTED_MASKS = (proto.FAST_DEFAULT_MASK, proto.SLOW_DEFAULT_MASK)
+_NEXT_LAYOUT_ID = 1
+_LAST_RESYNC_MS = None
+
+
+def _build_compact_codec():
+    global _COMPACT_CODEC, _COMPACT_CURRENT_IDX, _COMPACT_POWER_IDX, _COMPACT_CALC_V_MASK
+    global _COMPACT_SLOTS
+    _COMPACT_CODEC = proto.CompactTelemetryCodec(
+        FAST_REGS + SLOW_REGS,
+        PR_REGISTERS,
+        fast_count=len(FAST_REGS),
+        layout=_LAYOUT_ID,
+    )
+    names = _COMPACT_CODEC.names
+    _COMPACT_SLOTS = tuple(_FIELD_SLOT.get(name, -1) for name in names)
+    _COMPACT_CURRENT_IDX = names.index("battery_current") if "battery_current" in names else -1
+    _COMPACT_POWER_IDX = names.index("motor_input_power") if "motor_input_power" in names else -1
+    if _COMPACT_CURRENT_IDX >= 0 and _COMPACT_POWER_IDX >= 0:
+        _COMPACT_CALC_V_MASK = (1 << _COMPACT_CURRENT_IDX) | (1 << _COMPACT_POWER_IDX)
+    else:
+        _COMPACT_CALC_V_MASK = 0
+
+
+_build_compact_codec()
+
 _COMMAND_NAME_TO_ID = {
     "ping": proto.CMD_PING,
     "snapshot": proto.CMD_SNAPSHOT,
@@ -87,7 +163,32 @@ _COMMAND_NAME_TO_ID = {
     "main_online": proto.CMD_MAIN_ONLINE,
     "version": proto.CMD_VERSION,
     "debug": proto.CMD_DEBUG,
+    "set_fields": proto.CMD_SET_FIELDS,
+}
+
+# Queue classes, drained in order: power state first, then link/poll control,
+# then diagnostics.
+PRIO_POWER = 0
+PRIO_CONTROL = 1
+PRIO_DIAG = 2
+_QUEUE_CLASS_SLOTS = 8
+_COMMAND_PRIORITY = {
+    "sleep": PRIO_POWER,
+    "sleep_now": PRIO_POWER,
+    "sleepnow": PRIO_POWER,
+    "reboot": PRIO_POWER,
+    "main_online": PRIO_POWER,
+    "set_rate": PRIO_CONTROL,
+    "set_fast": PRIO_CONTROL,
+    "set_slow": PRIO_CONTROL,
+    "poll": PRIO_CONTROL,
+    "set_fields": PRIO_CONTROL,
+    "version": PRIO_CONTROL,
+    "snapshot": PRIO_CONTROL,
 }
+# Commands where only the latest queued instance matters; a newer one replaces
+# the queued frame in place and inherits its waiters.
+_COALESCE = ("set_rate", "set_fast", "set_slow", "poll", "set_fields", "snapshot", "status", "debug")
 
 _POLL_ACTION_TO_BYTE = {
     "stop": 0,
@@ -111,24 +212,195 @@ def _with_lock(lock, fn):
     finally:
         lock.release()
 
-def _pop_command():
-    def _pop():
-        if _CMD_QUEUE:
-            return _CMD_QUEUE.pop(0)
+
+class _CommandQueue:
+    """Bounded FIFO ring per priority class with in-place coalescing.
+
+    Entries are ``[frame, req_id, key]`` lists. When a class is full its oldest
+    entry is dropped. Not thread-safe; callers hold ``_CMD_LOCK``.
+    """
+
+    def __init__(self, classes=3, capacity=_QUEUE_CLASS_SLOTS):
+        self._rings = [[None] * capacity for _ in range(classes)]
+        self._heads = [0] * classes
+        self._counts = [0] * classes
+        self._capacity = capacity
+        self._by_key = {}
+        self.depth = 0
+        self.max_depth = 0
+        self.drops = 0
+        self.coalesced = 0
+
+    def push(self, prio, frame, req_id, key=None):
+        """Queue ``frame``; return the req_id it superseded, or 0."""
+        if key is not None:
+            entry = self._by_key.get(key)
+            if entry is not None:
+                superseded = entry[1]
+                entry[0] = frame
+                entry[1] = req_id
+                self.coalesced += 1
+                return superseded
+        ring = self._rings[prio]
+        capacity = self._capacity
+        if self._counts[prio] >= capacity:
+            self._take(prio)
+            self.drops += 1
+        entry = [frame, req_id, key]
+        ring[(self._heads[prio] + self._counts[prio]) % capacity] = entry
+        self._counts[prio] += 1
+        if key is not None:
+            self._by_key[key] = entry
+        self.depth += 1
+        if self.depth > self.max_depth:
+            self.max_depth = self.depth
+        return 0
+
+    def pop(self):
+        """Return the next frame (highest class first) or ``None``."""
+        for prio in range(len(self._rings)):
+            if self._counts[prio]:
+                return self._take(prio)[0]
         return None
 
-    return _with_lock(_CMD_LOCK, _pop)
+    def peek(self):
+        for prio in range(len(self._rings)):
+            if self._counts[prio]:
+                return self._rings[prio][self._heads[prio]][0]
+        return None
+
+    def _take(self, prio):
+        ring = self._rings[prio]
+        head = self._heads[prio]
+        entry = ring[head]
+        ring[head] = None
+        self._heads[prio] = (head + 1) % self._capacity
+        self._counts[prio] -= 1
+        self.depth -= 1
+        key = entry[2]
+        if key is not None and self._by_key.get(key) is entry:
+            del self._by_key[key]
+        return entry
+
+
+_CMD_QUEUE = _CommandQueue()
+# req_id on the wire -> older req_ids whose queued frame it replaced.
+_SUPERSEDED = {}
+
+
+def _store_queue_status(queue):
+    """Publish the command queue counters; callers hold ``_CMD_LOCK``."""
+
+    def _update():
+        _BRIDGE_STATUS["cmd_queue_depth"] = queue.depth
+        _BRIDGE_STATUS["cmd_queue_max_depth"] = queue.max_depth
+        _BRIDGE_STATUS["cmd_drops"] = queue.drops
+        _BRIDGE_STATUS["cmd_coalesced"] = queue.coalesced
+
+    _with_lock(_STATUS_LOCK, _update)
+
+
+def _pop_batch(buf):
+    """Copy queued frames into ``buf`` (highest class first).
+
+    Returns ``(length, frames, out)``; ``out`` is ``buf`` unless a single frame
+    larger than the buffer is being sent on its own.
+    """
+
+    def _fill():
+        queue = _CMD_QUEUE
+        limit = len(buf)
+        used = 0
+        frames = 0
+        out = buf
+        while True:
+            frame = queue.peek()
+            if frame is None:
+                break
+            size = len(frame)
+            if used + size > limit:
+                if not used:
+                    queue.pop()
+                    used, frames, out = size, 1, frame
+                break
+            queue.pop()
+            buf[used:used + size] = frame
+            used += size
+            frames += 1
+        _store_queue_status(queue)
+        return used, frames, out
+
+    return _with_lock(_CMD_LOCK, _fill)
+
+
+class _Completion:
+    """One in-flight async request; completed from the PR thread."""
+
+    __slots__ = ("req_id", "resp", "flag")
+
+    def __init__(self):
+        self.req_id = 0
+        self.resp = None
+        flag_cls = getattr(asyncio, "ThreadSafeFlag", None)
+        self.flag = flag_cls() if flag_cls is not None else None
+
+    def complete(self, resp):
+        self.resp = resp
+        if self.flag is not None:
+            self.flag.set()
+
+    async def wait(self):
+        if self.flag is not None:
+            while self.resp is None:
+                await self.flag.wait()
+            return
+        while self.resp is None:  # ports without ThreadSafeFlag
+            await asyncio.sleep(0.005)
+
+
+def _expire_responses(now_ms):
+    """Drop stale/excess unclaimed responses; caller holds ``_PENDING_LOCK``."""
+    for req_id, entry in list(_PENDING_RESPONSES.items()):
+        if ticks_diff(now_ms, entry[1]) > _RESPONSE_TTL_MS:
+            del _PENDING_RESPONSES[req_id]
+    while len(_PENDING_RESPONSES) > _PENDING_MAX:
+        oldest = None
+        oldest_ms = None
+        for req_id, entry in _PENDING_RESPONSES.items():
+            if oldest is None or ticks_diff(entry[1], oldest_ms) < 0:
+                oldest = req_id
+                oldest_ms = entry[1]
+        del _PENDING_RESPONSES[oldest]
 
 
 def _store_response(payload):
     req_id = payload.get("req_id")
-    if req_id is None:
+    if not req_id:
         return
+    now_ms = ticks_ms()
 
     def _store():
-        _PENDING_RESPONSES[req_id] = payload
+        done = []
+        for target in (req_id,) + _SUPERSEDED.pop(req_id, ()):
+            resp = payload if target == req_id else dict(payload, req_id=target)
+            waiter = _WAITERS.pop(target, None)
+            if waiter is not None:
+                done.append((waiter, resp))
+            else:
+                _PENDING_RESPONSES[target] = (resp, now_ms)
+        _expire_responses(now_ms)
+        return done
+
+    for waiter, resp in _with_lock(_PENDING_LOCK, _store):
+        waiter.complete(resp)
+
 
-    _with_lock(_PENDING_LOCK, _store)
+def _take_response(req_id):
+    def _take():
+        entry = _PENDING_RESPONSES.pop(req_id, None)
+        return entry[0] if entry is not None else None
+
+    return _with_lock(_PENDING_LOCK, _take)
 
 
 def _record_error(message):
@@ -139,19 +411,30 @@ def _record_error(message):
     _with_lock(_STATUS_LOCK, _update)
 
 
-def _set_last_payload(payload):
-    def _update():
-        global _LAST_PAYLOAD, _LAST_ERRORS
-        _LAST_PAYLOAD = payload
-        _LAST_ERRORS = payload.get("errors", {}).copy()
-
-    _with_lock(_PAYLOAD_LOCK, _update)
+def _low_pass(prev, value, alpha=0.2):
+    if prev is None:
+        return float(value)
+    return prev + (value - prev) * alpha
 
 
 def _update_status(seq, ts):
+    global _LAST_RX_IDLE_MS
     now_ms = ticks_ms()
+    idle_ms = _LAST_RX_IDLE_MS
+    _LAST_RX_IDLE_MS = None
 
     def _apply():
+        last_rx = _BRIDGE_STATUS["last_rx_ms"]
+        if _BRIDGE_STATUS["rx_frames"]:
+            _BRIDGE_STATUS["telemetry_interval_avg_ms"] = _low_pass(
+                _BRIDGE_STATUS["telemetry_interval_avg_ms"], ticks_diff(now_ms, last_rx)
+            )
+        if idle_ms is not None:
+            latency = ticks_diff(now_ms, idle_ms)
+            if 0 <= latency < 1000:
+                _BRIDGE_STATUS["rx_latency_avg_ms"] = _low_pass(_BRIDGE_STATUS["rx_latency_avg_ms"], latency)
+                if latency > _BRIDGE_STATUS["rx_latency_max_ms"]:
+                    _BRIDGE_STATUS["rx_latency_max_ms"] = latency
         _BRIDGE_STATUS["rx_frames"] += 1
         _BRIDGE_STATUS["last_seq"] = seq
         _BRIDGE_STATUS["last_ts"] = ts
@@ -161,15 +444,7 @@ def _update_status(seq, ts):
     _with_lock(_STATUS_LOCK, _apply)
 
 
-def _publish_value(state, name, value):
-    target = _STATE_ALIAS.get(name, name)
-    unit = _REGISTER_UNITS.get(name, "")
-    state.set_pr(target, value, unit)
-
-
-def _update_calc_voltage(state, fast_block):
-    current_val = fast_block.get("battery_current")
-    power_val = fast_block.get("motor_input_power")
+def _publish_calc_voltage(current_val, power_val):
     calc_v = None
     try:
         if current_val not in (None, 0):
@@ -179,34 +454,126 @@ def _update_calc_voltage(state, fast_block):
     except Exception:
         calc_v = None
     if calc_v is not None and calc_v == calc_v:
-        state.set_pr("batt_voltage_calc", calc_v, "V")
+        _RING.put(_CALC_V_SLOT, calc_v)
     else:
-        state.set_pr("batt_voltage_calc", None, "V")
+        _RING.put(_CALC_V_SLOT, None)
 
 
 def _handle_telemetry(state, payload):
     fast = payload.get("fast") or {}
     slow = payload.get("slow") or {}
-    errors = payload.get("errors") or {}
-    for name, value in fast.items():
-        _publish_value(state, name, value)
-    for name, value in slow.items():
-        _publish_value(state, name, value)
-    _update_calc_voltage(state, fast)
     seq = payload.get("seq", 0)
     ts = payload.get("ts", 0)
-    payload_copy = {
-        "type": "telemetry",
-        "seq": seq,
-        "ts": ts,
-        "fast": dict(fast),
-        "slow": dict(slow),
-        "errors": dict(errors),
-    }
-    _set_last_payload(payload_copy)
+    ring = _RING
+    ring.begin()
+    for name, value in fast.items():
+        ring.put(_FIELD_SLOT.get(name, -1), value)
+    for name, value in slow.items():
+        ring.put(_FIELD_SLOT.get(name, -1), value)
+    _publish_calc_voltage(fast.get("battery_current"), fast.get("motor_input_power"))
+    ring.commit(seq, ts)
     _update_status(seq, ts)
 
 
+def _request_resync():
+    """Ask the offload for a keyframe, at most once per _RESYNC_INTERVAL_MS."""
+    global _LAST_RESYNC_MS
+    now_ms = ticks_ms()
+    if _LAST_RESYNC_MS is not None and ticks_diff(now_ms, _LAST_RESYNC_MS) < _RESYNC_INTERVAL_MS:
+        return
+    _LAST_RESYNC_MS = now_ms
+    try:
+        send_command({"cmd": "snapshot"}, wait_ms=0)
+    except Exception as exc:
+        _record_error("resync {}".format(exc))
+
+
+def _handle_compact_telemetry(state, payload):
+    codec = _COMPACT_CODEC
+    prev_seq = codec.seq
+    was_synced = codec.synced
+    changed = codec.decode(payload)
+    if changed is None:
+        _record_error("telemetry compact bad {}".format(len(payload)))
+        return
+    keyframe = codec.flags & proto.TELEM_FLAG_KEYFRAME
+    if not codec.synced or (
+        was_synced and not keyframe and codec.seq != ((prev_seq + 1) & 0xFFFF)
+    ):
+        _request_resync()
+    values = codec.values
+    slots = _COMPACT_SLOTS
+    ring = _RING
+    ring.begin()
+    idx = 0
+    bits = changed
+    while bits:
+        if bits & 1:
+            ring.put(slots[idx], values[idx])
+        bits >>= 1
+        idx += 1
+    if changed & _COMPACT_CALC_V_MASK:
+        _publish_calc_voltage(values[_COMPACT_CURRENT_IDX], values[_COMPACT_POWER_IDX])
+    ring.commit(codec.seq, codec.ts)
+    _update_status(codec.seq, codec.ts)
+
+
+def _negotiate_protocol():
+    if not COMPACT_TELEMETRY:
+        return
+    send_command(
+        {
+            "cmd": "version",
+            "proto": proto.PROTOCOL_VERSION,
+            "features": proto.FEATURE_COMPACT_TELEMETRY,
+        },
+        wait_ms=0,
+    )
+
+
+def _apply_layout(fast_mask, slow_mask, layout_id):
+    """Switch decoders to the field layout acknowledged by the offload."""
+
+    def _apply():
+        global FAST_REGS, SLOW_REGS, _LAYOUT_ID, _LAST_SLOW_VALUES
+        FAST_REGS = proto.mask_to_fields(fast_mask)
+        SLOW_REGS = proto.mask_to_fields(slow_mask & ~fast_mask)
+        _LAYOUT_ID = layout_id & 0xFF
+        _LAST_SLOW_VALUES = {name: _LAST_SLOW_VALUES.get(name) for name in SLOW_REGS}
+        _build_compact_codec()
+
+    _with_lock(_LAYOUT_LOCK, _apply)
+
+
+def _handle_set_fields_response(resp):
+    extra = resp.get("extra") or b""
+    if resp.get("status") != proto.RESP_OK or len(extra) < 9:
+        _record_error("set_fields rejected {}".format(resp.get("status")))
+        return
+    fast_mask, slow_mask, layout_id = struct.unpack_from("<IIB", extra, 0)
+    _apply_layout(fast_mask, slow_mask, layout_id)
+
+
+def _drain_frames(state, parser):
+    while True:
+        parsed = parser.next_frame()
+        if parsed is None:
+            return
+        _handle_frame(state, parsed)
+
+
+def _count_wakeup():
+    # Module-level so the PR loop does not build a closure per wakeup.
+    _BRIDGE_STATUS["wakeups"] += 1
+
+
+def _count_layout_drop():
+    def _update():
+        _BRIDGE_STATUS["layout_drops"] += 1
+
+    _with_lock(_STATUS_LOCK, _update)
+
+
 def _read_float(data, offset):
     value = struct.unpack_from("<f", data, offset)[0]
     if value != value:  # NaN check
@@ -215,14 +582,17 @@ def _read_float(data, offset):
 
 
 def _decode_telemetry_payload(payload):
-    min_len = 1 + 2 + 4 + len(FAST_REGS) * 4
+    if len(payload) < proto.TELEMETRY_HEADER_LEN:
+        _record_error("telemetry short {}".format(len(payload)))
+        return None
+    _layout, offset = proto.telemetry_data_offset(payload)
+    min_len = offset + len(FAST_REGS) * 4
     if len(payload) < min_len:
         _record_error("telemetry short {}".format(len(payload)))
         return None
     flags = payload[0]
     seq = struct.unpack_from("<H", payload, 1)[0]
     ts = struct.unpack_from("<I", payload, 3)[0]
-    offset = 7
     fast = {}
     for name in FAST_REGS:
         fast[name] = _read_float(payload, offset)
@@ -255,7 +625,7 @@ def _decode_response_payload(cmd, payload):
         _record_error("resp short {}".format(len(payload)))
         return None
     req_id, status = struct.unpack_from("<HB", payload, 0)
-    extra = payload[3:]
+    extra = bytes(payload[3:])
     return {
         "req_id": req_id,
         "status": status,
@@ -264,6 +634,22 @@ def _decode_response_payload(cmd, payload):
     }
 
 
+def _record_rtt(req_id):
+    sent_ms = _INFLIGHT.pop(req_id & 0xFFFF, None)
+    if sent_ms is None:
+        return
+    rtt = ticks_diff(ticks_ms(), sent_ms)
+
+    def _apply():
+        _BRIDGE_STATUS["cmd_rtt_last_ms"] = rtt
+        _BRIDGE_STATUS["cmd_rtt_avg_ms"] = _low_pass(_BRIDGE_STATUS["cmd_rtt_avg_ms"], rtt)
+        if rtt > _BRIDGE_STATUS["cmd_rtt_max_ms"]:
+            _BRIDGE_STATUS["cmd_rtt_max_ms"] = rtt
+        _BRIDGE_STATUS["cmd_rtt_samples"] += 1
+
+    _with_lock(_STATUS_LOCK, _apply)
+
+
 def _remember_event(event):
     def _store():
         _BRIDGE_STATUS["last_event"] = event
@@ -277,12 +663,32 @@ def _handle_frame(state, frame):
     cmd = frame.get("cmd")
     payload = frame.get("payload") or b""
     if cmd == proto.CMD_TELEMETRY:
+        if len(payload) < proto.TELEMETRY_HEADER_LEN:
+            _record_error("telemetry short {}".format(len(payload)))
+            return
+        if proto.telemetry_data_offset(payload)[0] != _LAYOUT_ID:
+            # Frame encoded for a layout we have not (or no longer) acknowledged.
+            _count_layout_drop()
+            return
+        if payload[0] & proto.TELEM_FLAG_COMPACT:
+            _handle_compact_telemetry(state, payload)
+            return
         decoded = _decode_telemetry_payload(payload)
         if decoded:
             _handle_telemetry(state, decoded)
         return
     resp = _decode_response_payload(cmd, payload)
     if resp:
+        if cmd == proto.CMD_VERSION and resp["req_id"] == 0:
+            # Unsolicited boot announcement: the offload restarted, renegotiate.
+            _negotiate_protocol()
+            if _REQUESTED_MASKS != (proto.FAST_DEFAULT_MASK, proto.SLOW_DEFAULT_MASK):
+                _apply_layout(proto.FAST_DEFAULT_MASK, proto.SLOW_DEFAULT_MASK, 0)
+                _sync_fields(force=True)
+        elif cmd == proto.CMD_SET_FIELDS:
+            _handle_set_fields_response(resp)
+        if resp["req_id"]:
+            _record_rtt(resp["req_id"])
         _store_response(resp)
         _remember_event({"cmd": cmd, "status": resp["status"], "ts": ticks_ms()})
 
@@ -313,6 +719,17 @@ def _encode_command_body(name, payload):
         if token is None:
             token = ticks_ms()
         return struct.pack("<I", int(token) & 0xFFFFFFFF)
+    if name == "version":
+        host_proto = payload.get("proto")
+        if host_proto is None:
+            return b""
+        features = int(payload.get("features", 0) or 0)
+        return struct.pack("<BB", int(host_proto) & 0xFF, features & 0xFF)
+    if name == "set_fields":
+        fast_mask = int(payload.get("fast_mask", proto.FAST_DEFAULT_MASK))
+        slow_mask = int(payload.get("slow_mask", proto.SLOW_DEFAULT_MASK))
+        layout_id = int(payload.get("layout", 0) or 0)
+        return struct.pack("<IIB", fast_mask & 0xFFFFFFFF, slow_mask & 0xFFFFFFFF, layout_id & 0xFF)
     if name == "debug":
         enabled = payload.get("enabled", payload.get("value", False))
         return struct.pack("<B", int(bool(enabled)))
@@ -350,22 +767,106 @@ def _write_command(uart, frame_bytes):
         _record_error("uart write {}".format(exc))
 
 
+def _drain_commands(uart):
+    """Write every queued frame, batched per UART write; caller holds ``_TX_LOCK``."""
+    buf = _TX_BUF
+    while True:
+        used, frames, out = _pop_batch(buf)
+        if not frames:
+            return
+        _write_command(uart, memoryview(out)[:used] if out is buf else out)
+        _count_tx_batch(frames)
+
+
+def _count_tx_batch(frames):
+    def _update():
+        _BRIDGE_STATUS["tx_batches"] += 1
+        _BRIDGE_STATUS["tx_frames"] += frames
+
+    _with_lock(_STATUS_LOCK, _update)
+
+
+def _flush_commands(blocking):
+    """Write queued frames now from the calling thread if the UART is free."""
+    uart = _UART
+    if uart is None:
+        return False
+    if not _TX_LOCK.acquire(1 if blocking else 0):
+        return False
+    try:
+        _drain_commands(uart)
+    finally:
+        _TX_LOCK.release()
+    return True
+
+
+def _on_rx_idle(_uart):
+    global _LAST_RX_IDLE_MS
+    _LAST_RX_IDLE_MS = ticks_ms()
+
+
+def _install_rx_idle_irq(uart):
+    """Timestamp the end of each RX burst (ports with ``UART.IRQ_RXIDLE``)."""
+    trigger = getattr(UART, "IRQ_RXIDLE", None)
+    if trigger is None:
+        return False
+    try:
+        uart.irq(handler=_on_rx_idle, trigger=trigger)
+    except Exception:
+        return False
+    return True
+
+
+def _make_poller(uart):
+    if select is None:
+        return None
+    try:
+        poller = select.poll()
+        poller.register(uart, select.POLLIN)
+    except Exception:
+        return None
+    return poller
+
+
 def phaserunner_worker(
     state,
     *,
     stop_predicate,
     fast_interval_source,
     slow_interval_source,
+    wait_mode=None,
 ):
+    """Run the bridge until ``stop_predicate()``; see ``WAIT_MODE`` for ``wait_mode``."""
+    global _UART, _LAST_RX_IDLE_MS
+    mode = wait_mode or WAIT_MODE
+    event_driven = mode != "sleep" and select is not None
     uart = UART(
         PR_UART_ID,
         baudrate=PR_UART_BAUD,
         tx=PR_UART_TX,
         rx=PR_UART_RX,
-        timeout=40,
+        # Event mode only reads what poll() reported, so reads must not block.
+        timeout=0 if event_driven else 40,
         timeout_char=8,
     )
-    parser = proto.MSPParser()
+    poller = _make_poller(uart) if event_driven else None
+    if poller is None:
+        mode = "sleep"
+    elif _install_rx_idle_irq(uart):
+        mode = "poll+rxidle"
+
+    def _store_mode():
+        _BRIDGE_STATUS["wait_mode"] = mode
+
+    _with_lock(_STATUS_LOCK, _store_mode)
+    _LAST_RX_IDLE_MS = None
+    parser = proto.MSPStreamParser()
+    rx_buf = bytearray(_RX_BUF_SIZE)
+    rx_view = memoryview(rx_buf)
+    _UART = uart
+    attach = getattr(state, "attach_pr_ring", None)
+    if attach is not None:
+        attach(_RING)
     try:
         try:
             fast_ms = int(fast_interval_source())
@@ -377,48 +878,102 @@ def phaserunner_worker(
             slow_ms = 1000
         send_command({"cmd": "set_rate", "fast_ms": fast_ms, "slow_ms": slow_ms}, wait_ms=0)
         send_command({"cmd": "poll", "action": "start"}, wait_ms=0)
+        _negotiate_protocol()
     except Exception:
         pass
     try:
         while not stop_predicate():
-            frame = _pop_command()
-            if frame is not None:
-                _write_command(uart, frame)
-            chunk = uart.read()
-            if chunk:
-                frames = parser.feed(chunk)
-                for parsed in frames:
-                    _handle_frame(state, parsed)
-            else:
-                sleep_ms(10)
+            _flush_commands(True)
+            if poller is None:
+                chunk = uart.read()
+                if chunk:
+                    parser.push(chunk)
+                    _drain_frames(state, parser)
+                else:
+                    sleep_ms(10)
+                continue
+            if not poller.poll(_IDLE_WAIT_MS):
+                continue
+            _with_lock(_STATUS_LOCK, _count_wakeup)
+            while True:
+                count = uart.readinto(rx_buf)
+                if not count:
+                    break
+                parser.push(rx_view[:count])
+                _drain_frames(state, parser)
+                if count < _RX_BUF_SIZE:
+                    break
     finally:
+        _UART = None
+        # Let a send_command() flush that already grabbed the UART finish.
+        _TX_LOCK.acquire()
+        _TX_LOCK.release()
         uart.deinit()
 
 
-def send_command(cmd, *, wait_ms=0):
-    """Queue a command for the PR-offload MCU; optionally wait for the reply."""
-    global _NEXT_REQ_ID
+def _enqueue_command(cmd, waiter=None):
     if not isinstance(cmd, dict):
         raise ValueError("command must be dict")
     payload = dict(cmd)
 
     def _enqueue():
         global _NEXT_REQ_ID
+        # The wire carries 16-bit ids and 0 marks unsolicited frames.
         req_id = _NEXT_REQ_ID
-        _NEXT_REQ_ID = 1 if _NEXT_REQ_ID >= 0x7FFFFFFF else _NEXT_REQ_ID + 1
+        _NEXT_REQ_ID = 1 if _NEXT_REQ_ID >= 0xFFFF else _NEXT_REQ_ID + 1
         payload["req_id"] = req_id
+        name = str(payload.get("cmd") or "").lower()
         frame = _build_command_frame(payload)
-        _CMD_QUEUE.append(frame)
+        if waiter is not None:
+            waiter.req_id = req_id
+            _PENDING_LOCK.acquire()
+            try:
+                if len(_WAITERS) >= _MAX_IN_FLIGHT:
+                    raise RuntimeError("too many commands in flight")
+                _WAITERS[req_id] = waiter
+            finally:
+                _PENDING_LOCK.release()
+        queue = _CMD_QUEUE
+        drops = queue.drops
+        superseded = queue.push(
+            _COMMAND_PRIORITY.get(name, PRIO_DIAG),
+            frame,
+            req_id,
+            name if name in _COALESCE else None,
+        )
+        if superseded:
+            _INFLIGHT.pop(superseded & 0xFFFF, None)
+            _PENDING_LOCK.acquire()
+            try:
+                if len(_SUPERSEDED) >= _PENDING_MAX:
+                    _SUPERSEDED.clear()
+                _SUPERSEDED[req_id] = _SUPERSEDED.pop(superseded, ()) + (superseded,)
+            finally:
+                _PENDING_LOCK.release()
+        _store_queue_status(queue)
+        if queue.drops != drops:
+            _record_error("command queue full, dropped oldest")
+        _track_inflight(req_id)
         return req_id
 
     req_id = _with_lock(_CMD_LOCK, _enqueue)
+    # Write it now rather than on the worker's next wakeup; if the worker is
+    # mid-write it drains the queue itself.
+    _flush_commands(False)
+    return req_id
+
+
+def send_command(cmd, *, wait_ms=0):
+    """Queue a command for the PR-offload MCU; optionally wait for the reply.
+
+    Waiting blocks the calling thread; asyncio code should use
+    :func:`send_command_async`.
+    """
+    req_id = _enqueue_command(cmd)
     if wait_ms and wait_ms > 0:
         deadline = ticks_add(ticks_ms(), int(wait_ms))
         while ticks_diff(deadline, ticks_ms()) > 0:
-            def _take():
-                return _PENDING_RESPONSES.pop(req_id, None)
-
-            resp = _with_lock(_PENDING_LOCK, _take)
+            resp = _take_response(req_id)
             if resp is not None:
                 return resp
             sleep_ms(20)
@@ -426,37 +981,166 @@ def send_command(cmd, *, wait_ms=0):
     return {"req_id": req_id}
 
 
+async def send_command_async(cmd, *, timeout_ms=1000):
+    """Send ``cmd`` and await its response without blocking other tasks.
+
+    The PR thread completes the request through a ``ThreadSafeFlag``; several
+    requests may be in flight at once (up to ``_MAX_IN_FLIGHT``). Raises
+    ``RuntimeError("command timeout")`` like :func:`send_command`.
+    """
+    waiter = _Completion()
+    req_id = _enqueue_command(cmd, waiter)
+    try:
+        wait_for_ms = getattr(asyncio, "wait_for_ms", None)
+        if wait_for_ms is not None:
+            await wait_for_ms(waiter.wait(), int(timeout_ms))
+        else:
+            await asyncio.wait_for(waiter.wait(), timeout_ms / 1000)
+    except asyncio.TimeoutError:
+        raise RuntimeError("command timeout")
+    finally:
+        if waiter.resp is None:
+            _with_lock(_PENDING_LOCK, lambda: _WAITERS.pop(req_id, None))
+    return waiter.resp
+
+
+def _track_inflight(req_id):
+    if len(_INFLIGHT) >= _RTT_TRACK_MAX:
+        try:
+            del _INFLIGHT[next(iter(_INFLIGHT))]
+        except Exception:
+            _INFLIGHT.clear()
+    _INFLIGHT[req_id & 0xFFFF] = ticks_ms()
+
+
+def set_telemetry_fields(fast=None, slow=None, *, wait_ms=0):
+    """Ask the offload to poll/stream only ``fast``/``slow`` field names.
+
+    ``None`` keeps the default set for that rate. The decoders switch once the
+    offload acknowledges; frames for any other layout are dropped meanwhile.
+    """
+    fast_mask = proto.FAST_DEFAULT_MASK if fast is None else proto.fields_to_mask(fast)
+    slow_mask = proto.SLOW_DEFAULT_MASK if slow is None else proto.fields_to_mask(slow)
+    return _request_fields(fast_mask, slow_mask, wait_ms=wait_ms)
+
+
+def _request_fields(fast_mask, slow_mask, *, wait_ms=0):
+    global _REQUESTED_MASKS, _NEXT_LAYOUT_ID
+    slow_mask &= ~fast_mask
+    if not fast_mask:
+        raise ValueError("fast field set empty")
+    if (fast_mask, slow_mask) == (proto.FAST_DEFAULT_MASK, proto.SLOW_DEFAULT_MASK):
+        layout_id = 0
+    else:
+        layout_id = _NEXT_LAYOUT_ID
+        _NEXT_LAYOUT_ID = 1 if _NEXT_LAYOUT_ID >= 0xFF else _NEXT_LAYOUT_ID + 1
+    _REQUESTED_MASKS = (fast_mask, slow_mask)
+    return send_command(
+        {
+            "cmd": "set_fields",
+            "fast_mask": fast_mask,
+            "slow_mask": slow_mask,
+            "layout": layout_id,
+        },
+        wait_ms=wait_ms,
+    )
+
+
+def _sync_fields(force=False):
+    fast_mask = _BASE_FAST_MASK
+    slow_mask = _BASE_SLOW_MASK
+    for sub_fast, sub_slow in list(_SUBSCRIPTIONS.values()):
+        fast_mask |= sub_fast
+        slow_mask |= sub_slow
+    slow_mask &= ~fast_mask
+    if not force and (fast_mask, slow_mask) == _REQUESTED_MASKS:
+        return None
+    return _request_fields(fast_mask, slow_mask)
+
+
+def subscribe_fields(owner, fast=(), slow=()):
+    """Add ``owner``'s extra fields to the streamed set (replaces its previous ones)."""
+    _SUBSCRIPTIONS[owner] = (proto.fields_to_mask(fast or ()), proto.fields_to_mask(slow or ()))
+    return _sync_fields()
+
+
+def unsubscribe_fields(owner):
+    """Drop ``owner``'s extra fields; the offload stops polling unused ones."""
+    if _SUBSCRIPTIONS.pop(owner, None) is None:
+        return None
+    return _sync_fields()
+
+
+def get_telemetry_fields():
+    """Return the acknowledged ``(fast, slow, layout_id)`` field layout."""
+    return FAST_REGS, SLOW_REGS, _LAYOUT_ID
+
+
 def get_bridge_status():
+    """Counters plus latency stats: ``telemetry_age_ms`` (since the last frame),
+    ``rx_latency_*`` (RX idle to decode, with IRQ_RXIDLE) and ``cmd_rtt_*``."""
+    now_ms = ticks_ms()
+
     def _copy():
-        return dict(_BRIDGE_STATUS)
+        status = dict(_BRIDGE_STATUS)
+        if status["rx_frames"]:
+            status["telemetry_age_ms"] = ticks_diff(now_ms, status["last_rx_ms"])
+        return status
 
     return _with_lock(_STATUS_LOCK, _copy)
 
 
 def get_latest_payload():
-    def _copy():
-        if _LAST_PAYLOAD is None:
-            return None
-        result = dict(_LAST_PAYLOAD)
-        result["fast"] = dict(_LAST_PAYLOAD.get("fast", {}))
-        result["slow"] = dict(_LAST_PAYLOAD.get("slow", {}))
-        result["errors"] = dict(_LAST_PAYLOAD.get("errors", {}))
-        return result
+    """Return the latest sample as a ``fast``/``slow`` dict for the active layout."""
+    sample = _RING.latest()
+    if sample is None:
+        return None
+    values, seq, ts, _stamp = sample
+    fast = {}
+    slow = {}
+    for name in FAST_REGS:
+        value = values[_FIELD_SLOT[name]]
+        fast[name] = None if value != value else value
+    for name in SLOW_REGS:
+        value = values[_FIELD_SLOT[name]]
+        slow[name] = None if value != value else value
+    return {
+        "type": "telemetry",
+        "seq": seq,
+        "ts": ts,
+        "fast": fast,
+        "slow": slow,
+        "errors": {},
+        "compact": _COMPACT_CODEC.synced,
+    }
 
-    return _with_lock(_PAYLOAD_LOCK, _copy)
 
+def get_telemetry_ring():
+    """Return the shared :class:`TelemetryRing` (lock-free readers only)."""
+    return _RING
 
-def get_last_errors():
-    def _copy():
-        return dict(_LAST_ERRORS)
 
-    return _with_lock(_PAYLOAD_LOCK, _copy)
+def get_telemetry_window(name, window_ms):
+    """Return ``[(ticks_ms, value), ...]`` of ``name`` over the last ``window_ms``."""
+    return _RING.window(_RING.index(_STATE_ALIAS.get(name, name)), window_ms)
+
+
+def get_last_errors():
+    return dict(_LAST_ERRORS)
 
 
 __all__ = [
     "phaserunner_worker",
     "send_command",
+    "send_command_async",
     "get_bridge_status",
     "get_latest_payload",
     "get_last_errors",
+    "set_telemetry_fields",
+    "subscribe_fields",
+    "unsubscribe_fields",
+    "get_telemetry_fields",
+    "get_telemetry_ring",
+    "get_telemetry_window",
+    "PR_STATE_FIELDS",
 ]
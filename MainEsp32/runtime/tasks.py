@@ -5,19 +5,52 @@ import sys
 import uasyncio as asyncio
 from time import ticks_ms, ticks_diff
 
+from runtime.ui_scheduler import FrameScheduler
 
-async def ui_task(dashboards, state, interval_source):
-    """Drive the active dashboard refresh loop."""
-    minimum = 20
+
+async def ui_task(dashboards, state, interval_source, on_switch=None, scheduler=None):
+    """Drive the active dashboard refresh loop.
+
+    ``on_switch(dashboard)`` runs whenever a different dashboard becomes active.
+    ``scheduler`` (a :class:`FrameScheduler`) decides which slots draw and how
+    long to sleep; by default one is built around ``interval_source``.
+    """
+    if scheduler is None:
+        scheduler = FrameScheduler(interval_source)
+    last_dashboard = None
     while True:
         idx = state.screen if isinstance(state.screen, int) else 0
         if idx < 0 or idx >= len(dashboards):
             idx = 0
             state.screen = 0
         dashboard = dashboards[idx]
+        if dashboard is not last_dashboard:
+            last_dashboard = dashboard
+            if on_switch is not None:
+                try:
+                    on_switch(dashboard)
+                except Exception as exc:  # pragma: no cover - defensive logging on device
+                    print("[UI] switch hook error:", exc)
+        if not scheduler.should_draw(dashboard):
+            await asyncio.sleep_ms(scheduler.next_delay(dashboard))
+            continue
+        # Dashboards call lcd.show() from draw(); defer those and flush once
+        # afterwards without blocking the loop for the whole transfer.
+        lcd = getattr(dashboard, "lcd", None)
+        flush = getattr(lcd, "show_async", None)
+        if flush is not None:
+            lcd.defer_show = True
+        started = ticks_ms()
         try:
-            dashboard.draw(state)
+            # Finish a render the last slot's deadline cut short before
+            # taking new values (a pending full refresh redraws it all).
+            if getattr(dashboard, "render_pending", False) and not scheduler.refresh_pending(dashboard):
+                dashboard.resume_render()
+            else:
+                dashboard.draw(state)
         except Exception as exc:  # pragma: no cover - defensive logging on device
+            if flush is not None:
+                lcd.defer_show = False
             print("[UI] draw error:", exc)
             try:
                 sys.print_exception(exc)
@@ -25,13 +58,15 @@ async def ui_task(dashboards, state, interval_source):
                 pass
             await asyncio.sleep_ms(200)
             continue
-        try:
-            interval_cfg = int(interval_source())
-        except Exception:
-            interval_cfg = interval_source()
-        if interval_cfg < minimum:
-            interval_cfg = minimum
-        await asyncio.sleep_ms(interval_cfg)
+        drawn = ticks_ms()
+        if flush is not None:
+            lcd.defer_show = False
+            try:
+                await flush()
+            except Exception as exc:  # pragma: no cover - defensive logging on device
+                print("[UI] flush error:", exc)
+        scheduler.frame_done(dashboard, ticks_diff(drawn, started), ticks_diff(ticks_ms(), drawn))
+        await asyncio.sleep_ms(scheduler.next_delay(dashboard))
 
 
 async def integrator_task(state, interval_source):
@@ -244,8 +279,8 @@ async def heartbeat_task(state):
             else:
                 vs = 0.0
         else:
-            vs = state.get_pr("vehicle_speed", (0.0, ""))[0] or 0.0
-        pin = state.get_pr("motor_input_power", (0.0, ""))[0] or 0.0
+            vs = state.pr_frame().speed_kmh or 0.0
+        pin = state.pr_frame().power_w or 0.0
         print(
             "[HB]",
             n,
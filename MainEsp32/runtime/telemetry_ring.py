@@ -0,0 +1,203 @@
+"""Fixed-capacity telemetry history shared between the PR thread and asyncio tasks.
+
+One producer (the PR bridge ``_thread``) appends whole samples; any number of
+readers take the latest value, the latest sample or a time window without a
+lock. Each slot carries a sequence counter that is odd while the writer fills
+it (seqlock): a reader samples the counter, copies the values and accepts them
+only if the counter is even and unchanged. The writer always fills the slot
+after the published head, so readers of the latest sample only retry when they
+were preempted for a full lap of the ring.
+"""
+
+from time import ticks_diff, ticks_ms
+
+try:
+    from array import array
+except ImportError:  # pragma: no cover
+    from uarray import array  # type: ignore
+
+NAN = float("nan")
+
+_SEQ_MASK = 0x3FFFFFFF  # even, so wrapping keeps the odd/even "writing" parity
+_TICKS_MASK = 0x3FFFFFFF
+_READ_RETRIES = 4
+
+
+class TelemetryRing:
+    """Preallocated ring of ``capacity`` samples, one float slot per field.
+
+    Missing values are stored as NaN and reported as ``None``. Field indices
+    are fixed at construction; resolve names once with :meth:`index`.
+    """
+
+    def __init__(self, fields, units=None, capacity=16):
+        if capacity < 2:
+            raise ValueError("capacity must be >= 2")
+        self.fields = tuple(fields)
+        self.units = tuple(units) if units is not None else ("",) * len(self.fields)
+        self.width = len(self.fields)
+        self.capacity = capacity
+        self._index = {name: idx for idx, name in enumerate(self.fields)}
+        self._values = array("f", [NAN] * (capacity * self.width))
+        self._lock_seq = array("I", [0] * capacity)
+        self._stamp = array("I", [0] * capacity)
+        self._frame_seq = array("H", [0] * capacity)
+        self._src_ts = array("I", [0] * capacity)
+        self._head = -1
+        self._slot = -1
+        self.count = 0
+        self.writes = 0
+        self.read_retries = 0
+
+    def index(self, name):
+        """Return the field index of ``name`` or -1."""
+        return self._index.get(name, -1)
+
+    # -- producer side (single thread) ---------------------------------------
+
+    def begin(self):
+        """Open the next slot, pre-filled with the previous sample's values."""
+        head = self._head
+        slot = head + 1
+        if slot >= self.capacity:
+            slot = 0
+        self._lock_seq[slot] = (self._lock_seq[slot] + 1) & _SEQ_MASK
+        width = self.width
+        values = self._values
+        base = slot * width
+        if head >= 0:
+            prev = head * width
+            for idx in range(width):
+                values[base + idx] = values[prev + idx]
+        self._slot = slot
+        return slot
+
+    def put(self, idx, value):
+        """Store ``value`` for field ``idx`` in the open slot."""
+        if idx < 0:
+            return
+        self._values[self._slot * self.width + idx] = NAN if value is None else value
+
+    def commit(self, seq=0, ts=0):
+        """Publish the open slot with the bridge ``seq``/``ts`` of the sample."""
+        slot = self._slot
+        if slot < 0:
+            return
+        self._stamp[slot] = ticks_ms() & _TICKS_MASK
+        self._frame_seq[slot] = seq & 0xFFFF
+        self._src_ts[slot] = ts & 0xFFFFFFFF
+        self._lock_seq[slot] = (self._lock_seq[slot] + 1) & _SEQ_MASK
+        self._head = slot
+        self._slot = -1
+        if self.count < self.capacity:
+            self.count += 1
+        self.writes += 1
+
+    # -- consumer side (any thread / task) -----------------------------------
+
+    def value(self, idx, default=None):
+        """Latest value of field ``idx`` (``default`` if unset or contended)."""
+        if idx < 0:
+            return default
+        lock_seq = self._lock_seq
+        values = self._values
+        width = self.width
+        for _ in range(_READ_RETRIES):
+            slot = self._head
+            if slot < 0:
+                return default
+            before = lock_seq[slot]
+            value = values[slot * width + idx]
+            if not (before & 1) and lock_seq[slot] == before:
+                if value != value:
+                    return default
+                return value
+            self.read_retries += 1
+        return default
+
+    def get(self, name, default=None):
+        return self.value(self._index.get(name, -1), default)
+
+    def latest(self, out=None):
+        """Copy the latest sample into ``out`` (an ``array('f')`` of ``width``).
+
+        Returns ``(out, seq, ts, stamp_ms)`` or ``None`` before the first
+        sample or when the writer kept lapping the reader.
+        """
+        if out is None:
+            out = array("f", [NAN] * self.width)
+        for _ in range(_READ_RETRIES):
+            slot = self._head
+            if slot < 0:
+                return None
+            sample = self._read_slot(slot, out)
+            if sample is not None:
+                return sample
+            self.read_retries += 1
+        return None
+
+    def window(self, idx, window_ms, now_ms=None):
+        """Return ``[(stamp_ms, value), ...]`` for field ``idx``, oldest first.
+
+        Covers samples committed within the last ``window_ms``; slots being
+        overwritten while read are skipped.
+        """
+        if idx < 0:
+            return []
+        if now_ms is None:
+            now_ms = ticks_ms() & _TICKS_MASK
+        lock_seq = self._lock_seq
+        stamps = self._stamp
+        values = self._values
+        width = self.width
+        out = []
+        slot = self._head
+        for _ in range(self.count):
+            if slot < 0:
+                break
+            before = lock_seq[slot]
+            stamp = stamps[slot]
+            value = values[slot * width + idx]
+            if not (before & 1) and lock_seq[slot] == before:
+                if _ticks_age(now_ms, stamp) > window_ms:
+                    break
+                out.append((stamp, None if value != value else value))
+            slot = slot - 1 if slot > 0 else self.capacity - 1
+        out.reverse()
+        return out
+
+    def age_ms(self, now_ms=None):
+        """Milliseconds since the last commit, or ``None`` before the first."""
+        slot = self._head
+        if slot < 0:
+            return None
+        if now_ms is None:
+            now_ms = ticks_ms() & _TICKS_MASK
+        return _ticks_age(now_ms, self._stamp[slot])
+
+    def _read_slot(self, slot, out):
+        lock_seq = self._lock_seq
+        before = lock_seq[slot]
+        if before & 1:
+            return None
+        values = self._values
+        base = slot * self.width
+        for idx in range(self.width):
+            out[idx] = values[base + idx]
+        seq = self._frame_seq[slot]
+        ts = self._src_ts[slot]
+        stamp = self._stamp[slot]
+        if lock_seq[slot] != before:
+            return None
+        return out, seq, ts, stamp
+
+
+def _ticks_age(now_ms, stamp):
+    age = ticks_diff(now_ms & _TICKS_MASK, stamp)
+    if age < 0:
+        # ticks_diff over the masked 30-bit stamps on ports with wider ticks.
+        age = (now_ms - stamp) & _TICKS_MASK
+    return age
+
+
+__all__ = ["TelemetryRing", "NAN"]
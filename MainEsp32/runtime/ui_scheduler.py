@@ -0,0 +1,286 @@
+"""Frame-budget aware pacing for the dashboard refresh loop.
+
+``ui_task`` used to draw and then sleep a fixed interval, so a slow dashboard
+lowered its own frame rate and kept the event loop away from the motor task
+for the whole draw. ``FrameScheduler`` times every draw per dashboard (with a
+histogram per dashboard) and spaces frames so drawing takes at most
+``budget_pct`` of the frame. When the control loop reports lag, or the
+scheduler's own wake-ups run late, it backs off. It stretches the interval,
+skips up to ``max_skip`` frames in a row, and holds full refreshes requested
+through ``request_full_refresh`` for as long as it stays busy (``max_defer_ms``
+is only a safety valve against a screen that never settles).
+
+Every slot also gets a render deadline ``slice_ms`` after it starts. Widget
+dashboards stop rendering there and finish in the following slots (see
+``DashboardBase.render_widgets``), so a full refresh holds the control loop
+for about one slice instead of its whole cost.
+"""
+
+from time import ticks_add, ticks_diff, ticks_ms
+
+# Upper edges (ms) of the draw-time histogram buckets; the last one is open.
+HIST_EDGES_MS = (2, 5, 10, 20, 40, 80, 160)
+
+_MAX_STRETCH = 8
+
+
+def _low_pass(prev, value, alpha):
+    if prev is None:
+        return float(value)
+    return prev + alpha * (value - prev)
+
+
+def _round(value):
+    if value is None:
+        return None
+    return int(value * 10 + 0.5) / 10
+
+
+class DrawStats:
+    """Draw-time histogram and counters for one dashboard."""
+
+    def __init__(self, name):
+        self.name = name
+        self.hist = [0] * (len(HIST_EDGES_MS) + 1)
+        self.frames = 0
+        self.full = 0
+        self.skipped = 0
+        self.deferred = 0
+        self.last_ms = 0
+        self.max_ms = 0
+        self.avg_ms = None
+        self.full_avg_ms = None
+        self.flush_avg_ms = None
+
+    def record(self, draw_ms, flush_ms=0, full=False):
+        if draw_ms < 0:
+            draw_ms = 0
+        self.frames += 1
+        self.last_ms = draw_ms
+        if draw_ms > self.max_ms:
+            self.max_ms = draw_ms
+        bucket = 0
+        for edge in HIST_EDGES_MS:
+            if draw_ms < edge:
+                break
+            bucket += 1
+        self.hist[bucket] += 1
+        # Full refreshes cost several times a normal frame; keep them out of
+        # the average the frame rate is derived from.
+        if full:
+            self.full += 1
+            self.full_avg_ms = _low_pass(self.full_avg_ms, draw_ms, 0.3)
+        else:
+            self.avg_ms = _low_pass(self.avg_ms, draw_ms, 0.2)
+        self.flush_avg_ms = _low_pass(self.flush_avg_ms, max(0, flush_ms), 0.2)
+
+    def snapshot(self):
+        return {
+            "frames": self.frames,
+            "full": self.full,
+            "skipped": self.skipped,
+            "deferred": self.deferred,
+            "last_ms": self.last_ms,
+            "max_ms": self.max_ms,
+            "avg_ms": _round(self.avg_ms),
+            "full_avg_ms": _round(self.full_avg_ms),
+            "flush_avg_ms": _round(self.flush_avg_ms),
+            "hist_edges_ms": HIST_EDGES_MS,
+            "hist": list(self.hist),
+        }
+
+
+class FrameScheduler:
+    """Decide when the active dashboard draws and how long to sleep after.
+
+    ``interval_source()`` gives the configured frame interval (the fastest
+    rate). ``lag_source()``, when given, returns how many ms the control loop
+    runs behind its period. Dashboards report full-refresh requests through
+    their ``refresh_requests`` counter and take the slot's ``render_deadline``
+    (see ``DashboardBase``).
+    """
+
+    def __init__(
+        self,
+        interval_source,
+        *,
+        lag_source=None,
+        minimum_ms=20,
+        maximum_ms=500,
+        budget_pct=40,
+        lag_threshold_ms=4,
+        max_skip=3,
+        max_defer_ms=5000,
+        slice_ms=10,
+    ):
+        self.interval_source = interval_source
+        self.lag_source = lag_source
+        self.minimum_ms = int(minimum_ms)
+        self.maximum_ms = int(maximum_ms)
+        self.budget_pct = max(5, min(100, int(budget_pct)))
+        self.lag_threshold_ms = lag_threshold_ms
+        self.max_skip = int(max_skip)
+        self.max_defer_ms = int(max_defer_ms)
+        self.slice_ms = int(slice_ms) if slice_ms else None
+        self._stats = {}  # dashboard -> DrawStats
+        self._names = {}
+        self._seen_requests = {}  # dashboard -> refresh_requests already drawn
+        self._token = None
+        self._frame_full = False
+        self._frame_start = None
+        self._frame_begin = None  # first slot of a frame split across slots
+        self._skip_run = 0
+        self._defer_since = None
+        self._stretch = 1
+        self._sleep_start = None
+        self._sleep_ms = 0
+        self._wake_late_ms = 0.0
+        self.interval_ms = self.minimum_ms
+
+    # -- load -------------------------------------------------------------
+
+    def lag_ms(self):
+        """Current control lag estimate: loop overrun or late wake-ups."""
+        lag = self._wake_late_ms
+        source = self.lag_source
+        if source is not None:
+            try:
+                value = source()
+            except Exception:
+                value = None
+            if value is not None and value > lag:
+                lag = value
+        return lag
+
+    def busy(self):
+        return self.lag_ms() > self.lag_threshold_ms
+
+    # -- per-frame protocol -------------------------------------------------
+
+    def stats_for(self, dashboard):
+        stats = self._stats.get(dashboard)
+        if stats is None:
+            name = type(dashboard).__name__
+            count = self._names.get(name, 0)
+            self._names[name] = count + 1
+            if count:
+                name = "{}#{}".format(name, count + 1)
+            stats = DrawStats(name)
+            self._stats[dashboard] = stats
+        return stats
+
+    def refresh_pending(self, dashboard):
+        seen = self._seen_requests.get(dashboard)
+        return seen is None or seen != getattr(dashboard, "refresh_requests", 0)
+
+    def should_draw(self, dashboard):
+        """Return True when ``dashboard`` should draw this slot."""
+        now = ticks_ms()
+        if self._sleep_start is not None:
+            late = ticks_diff(now, self._sleep_start) - self._sleep_ms
+            self._wake_late_ms = _low_pass(self._wake_late_ms, max(0, late), 0.3)
+            self._sleep_start = None
+        self._frame_start = now
+        stats = self.stats_for(dashboard)
+        busy = self.busy()
+        pending = self.refresh_pending(dashboard)
+        if pending:
+            if busy:
+                if self._defer_since is None:
+                    self._defer_since = now
+                if ticks_diff(now, self._defer_since) < self.max_defer_ms:
+                    stats.deferred += 1
+                    return False
+            self._defer_since = None
+        elif busy and self._skip_run < self.max_skip:
+            self._skip_run += 1
+            stats.skipped += 1
+            return False
+        self._skip_run = 0
+        self._token = getattr(dashboard, "refresh_requests", 0)
+        self._frame_full = pending
+        if not getattr(dashboard, "render_pending", False):
+            self._frame_begin = now
+        if self.slice_ms is not None and hasattr(dashboard, "render_deadline"):
+            dashboard.render_deadline = ticks_add(now, self.slice_ms)
+        return True
+
+    def frame_done(self, dashboard, draw_ms, flush_ms=0):
+        """Record a completed draw started by :meth:`should_draw`."""
+        self.stats_for(dashboard).record(draw_ms, flush_ms, self._frame_full)
+        self._seen_requests[dashboard] = self._token
+        self._frame_full = False
+
+    def next_delay(self, dashboard):
+        """Return the ms to sleep before the next slot."""
+        try:
+            configured = int(self.interval_source())
+        except Exception:
+            configured = self.minimum_ms
+        if configured < self.minimum_ms:
+            configured = self.minimum_ms
+        stats = self.stats_for(dashboard)
+        now = ticks_ms()
+        spent = 0
+        if self._frame_start is not None:
+            spent = ticks_diff(now, self._frame_start)
+        # Sleep that keeps this slot's drawing within budget_pct.
+        slot_rest = int(spent * 100 / self.budget_pct) - spent
+        if getattr(dashboard, "render_pending", False):
+            # The frame was cut at the slot deadline: come back for the rest
+            # as soon as the budget allows instead of a whole interval later.
+            interval = int(spent * 100 / self.budget_pct)
+            if interval < self.minimum_ms:
+                interval = self.minimum_ms
+            elapsed = spent
+        else:
+            interval = configured
+            if stats.avg_ms is not None:
+                budgeted = int(stats.avg_ms * 100 / self.budget_pct)
+                if budgeted > interval:
+                    interval = budgeted
+            # A frame split over several slots counts from its first one.
+            elapsed = spent
+            if self._frame_begin is not None:
+                elapsed = ticks_diff(now, self._frame_begin)
+        if self.busy():
+            if self._stretch < _MAX_STRETCH:
+                self._stretch <<= 1
+        elif self._stretch > 1:
+            self._stretch >>= 1
+        interval *= self._stretch
+        ceiling = self.maximum_ms if self.maximum_ms > configured else configured
+        if interval > ceiling:
+            interval = ceiling
+        self.interval_ms = interval
+        delay = interval - elapsed
+        if delay < slot_rest:
+            delay = slot_rest
+        floor = self.minimum_ms // 2
+        if delay < floor:
+            delay = floor
+        self._sleep_start = ticks_ms()
+        self._sleep_ms = delay
+        return delay
+
+    # -- reporting ----------------------------------------------------------
+
+    def stats(self):
+        out = {}
+        for stats in self._stats.values():
+            out[stats.name] = stats.snapshot()
+        out["scheduler"] = {
+            "interval_ms": self.interval_ms,
+            "stretch": self._stretch,
+            "lag_ms": _round(self.lag_ms()),
+            "wake_late_ms": _round(self._wake_late_ms),
+            "budget_pct": self.budget_pct,
+        }
+        return out
+
+    def reset_stats(self):
+        self._stats = {}
+        self._names = {}
+
+
+__all__ = ["FrameScheduler", "DrawStats", "HIST_EDGES_MS"]
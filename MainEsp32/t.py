@@ -38,7 +38,8 @@ from HW import (
     make_output,
 )
 
-from UI_helpers import DisplayUI
+from UI_helpers import DisplayUI, GlyphCache, Writer
+from UI_helpers.glyph_cache import warm_digits
 from app_state import AppState
 import buttons as _buttons_mod
 from buttons import PageButton, UpDownButtons
@@ -51,6 +52,7 @@ from runtime.motor import (
     save_motor_config,
 )
 from runtime.tasks import ui_task, integrator_task, trip_counter_task, heartbeat_task
+from runtime.ui_scheduler import FrameScheduler
 from runtime.sys_pmu import sys_pmu_task
 from runtime.power_guard import ensure_wake_pin_ready, vbus_present
 from runtime.rtc_snapshot import save_trip_snapshot, restore_trip_snapshot
@@ -109,6 +111,7 @@ _dashboard_sys_batt = None
 _dashboard_alarm = None
 _page_button = None
 _motor = None
+_ui_scheduler = None
 _updown_buttons = None
 _TASKS = []
 _STOP_REQUESTED = False
@@ -318,6 +321,7 @@ _PR_FAST_MS = 100
 _PR_SLOW_MS = 2000
 _UI_FRAME_MS = 80
 _INTEGRATOR_MS = 200
+_GLYPH_CACHE_BYTES = 128 * 1024
 _TRIP_COUNTER_INTERVAL_MS = TRIP_COUNTER_INTERVAL_MS
 
 
@@ -482,6 +486,36 @@ def _get_ui_frame_interval():
     return _UI_FRAME_MS
 
 
+def _control_loop_lag_ms():
+    """How far the motor loop period runs over its configured period."""
+    motor = _motor
+    deadline = getattr(motor, "_deadline", None)
+    if getattr(motor, "_pacing", None) == "timer" and deadline is not None:
+        # Timer ticks keep the period exact; lateness shows the event loop lag.
+        late_us = deadline.late_avg_us
+        return 0 if late_us is None else late_us / 1000.0
+    avg = getattr(motor, "_loop_period_avg_ms", None)
+    if avg is None:
+        return 0
+    cfg = getattr(motor, "cfg", None) or {}
+    try:
+        period = int(cfg.get("update_period_ms", 20) or 20)
+    except Exception:
+        period = 20
+    return avg - period
+
+
+def _on_dashboard_switch(dashboard):
+    fast = getattr(dashboard, "PR_FIELDS_FAST", ()) or ()
+    slow = getattr(dashboard, "PR_FIELDS_SLOW", ()) or ()
+    if not _PR_THREAD_ENABLED:
+        return
+    if fast or slow:
+        pr_bridge.subscribe_fields("dashboard", fast=fast, slow=slow)
+    else:
+        pr_bridge.unsubscribe_fields("dashboard")
+
+
 def _get_integrator_interval():
     return _INTEGRATOR_MS
 
@@ -770,6 +804,16 @@ def pr_version(wait_ms=1000):
     return pr_bridge.send_command({"cmd": "version"}, wait_ms=wait_ms)
 
 
+def pr_set_fields(fast=None, slow=None, wait_ms=1000):
+    """Select the PR registers streamed by the offload (None = default set)."""
+    return pr_bridge.set_telemetry_fields(fast, slow, wait_ms=wait_ms)
+
+
+def pr_fields():
+    """Return the acknowledged (fast, slow, layout_id) telemetry layout."""
+    return pr_bridge.get_telemetry_fields()
+
+
 def pr_poll_control(action, wait_ms=1000):
     """Pause/resume the PR-offload poller (action=start|resume|pause|stop)."""
     action_norm = str(action or "").lower()
@@ -783,6 +827,39 @@ def pr_offload_reboot(wait_ms=1000):
     return pr_bridge.send_command({"cmd": "reboot"}, wait_ms=wait_ms)
 
 
+async def pr_ping_async(timeout_ms=1000):
+    """Async :func:`pr_ping`; other tasks keep running while waiting."""
+    return await pr_bridge.send_command_async({"cmd": "ping"}, timeout_ms=timeout_ms)
+
+
+async def pr_status_async(timeout_ms=1000):
+    """Async :func:`pr_status`."""
+    return await pr_bridge.send_command_async({"cmd": "status"}, timeout_ms=timeout_ms)
+
+
+async def pr_request_snapshot_async(timeout_ms=1000):
+    """Async :func:`pr_request_snapshot`."""
+    return await pr_bridge.send_command_async({"cmd": "snapshot"}, timeout_ms=timeout_ms)
+
+
+async def pr_version_async(timeout_ms=1000):
+    """Async :func:`pr_version`."""
+    return await pr_bridge.send_command_async({"cmd": "version"}, timeout_ms=timeout_ms)
+
+
+async def pr_poll_control_async(action, timeout_ms=1000):
+    """Async :func:`pr_poll_control`."""
+    action_norm = str(action or "").lower()
+    if action_norm not in ("start", "resume", "pause", "stop"):
+        raise ValueError("action must be start/resume/pause/stop")
+    return await pr_bridge.send_command_async({"cmd": "poll", "action": action_norm}, timeout_ms=timeout_ms)
+
+
+async def pr_offload_reboot_async(timeout_ms=1000):
+    """Async :func:`pr_offload_reboot`."""
+    return await pr_bridge.send_command_async({"cmd": "reboot"}, timeout_ms=timeout_ms)
+
+
 def pr_offload_sleep(
     wait_ms=2000,
     delay_s=2,
@@ -1476,6 +1553,61 @@ def set_ui_frame_interval(ms=None):
     return int(_UI_FRAME_MS)
 
 
+def _install_glyph_cache():
+    """Share one RGB565 glyph cache across Writers and pre-render big digits."""
+    try:
+        cache = GlyphCache(_GLYPH_CACHE_BYTES)
+        Writer.glyph_cache = cache
+        warmed = warm_digits(cache)
+        print("[UI] glyph cache: {} glyphs warmed, {} B".format(warmed, cache.used))
+    except Exception as exc:
+        Writer.glyph_cache = None
+        print("[UI] glyph cache error:", exc)
+
+
+def set_glyph_cache_budget(nbytes=None):
+    """Set or query the glyph cache budget in bytes (0 disables the cache)."""
+    global _GLYPH_CACHE_BYTES
+    if nbytes is None:
+        return int(_GLYPH_CACHE_BYTES)
+    try:
+        value = int(nbytes)
+    except Exception:
+        raise ValueError("invalid glyph cache budget")
+    if value < 0:
+        value = 0
+    _GLYPH_CACHE_BYTES = value
+    cache = Writer.glyph_cache
+    if value == 0:
+        Writer.glyph_cache = None
+    elif cache is None:
+        Writer.glyph_cache = GlyphCache(value)
+    else:
+        cache.budget = value
+        if cache.used > value:
+            cache.clear()
+    return int(_GLYPH_CACHE_BYTES)
+
+
+def glyph_cache_stats():
+    """Return the glyph cache counters, or ``None`` when it is disabled."""
+    cache = Writer.glyph_cache
+    if cache is None:
+        return None
+    return cache.stats()
+
+
+def ui_frame_stats(reset=False):
+    """Return per-dashboard draw-time histograms and the UI pacing state."""
+    scheduler = _ui_scheduler
+    if scheduler is None:
+        return None
+    stats = scheduler.stats()
+    if reset:
+        scheduler.reset_stats()
+    return stats
+
+
 def set_integrator_interval(ms=None):
     """Set or query integrator step interval in milliseconds (min 50)."""
     global _INTEGRATOR_MS
@@ -1850,6 +1982,20 @@ def set_loop_timing_monitor(enable=None):
     return bool(_LOOP_TIMING_MONITOR_OVERRIDE if _LOOP_TIMING_MONITOR_OVERRIDE is not None else False)
 
 
+def set_control_timer(enable=None):
+    """Pace the motor loop from a hardware timer instead of a sleeping coroutine."""
+    motor = _get_motor_controller()
+    if motor is None:
+        raise RuntimeError("motor controller not ready")
+    setter = getattr(motor, "set_control_timer", None)
+    if not callable(setter):
+        raise RuntimeError("control timer unsupported")
+    result = setter(enable)
+    if enable is not None:
+        print("[t] control timer {}".format("ON" if result else "OFF"))
+    return result
+
+
 def set_pid_timing_debug(enable=None, period_ms=None):
     """Enable/disable the detailed PID math timing diagnostic output."""
     global _PID_TIMING_DEBUG_OVERRIDE, _PID_TIMING_DEBUG_PERIOD_MS
@@ -2024,6 +2170,10 @@ def set_pid_params(mode, persist=True, reset=True, **params):
         changes[cfg_key] = numeric
     cfg.update(changes)
     motor = _get_motor_controller()
+    if motor is not None and getattr(motor, "cfg", None) is cfg:
+        reload_fn = getattr(motor, "reload_config", None)
+        if callable(reload_fn):
+            reload_fn()
     if motor is not None and getattr(motor, "cfg", None) is cfg and reset:
         reset_fn = getattr(motor, "_reset_pid", None)
         if callable(reset_fn):
@@ -2055,7 +2205,7 @@ def set_speed_target(kmh=None):
 # -------------- Main async --------------
 async def _main_async():
     global _state, _ui, _dashboards, _dashboard_signals, _dashboard_trip, _dashboard_batt_select, _dashboard_batt_status, _dashboard_sys_batt, _dashboard_alarm, _page_button
-    global _motor, _STOP_REQUESTED, _TASKS, _updown_buttons, _TRIP_COUNTER_INTERVAL_MS
+    global _motor, _STOP_REQUESTED, _TASKS, _updown_buttons, _TRIP_COUNTER_INTERVAL_MS, _ui_scheduler
     print("[t] _main_async: starting")
     _STOP_REQUESTED = False
     _TASKS.clear()
@@ -2154,6 +2304,8 @@ async def _main_async():
         initial_screen_index = setup.get("initial_screen_index")
         if dashboards and initial_screen_index is None:
             initial_screen_index = 0
+        if dashboards and _GLYPH_CACHE_BYTES > 0:
+            _install_glyph_cache()
 
     _ui = ui_instance
     _dashboards = dashboards
@@ -2269,7 +2421,14 @@ async def _main_async():
 
     # Tareas
     if _dashboards:
-        _track_task(asyncio.create_task(ui_task(_dashboards, _state, _get_ui_frame_interval)))
+        _ui_scheduler = FrameScheduler(_get_ui_frame_interval, lag_source=_control_loop_lag_ms)
+        _track_task(asyncio.create_task(ui_task(
+                    _dashboards,
+                    _state,
+                    _get_ui_frame_interval,
+                    on_switch=_on_dashboard_switch,
+                    scheduler=_ui_scheduler,
+                )))
     _track_task(asyncio.create_task(integrator_task(_state, _get_integrator_interval)))
     _track_task(
         asyncio.create_task(
@@ -2439,6 +2598,35 @@ async def sample_throttle_brake_async(samples=16, delay_ms=20):
     return (acc_th / float(denom_th)) * scale, (acc_br / float(denom_br)) * scale
 
 
+def calibrate_adc_point(kind, volts, samples=32, delay_ms=5, persist=True):
+    """Record a throttle/brake ADC linearity point for a known input voltage."""
+    motor = _get_motor_controller()
+    if motor is None:
+        raise RuntimeError("motor controller not ready")
+    capture = getattr(motor, "calibrate_adc_point", None)
+    if not callable(capture):
+        raise RuntimeError("ADC linearity calibration unsupported")
+    raw_v = asyncio.run(capture(kind, volts, samples=samples, delay_ms=delay_ms))
+    print("[t] {} ADC {:.3f}V -> {:.3f}V".format(kind, raw_v, float(volts)))
+    if persist:
+        _save_motor_config(motor.cfg)
+    return motor.cfg.get("adc_tr_linearity" if kind == "throttle" else "adc_br_linearity")
+
+
+def clear_adc_linearity(kind=None, persist=True):
+    """Drop the ADC linearity table(s) and fall back to scale/offset."""
+    motor = _get_motor_controller()
+    if motor is None:
+        raise RuntimeError("motor controller not ready")
+    clear = getattr(motor, "clear_adc_linearity", None)
+    if not callable(clear):
+        raise RuntimeError("ADC linearity calibration unsupported")
+    clear(kind)
+    if persist:
+        _save_motor_config(motor.cfg)
+    return True
+
+
 def sample_throttle_brake(samples=16, delay_ms=20):
     """Blocking wrapper that runs :func:`sample_throttle_brake_async`.
 
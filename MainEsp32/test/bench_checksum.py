@@ -0,0 +1,105 @@
+"""Compare the table-driven checksums against the old bit-loop versions.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_checksum.py
+
+Or on the device REPL (checksum.py in the root, viper enabled when available):
+    import bench_checksum
+    bench_checksum.run()
+
+Frame sizes follow the real traffic: a Modbus read request (6 B), a 19
+register slow-block response (41 B), an MSP telemetry frame with the slow block
+(51 B) and a full PR bridge payload (240 B). Results are checked for equality
+before timing. The xor8 row times ``bridge_protocol._checksum``, which only
+calls ``xor8_update`` on viper builds and keeps the inline loop otherwise.
+"""
+
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import ticks_diff, ticks_us
+
+import checksum
+from runtime import bridge_protocol
+
+FRAME_SIZES = (
+    ("modbus req", 6),
+    ("modbus resp", 41),
+    ("msp telem", 51),
+    ("pr bridge", 240),
+)
+
+
+def legacy_crc16(data):
+    crc = 0xFFFF
+    for pos in data:
+        crc ^= pos
+        for _ in range(8):
+            if (crc & 1) != 0:
+                crc >>= 1
+                crc ^= 0xA001
+            else:
+                crc >>= 1
+    return crc
+
+
+def legacy_xor(data):
+    value = 0
+    for byte in data:
+        value ^= byte
+    return value & 0xFF
+
+
+CASES = (
+    ("crc16", legacy_crc16, checksum.crc16_modbus),
+    ("xor8", legacy_xor, lambda buf: bridge_protocol._checksum(0, 0, buf)),
+)
+
+
+def _frame(size, seed):
+    return bytes(((idx * 73 + seed * 29 + 11) & 0xFF) for idx in range(size))
+
+
+def _check():
+    for size in range(0, 64):
+        data = _frame(size, size)
+        for name, old, new in CASES:
+            assert old(data) == new(data), (name, size)
+        assert checksum.xor8_update(0, data) == legacy_xor(data), ("xor8_update", size)
+    data = _frame(200, 7)
+    crc = checksum.crc16_update(checksum.CRC16_MODBUS_INIT, data, 0, 90)
+    assert checksum.crc16_update(crc, data, 90) == legacy_crc16(data)
+
+
+def _time(fn, data, loops):
+    t0 = ticks_us()
+    for _ in range(loops):
+        fn(data)
+    return max(1, ticks_diff(ticks_us(), t0))
+
+
+def run(loops=2000):
+    _check()
+    print("[bench_checksum] viper={} loops={}".format(checksum.VIPER, loops))
+    for label, size in FRAME_SIZES:
+        data = _frame(size, 1)
+        for name, old, new in CASES:
+            t_old = _time(old, data, loops)
+            t_new = _time(new, data, loops)
+            print(
+                "[bench_checksum] {:<12} {:>3} B {:<5} old {:>8} kB/s  new {:>8} kB/s  x{:.1f}".format(
+                    label,
+                    size,
+                    name,
+                    size * loops * 1000 // t_old,
+                    size * loops * 1000 // t_new,
+                    t_old / t_new,
+                )
+            )
+
+
+if __name__ == "__main__":
+    run()
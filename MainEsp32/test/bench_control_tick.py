@@ -0,0 +1,72 @@
+"""Control tick throughput: ticks/s of MotorControl._control_tick per mode.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_control_tick.py [ticks]
+
+Or on the device REPL (stop main.py first so the DACs are free):
+    import bench_control_tick
+    bench_control_tick.run()
+
+The tick runs with a bound state whose ``pr_frame()`` reports fixed speed and
+power, so the closed-loop modes go through their full PID path every tick;
+the DACs and ADCs are whatever ``machine`` provides. On CPython the harness
+maps ``machine`` (ADC/I2C/Pin), ``uasyncio`` and ``time.ticks_*`` onto the
+standard library.
+"""
+
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import host_modules
+
+MODES = ("open", "power", "speed", "torque", "mix")
+ROUNDS = 5  # best of, to ride out host scheduling noise
+
+
+class _Frame:
+    speed_kmh = 18.0
+    power_w = 240.0
+
+
+class _State:
+    battery_guard_active = False
+
+    def __init__(self):
+        self._frame = _Frame()
+
+    def pr_frame(self):
+        return self._frame
+
+
+def _bench_mode(mode, ticks):
+    from motor_control import MotorControl
+
+    motor = MotorControl(throttle_mode=mode)
+    motor.bind_state(_State())
+    motor._ensure_hw()
+    period_ms = int(motor.cfg["update_period_ms"])
+    tick = motor._control_tick
+    best_us = None
+    for _ in range(ROUNDS):
+        t0 = time.ticks_us()
+        for _ in range(ticks):
+            tick(time.ticks_ms(), period_ms)
+        elapsed_us = max(1, time.ticks_diff(time.ticks_us(), t0))
+        if best_us is None or elapsed_us < best_us:
+            best_us = elapsed_us
+    return ticks * 1000000 // best_us, best_us / ticks
+
+
+def run(ticks=5000):
+    host_modules()
+    for mode in MODES:
+        rate, per_tick = _bench_mode(mode, ticks)
+        print("[bench_control_tick] {:<6} {:>7} ticks/s  {:>5.1f} us/tick".format(mode, rate, per_tick))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,90 @@
+"""MotorControl tick jitter: coroutine (sleep) pacing vs timer pacing.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_control_timer.py [seconds]
+
+Or on the device REPL (stop main.py first so the DACs are free):
+    import bench_control_timer
+    bench_control_timer.run()
+
+A real MotorControl runs ``run()`` next to a fake UI task that busy-waits
+``DRAW_MS`` every ``UI_FRAME_MS``, once with the default sleep pacing and once
+with ``control_timer_enabled``; each pass prints the ``jitter`` block of
+``_monitor_snapshot()``. Sleep pacing drifts by the tick duration plus the
+time it waits behind the UI draw; timer pacing keeps the deadline grid, so the
+tick count stays at ``seconds * 1000 / period`` and only the wake-up latency
+remains. On CPython the harness maps ``machine`` (ADC/I2C/Pin/Timer on a
+thread), ``uasyncio``/``ThreadSafeFlag`` and ``time.ticks_*`` onto the
+standard library.
+"""
+
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import host_modules
+
+PERIOD_MS = 20
+UI_FRAME_MS = 30
+DRAW_MS = 8
+
+
+def _busy_ms(ms):
+    t0 = time.ticks_us()
+    while time.ticks_diff(time.ticks_us(), t0) < ms * 1000:
+        pass
+
+
+async def _ui(stop):
+    import uasyncio as asyncio
+
+    while not stop[0]:
+        _busy_ms(DRAW_MS)
+        await asyncio.sleep_ms(UI_FRAME_MS)
+
+
+async def _scenario(seconds, use_timer):
+    import uasyncio as asyncio
+    from motor_control import MotorControl
+
+    motor = MotorControl(throttle_mode="open", update_period_ms=PERIOD_MS, control_timer_enabled=use_timer)
+    stop = [False]
+    tasks = [asyncio.create_task(motor.run()), asyncio.create_task(_ui(stop))]
+    await asyncio.sleep_ms(int(seconds * 1000))
+    stop[0] = True
+    for task in tasks:
+        task.cancel()
+    await asyncio.sleep_ms(0)
+    return motor._monitor_snapshot()["jitter"]
+
+
+def _report(jitter, seconds):
+    print(
+        "[bench_control_timer] {:<5} ticks={:>4}/{:<4} late avg={:5.2f}ms max={:5.2f}ms missed={} overruns={}".format(
+            jitter["pacing"],
+            jitter["ticks"],
+            int(seconds * 1000 // PERIOD_MS),
+            jitter["avg_ms"] or 0.0,
+            jitter["max_ms"],
+            jitter["missed"],
+            jitter["overruns"],
+        )
+    )
+    edges = ["<{}".format(edge) for edge in jitter["buckets_ms"]] + [">={}".format(jitter["buckets_ms"][-1])]
+    print("[bench_control_timer]       hist " + " ".join("{}:{}".format(e, n) for e, n in zip(edges, jitter["hist"])))
+
+
+def run(seconds=3):
+    host_modules()
+    import uasyncio as asyncio
+
+    print("[bench_control_timer] period {} ms, ui draw {} ms every {} ms".format(PERIOD_MS, DRAW_MS, UI_FRAME_MS))
+    for use_timer in (False, True):
+        _report(asyncio.run(_scenario(seconds, use_timer)), seconds)
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 3)
@@ -0,0 +1,172 @@
+"""Per-frame draw time and SPI traffic of every dashboard in dashboard_order.json.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_dashboards.py [frames]
+
+Or on the device REPL (drivers/, fonts/, UI_helpers/ on the path):
+    import bench_dashboards
+    bench_dashboards.run()
+
+Each dashboard is drawn once from a full refresh, then ``frames`` times with
+one value ticking the way it does while riding (speed, current, trip
+pulses, a throttle ramp, a cursor moving through a list). Tick gating is
+bypassed so every frame draws. The report gives the average draw() time
+and the bytes the LCD pushed over SPI per frame. On CPython the harness
+reuses the pure-Python stand-ins from bench_text_render, whose blits are
+Python loops, so the times scale with the pixels touched.
+"""
+
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+import bench_text_render as _text_bench
+
+_GATES = ("_last_tick", "_last_f1", "_last_f2")
+
+
+class _CountingSPI:
+    def __init__(self):
+        self.bytes = 0
+
+    def write(self, buf):
+        self.bytes += len(buf)
+
+
+class _Display:
+    def __init__(self, lcd):
+        self.display = lcd
+
+
+def _host_modules():
+    _text_bench._host_modules()
+    try:
+        import uasyncio  # noqa: F401
+    except ImportError:
+        import asyncio
+
+        sys.modules["uasyncio"] = asyncio
+
+
+def _make_state():
+    from app_state import AppState
+
+    state = AppState()
+    state.battery_voltage_v = 75.2
+    state.battery_current_a = 8.5
+    state.trip_counter_available = True
+    state.sys_pmu_available = True
+    state.sys_vbat_v = 4.02
+    state.sys_vbus_v = 5.01
+    state.sys_vbus_ma = 120.0
+    state.pr.set("vehicle_speed", 23.0)
+    state.pr.set("motor_input_power", 640.0)
+    return state
+
+
+def _tick_layout(dash, state, frame):
+    state.pr.set("vehicle_speed", 23.0 + (frame % 5))
+    state.pr.set("motor_input_power", 640.0 + 7 * frame)
+
+
+def _tick_battery(dash, state, frame):
+    state.battery_current_a = 8.5 + 0.13 * frame
+
+
+def _tick_trip(dash, state, frame):
+    state.trip_pulses = 1200 + 7 * frame
+    state.trip_distance_m = state.trip_pulses * 0.1
+    state.trip_distance_km = None
+    state.trip_speed_kmh = 21.0 + 0.1 * frame
+
+
+def _tick_select(dash, state, frame):
+    dash._entered = True
+    dash.handle_event("down_short", state)
+
+
+def _tick_modes(dash, state, frame):
+    dash._entered = True
+    state.throttle_mode_index = frame % len(state.throttle_modes)
+
+
+def _tick_signals(dash, state, frame):
+    state.update_local_voltages = lambda: None
+    state.throttle_v = 0.9 + 0.03 * frame
+
+
+def _tick_sysbatt(dash, state, frame):
+    state.sys_vbat_v = 4.02 - 0.01 * frame
+
+
+def _dashboards():
+    from UI_helpers import (
+        DashboardBattSelect,
+        DashboardBattStatus,
+        DashboardLayout,
+        DashboardModes,
+        DashboardSignals,
+        DashboardSysBatt,
+        DashboardTrip,
+    )
+
+    return (
+        ("layout", DashboardLayout, _tick_layout),
+        ("battery_status", DashboardBattStatus, _tick_battery),
+        ("trip", DashboardTrip, _tick_trip),
+        ("battery_select", DashboardBattSelect, _tick_select),
+        ("modes", DashboardModes, _tick_modes),
+        ("signals", DashboardSignals, _tick_signals),
+        ("sysbatt", DashboardSysBatt, _tick_sysbatt),
+    )
+
+
+def _draw(dash, state):
+    for attr in _GATES:
+        if getattr(dash, attr, None) is not None:
+            setattr(dash, attr, None)
+    t0 = _text_bench._ticks_us()
+    dash.draw(state)
+    return _text_bench._ticks_diff(_text_bench._ticks_us(), t0)
+
+
+def run(frames=10):
+    _host_modules()
+    from drivers import lcd1p69
+
+    lcd1p69.Pin = _text_bench._Pin
+    spi = _CountingSPI()
+    lcd = lcd1p69.LCD1p69(spi, _text_bench._Pin(), _text_bench._Pin(), _text_bench._Pin(), None)
+    display = _Display(lcd)
+    state = _make_state()
+    total_us = 0
+    total_bytes = 0
+    print("[bench_dashboards] frames={}".format(frames))
+    for name, cls, tick in _dashboards():
+        dash = cls(display)
+        dash.request_full_refresh()
+        spi.bytes = 0
+        full_us = _draw(dash, state)
+        full_bytes = spi.bytes
+        spent = 0
+        spi.bytes = 0
+        for frame in range(frames):
+            tick(dash, state, frame + 1)
+            spent += _draw(dash, state)
+        per_us = spent // frames
+        per_bytes = spi.bytes // frames
+        total_us += per_us
+        total_bytes += per_bytes
+        print(
+            "[bench_dashboards] {:<15} full {:>8} us {:>6} B | frame {:>8} us {:>6} B".format(
+                name, full_us, full_bytes, per_us, per_bytes
+            )
+        )
+    print("[bench_dashboards] all frames {} us {} B".format(total_us, total_bytes))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10)
@@ -0,0 +1,104 @@
+"""Import time and heap: font_to_py modules vs .bfn containers.
+
+Run on the host from the MainEsp32 folder (after test/font_to_bin.py):
+    python test/bench_font_load.py
+
+Or on the device REPL:
+    import bench_font_load
+    bench_font_load.run()
+
+For every font in the sevenSegment_* family this loads the module and the
+container from scratch, reporting load time and heap held afterwards
+(gc.mem_alloc delta on MicroPython, tracemalloc on CPython), then times
+get_ch() over the digits the dashboards draw (served by the glyph cache of
+the container after the first pass).
+"""
+
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import alloc_start, alloc_stop, ticks_diff, ticks_us
+
+from fonts.binfont import BinaryFont
+
+FAMILY = (
+    "sevenSegment_16",
+    "sevenSegment_20",
+    "sevenSegment_24",
+    "sevenSegment_30",
+    "sevenSegment_40",
+    "sevenSegment_80",
+)
+TEXT = "0123456789-"
+
+
+def _forget(name):
+    full = "fonts." + name
+    if full in sys.modules:
+        del sys.modules[full]
+    import fonts
+
+    for attr in (name,):
+        if attr in fonts.__dict__:
+            del fonts.__dict__[attr]
+
+
+def _load_module(name):
+    _forget(name)
+    start = alloc_start(pause_gc=False)
+    t0 = ticks_us()
+    mod = __import__("fonts." + name, None, None, (name,))
+    elapsed = ticks_diff(ticks_us(), t0)
+    heap = alloc_stop(start, retained=True)
+    return mod, elapsed, heap
+
+
+def _load_binary(name):
+    start = alloc_start(pause_gc=False)
+    t0 = ticks_us()
+    font = BinaryFont("fonts/{}.bfn".format(name))
+    elapsed = ticks_diff(ticks_us(), t0)
+    heap = alloc_stop(start, retained=True)
+    return font, elapsed, heap
+
+
+def _time_get_ch(font, loops):
+    get_ch = font.get_ch
+    t0 = ticks_us()
+    for _ in range(loops):
+        for ch in TEXT:
+            get_ch(ch)
+    return max(1, ticks_diff(ticks_us(), t0))
+
+
+def run(loops=200):
+    total_mod = 0
+    total_bin = 0
+    for name in FAMILY:
+        try:
+            font, t_bin, heap_bin = _load_binary(name)
+        except OSError:
+            print("[bench_font_load] {:<16} no .bfn (run test/font_to_bin.py)".format(name))
+            continue
+        mod, t_mod, heap_mod = _load_module(name)
+        for ch in TEXT:
+            assert bytes(mod.get_ch(ch)[0]) == bytes(font.get_ch(ch)[0]), (name, ch)
+        calls = loops * len(TEXT)
+        g_mod = _time_get_ch(mod, loops)
+        g_bin = _time_get_ch(font, loops)
+        font.close()
+        total_mod += heap_mod
+        total_bin += heap_bin
+        print(
+            "[bench_font_load] {:<16} module {:>6} us {:>6} B | bfn {:>6} us {:>6} B | get_ch {:>5} vs {:>5} ns".format(
+                name, t_mod, heap_mod, t_bin, heap_bin, g_mod * 1000 // calls, g_bin * 1000 // calls
+            )
+        )
+    print("[bench_font_load] heap held: modules {} B, containers {} B".format(total_mod, total_bin))
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,187 @@
+"""Event-loop jitter while the LCD flushes: blocking show() vs show_async().
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_lcd_flush.py [frames]
+
+Or on the device REPL (drivers/ on the path):
+    import bench_lcd_flush
+    bench_lcd_flush.run()
+
+The panel is replaced by a fake SPI whose write() busy-waits for the time the
+bytes would take on the wire (40 MHz by default), so the numbers reflect the
+blocking behaviour of machine.SPI.write without real hardware. A 20 ms
+"control" task records how late each wake-up is while a UI task flushes full
+frames and typical dirty updates. On CPython the harness installs minimal
+``machine``/``framebuf`` stand-ins; the device uses the real modules.
+"""
+
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import ticks_diff, ticks_us
+
+try:
+    import uasyncio as asyncio  # type: ignore
+except ImportError:  # CPython
+    import asyncio  # type: ignore
+
+
+def _sleep_ms(ms):
+    fn = getattr(asyncio, "sleep_ms", None)
+    if fn is not None:
+        return fn(ms)
+    return asyncio.sleep(ms / 1000)
+
+
+def _host_modules():
+    """Minimal stand-ins so the driver imports on CPython (harness only)."""
+    import types
+
+    if not hasattr(time, "sleep_ms"):
+        time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    try:
+        import machine  # noqa: F401
+    except ImportError:
+        machine = types.ModuleType("machine")
+        machine.Pin = _Pin
+        machine.SPI = object
+        sys.modules["machine"] = machine
+    try:
+        import framebuf  # noqa: F401
+    except ImportError:
+        framebuf = types.ModuleType("framebuf")
+
+        class FrameBuffer:
+            def __init__(self, buf, width, height, fmt, stride=None):
+                self._buf = buf
+
+            def fill(self, c):
+                pass
+
+            def fill_rect(self, x, y, w, h, c):
+                pass
+
+        framebuf.FrameBuffer = FrameBuffer
+        framebuf.RGB565 = 1
+        sys.modules["framebuf"] = framebuf
+
+
+class FakeSPI:
+    """Counts bytes and blocks for their wire time, like machine.SPI.write."""
+
+    def __init__(self, baudrate=40_000_000):
+        self.baudrate = baudrate
+        self.bytes = 0
+        self.writes = 0
+
+    def write(self, buf):
+        n = len(buf)
+        self.bytes += n
+        self.writes += 1
+        wire_us = n * 8 * 1000000 // self.baudrate
+        t0 = ticks_us()
+        while ticks_diff(ticks_us(), t0) < wire_us:
+            pass
+
+
+class _Pin:
+    OUT = 1
+
+    def __init__(self):
+        self._value = 0
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def value(self, *args):
+        if args:
+            self._value = args[0]
+        return self._value
+
+
+def _make_lcd(spi):
+    from drivers import lcd1p69
+
+    lcd1p69.Pin = _Pin  # so _ensure_output accepts the fake pins as-is
+    return lcd1p69.LCD1p69(spi, _Pin(), _Pin(), _Pin(), None)
+
+
+async def _control(period_ms, samples, stop):
+    late = []
+    next_us = ticks_us()
+    while not stop[0]:
+        next_us += period_ms * 1000
+        wait = ticks_diff(next_us, ticks_us())
+        await _sleep_ms(max(0, wait // 1000))
+        lag = ticks_diff(ticks_us(), next_us)
+        if lag > 0:
+            late.append(lag)
+        else:
+            late.append(0)
+        if len(late) >= samples:
+            break
+    return late
+
+
+async def _ui(lcd, frames, use_async, stop):
+    width = lcd.width
+    for frame in range(frames):
+        if frame % 4 == 0:
+            lcd.framebuf.mark_all()  # dashboard switch / full refresh
+        else:
+            # Two digit cells of the layout dashboard changing.
+            lcd.framebuf.mark_dirty(147, 45, 43, 80)
+            lcd.framebuf.mark_dirty(width - 117, 137, 43, 80)
+        if use_async:
+            await lcd.show_async()
+        else:
+            lcd.show()
+        await _sleep_ms(50)
+    stop[0] = True
+
+
+async def _scenario(lcd, frames, use_async):
+    stop = [False]
+    ui = asyncio.create_task(_ui(lcd, frames, use_async, stop))
+    late = await _control(20, frames * 4, stop)
+    await ui
+    return late
+
+
+def _report(label, late):
+    late = sorted(late)
+    count = len(late)
+    avg = sum(late) // max(1, count)
+    p99 = late[min(count - 1, count * 99 // 100)] if count else 0
+    worst = late[-1] if count else 0
+    print(
+        "[bench_lcd_flush] {:<12} ticks={:>4} avg={:>6}us p99={:>6}us max={:>6}us".format(
+            label, count, avg, p99, worst
+        )
+    )
+    return worst
+
+
+def run(frames=40, baudrate=40_000_000):
+    _host_modules()
+    spi = FakeSPI(baudrate)
+    lcd = _make_lcd(spi)
+    print("[bench_lcd_flush] {}x{} @ {} MHz, frames={}".format(lcd.width, lcd.height, baudrate // 1000000, frames))
+    spi.bytes = 0
+    blocking = _report("show()", asyncio.run(_scenario(lcd, frames, False)))
+    sent_sync = spi.bytes
+    spi.bytes = 0
+    yielding = _report("show_async()", asyncio.run(_scenario(lcd, frames, True)))
+    print(
+        "[bench_lcd_flush] bytes sync={} async={} worst-case lateness x{:.1f} lower".format(
+            sent_sync, spi.bytes, blocking / max(1, yielding)
+        )
+    )
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 40)
@@ -0,0 +1,141 @@
+"""Benchmark MSPParser vs MSPStreamParser on a recorded or synthetic byte stream.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_msp_parser.py [capture.bin] [chunk_bytes]
+
+Or on the device REPL:
+    import bench_msp_parser
+    bench_msp_parser.run()
+
+Without a capture file a stream of telemetry frames (every 20th with the slow
+block), command responses and some line noise is generated. Reports frames/s
+(untraced pass), bytes allocated and the error counters of both parsers.
+
+Bytes allocated is a second pass over fresh parsers: the gc.mem_alloc delta
+with the collector disabled on MicroPython; on CPython the tracemalloc peak
+above the live heap, reset before each feed and summed over feeds (transient
+objects freed inside one feed count once at their high-water mark). The
+stream rows drive ``push()``/``next_frame()`` like the PR worker; ``stream+pl``
+also reads ``frame.payload`` for every frame, and ``stream-it`` iterates
+``frames()``, which on CPython pays for a StopIteration per feed.
+"""
+
+import sys
+
+try:
+    import ustruct as struct  # type: ignore
+except ImportError:  # CPython fallback
+    import struct  # type: ignore
+
+if __name__ == "__main__" and "runtime" not in sys.modules:
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import AllocCounter, ticks_diff, ticks_us
+
+from runtime import bridge_protocol as proto
+
+
+def synth_stream(frames=2000):
+    out = bytearray()
+    for seq in range(frames):
+        slow = (seq % 20) == 0
+        payload = bytearray([1 if slow else 0])
+        payload.extend(struct.pack("<HI", seq & 0xFFFF, seq * 50))
+        for idx in range(11 if slow else 3):
+            payload.extend(struct.pack("<f", seq * 0.1 + idx))
+        out.extend(proto.build_frame(proto.DIR_FROM_DEVICE, proto.CMD_TELEMETRY, payload))
+        if seq % 50 == 0:
+            out.extend(proto.build_frame(proto.DIR_FROM_DEVICE, proto.CMD_PING, struct.pack("<HBIH", seq, 0, seq, seq)))
+        if seq % 97 == 0:
+            out.extend(b"\x00\x24garbage\x4d")
+        if seq % 211 == 0:
+            bad = bytearray(proto.build_frame(proto.DIR_FROM_DEVICE, proto.CMD_TELEMETRY, payload))
+            bad[-1] ^= 0xFF
+            out.extend(bad)
+    return bytes(out)
+
+
+def _feed_legacy(parser, chunk):
+    return len(parser.feed(chunk))
+
+
+def _feed_stream(parser, chunk):
+    count = 0
+    parser.push(chunk)
+    while parser.next_frame() is not None:
+        count += 1
+    return count
+
+
+def _feed_stream_payload(parser, chunk):
+    count = 0
+    parser.push(chunk)
+    while True:
+        frame = parser.next_frame()
+        if frame is None:
+            return count
+        count += len(frame.payload) and 1
+
+
+def _feed_stream_iter(parser, chunk):
+    count = 0
+    for _frame in parser.frames(chunk):
+        count += 1
+    return count
+
+
+def _bench(label, make_parser, feed, chunks, nbytes):
+    parser = make_parser()
+    t0 = ticks_us()
+    frames = 0
+    for chunk in chunks:
+        frames += feed(parser, chunk)
+    elapsed = max(1, ticks_diff(ticks_us(), t0))
+
+    counted = make_parser()
+    counter = AllocCounter()
+    counter.start()
+    for chunk in chunks:
+        counter.feed(feed, counted, chunk)
+    allocated = counter.stop()
+
+    rate = frames * 1000000 // elapsed
+    per_frame = allocated / frames if frames and allocated >= 0 else -1
+    print(
+        "[bench_msp] {:<9} frames={} {:.1f} ms {} frames/s {} kB/s alloc={}B ({:.1f}B/frame) errors={}".format(
+            label,
+            frames,
+            elapsed / 1000,
+            rate,
+            nbytes * 1000 // elapsed,
+            allocated,
+            per_frame,
+            parser.errors,
+        )
+    )
+    return frames, dict(parser.errors)
+
+
+def run(stream=None, chunk=64):
+    if stream is None:
+        stream = synth_stream()
+    chunks = [stream[i:i + chunk] for i in range(0, len(stream), chunk)]
+    print("[bench_msp] stream {} bytes in {} chunks of {}".format(len(stream), len(chunks), chunk))
+    legacy = _bench("legacy", proto.MSPParser, _feed_legacy, chunks, len(stream))
+    stream_res = _bench("stream", proto.MSPStreamParser, _feed_stream, chunks, len(stream))
+    _bench("stream+pl", proto.MSPStreamParser, _feed_stream_payload, chunks, len(stream))
+    _bench("stream-it", proto.MSPStreamParser, _feed_stream_iter, chunks, len(stream))
+    if legacy != stream_res:
+        print("[bench_msp] note: results differ (legacy drops frames after '$$M')")
+
+
+if __name__ == "__main__":
+    data = None
+    size = 64
+    if len(sys.argv) > 1 and sys.argv[1]:
+        with open(sys.argv[1], "rb") as fh:
+            data = fh.read()
+    if len(sys.argv) > 2:
+        size = int(sys.argv[2])
+    run(data, size)
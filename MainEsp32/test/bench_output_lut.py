@@ -0,0 +1,161 @@
+"""Output LUT check: codes from ``_OutputLut`` against the float path.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_output_lut.py [configs]
+
+Or on the device REPL:
+    import bench_output_lut
+    bench_output_lut.run()
+
+For the defaults and ``configs`` random output/brake settings (including
+out-of-range ones such as output max above ``dac_vref`` or brake max below
+the threshold) the sweep walks the throttle ratio and the brake volts across
+their range and compares ``lut.codes()`` with
+``_volts_to_dac12(compute_output_voltages(...))``; any difference above one
+LSB fails. Configs with an inverted throttle output range get no LUT and
+are skipped. It then checks that ``reload_config`` keeps the tables for
+unrelated keys and rebuilds them when an output setting changes, and times
+both paths. On CPython the harness maps ``machine`` (ADC/I2C/Pin) and
+``uasyncio`` onto the standard library.
+"""
+
+import random
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import host_modules
+
+RATIO_STEPS = 20000
+BRAKE_STEPS = 5000
+TIMED_CALLS = 20000
+ROUNDS = 5  # best of, to ride out host scheduling noise
+SEED = 25
+
+
+def _random_cfg(rng):
+    vref = rng.uniform(2.8, 3.6)
+    threshold = rng.uniform(0.8, 2.0)
+    return {
+        "dac_vref": vref,
+        "throttle_output_min": rng.uniform(-0.2, 2.0),
+        "throttle_output_max": rng.uniform(1.0, 4.0),
+        "throttle_factor": rng.uniform(0.0, 1.2),
+        "brake_input_threshold": threshold,
+        "brake_input_max": threshold + rng.uniform(-0.3, 1.5),
+        "brake_output_min": rng.uniform(-0.2, 2.0),
+        "brake_output_max": rng.uniform(1.0, 4.0),
+        "brake_factor": rng.uniform(0.0, 1.2),
+    }
+
+
+def _sweep(cc):
+    from motor_control import _volts_to_dac12, compute_output_voltages
+
+    lut = cc.lut
+    vref = cc.dac_vref
+    worst = 0
+    points = 0
+    vb_idle = cc.brake_threshold - 0.5
+    for step in range(RATIO_STEPS + 1):
+        ratio = step / RATIO_STEPS
+        out_tr, out_br = compute_output_voltages(0.0, vb_idle, cc, control_ratio=ratio)
+        got = lut.codes(vb_idle, ratio)
+        worst = max(worst, abs(got[0] - _volts_to_dac12(out_tr, vref)), abs(got[1] - _volts_to_dac12(out_br, vref)))
+        points += 1
+    low = cc.brake_threshold - 0.2
+    high = cc.brake_threshold + abs(cc.brake_span) + 0.2
+    for step in range(BRAKE_STEPS + 1):
+        vb = low + (high - low) * step / BRAKE_STEPS
+        out_tr, out_br = compute_output_voltages(0.0, vb, cc, control_ratio=0.5)
+        got = lut.codes(vb, 0.5)
+        worst = max(worst, abs(got[0] - _volts_to_dac12(out_tr, vref)), abs(got[1] - _volts_to_dac12(out_br, vref)))
+        points += 1
+    return worst, points
+
+
+def _check_rebuild():
+    from motor_control import MotorControl
+
+    motor = MotorControl()
+    lut = motor._cc.lut
+    motor.reload_config({"throttle_mode": "speed", "pid_power_kp": 0.5, "adc_tr_offset": 0.2})
+    assert motor._cc.lut is lut, "LUT rebuilt for keys it does not depend on"
+    motor.reload_config({"throttle_output_max": 3.0})
+    assert motor._cc.lut is not lut, "LUT kept after an output setting changed"
+    motor.reload_config({"dac_output_lut": False})
+    assert motor._cc.lut is None, "dac_output_lut=False still builds a LUT"
+
+
+def _best_us(fn, calls):
+    best = None
+    for _ in range(ROUNDS):
+        t0 = time.ticks_us()
+        fn(calls)
+        elapsed = time.ticks_diff(time.ticks_us(), t0)
+        if best is None or elapsed < best:
+            best = elapsed
+    return max(1, best) / calls
+
+
+def _timing(cc):
+    from motor_control import _volts_to_dac12, compute_output_voltages
+
+    lut = cc.lut
+    vref = cc.dac_vref
+    vb_idle = cc.brake_threshold - 0.5
+
+    def exact(calls):
+        for idx in range(calls):
+            out_tr, out_br = compute_output_voltages(0.0, vb_idle, cc, control_ratio=(idx & 1023) / 1023)
+            _volts_to_dac12(out_tr, vref)
+            _volts_to_dac12(out_br, vref)
+
+    def table(calls):
+        for idx in range(calls):
+            lut.codes(vb_idle, (idx & 1023) / 1023)
+
+    return _best_us(exact, TIMED_CALLS), _best_us(table, TIMED_CALLS)
+
+
+def run(configs=200):
+    host_modules()
+    from motor_control import DEFAULTS, _ControlConfig
+
+    rng = random.Random(SEED) if hasattr(random, "Random") else random
+    cfgs = [DEFAULTS.copy()]
+    for _ in range(configs):
+        cfg = DEFAULTS.copy()
+        cfg.update(_random_cfg(rng))
+        cfgs.append(cfg)
+    worst = 0
+    points = 0
+    float_path = 0
+    for cfg in cfgs:
+        cc = _ControlConfig(cfg)
+        if cc.build_lut(cfg) is None:
+            float_path += 1
+            continue
+        cfg_worst, cfg_points = _sweep(cc)
+        points += cfg_points
+        if cfg_worst > worst:
+            worst = cfg_worst
+        assert cfg_worst <= 1, "LUT off by {} LSB for {}".format(cfg_worst, cfg)
+    print(
+        "[bench_output_lut] {} configs ({} left on the float path), {} points, max |lut - exact| = {} LSB".format(
+            len(cfgs), float_path, points, worst
+        )
+    )
+    _check_rebuild()
+    print("[bench_output_lut] reload_config keeps/rebuilds the LUT as expected")
+    cc = _ControlConfig(DEFAULTS)
+    cc.build_lut(DEFAULTS)
+    exact_us, table_us = _timing(cc)
+    print("[bench_output_lut] exact {:.2f} us/call  lut {:.2f} us/call".format(exact_us, table_us))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,167 @@
+"""Benchmark the old name->(value, unit) dict against the slot-indexed PRStore.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_pr_store.py [loops]
+
+Or on the device REPL:
+    import bench_pr_store
+    bench_pr_store.run()
+
+Writes publish every bridge field once per "frame"; reads replay what one
+control tick plus one dashboard frame does (speed, power, voltage, current,
+calc voltage). Reports ops/s and heap (gc.mem_alloc delta on MicroPython,
+tracemalloc peak on CPython) for holding a full set of fields and for the
+read/write loops.
+"""
+
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import alloc_start, alloc_stop, ticks_diff, ticks_us
+
+try:
+    import _thread
+except ImportError:  # pragma: no cover
+    import threading as _thread  # type: ignore
+
+import pr_store
+from pr_store import (
+    PRStore,
+    PR_BATT_VOLTAGE_CALC,
+    PR_BATTERY_CURRENT,
+    PR_BATTERY_VOLTAGE,
+    PR_FIELDS,
+    PR_MOTOR_INPUT_POWER,
+    PR_UNITS,
+    PR_VEHICLE_SPEED,
+)
+
+class LegacyStore:
+    """The previous AppState.pr handling, kept verbatim for comparison."""
+
+    def __init__(self):
+        self._lock = _thread.allocate_lock()
+        self.pr = {}
+
+    def set_pr(self, name, value, unit):
+        with self._lock:
+            self.pr[name] = (value, unit)
+            if name == "vehicle_speed_PR":
+                self.pr["vehicle_speed"] = (value, unit)
+
+    def get_pr(self, name, default=(None, "")):
+        with self._lock:
+            return self.pr.get(name, default)
+
+
+READ_NAMES = ("vehicle_speed_PR", "motor_input_power", "battery_voltage", "battery_current", "batt_voltage_calc")
+READ_SLOTS = (PR_VEHICLE_SPEED, PR_MOTOR_INPUT_POWER, PR_BATTERY_VOLTAGE, PR_BATTERY_CURRENT, PR_BATT_VOLTAGE_CALC)
+
+
+def _fill_legacy(store, frame):
+    for idx, name in enumerate(PR_FIELDS):
+        store.set_pr(name, frame + idx * 0.5, PR_UNITS[idx])
+
+
+def _fill_new(store, frame):
+    for idx, name in enumerate(PR_FIELDS):
+        store.set(name, frame + idx * 0.5, PR_UNITS[idx])
+
+
+def _fill_slots(store, frame):
+    for idx in range(len(PR_FIELDS)):
+        store.set_value(idx, frame + idx * 0.5)
+
+
+def _read_legacy(store, loops):
+    total = 0.0
+    for _ in range(loops):
+        for name in READ_NAMES:
+            value = store.get_pr(name, (None, ""))[0]
+            if value is not None:
+                total += value
+    return total
+
+
+def _read_names(store, loops):
+    total = 0.0
+    for _ in range(loops):
+        for name in READ_NAMES:
+            value = store.get(name, (None, ""))[0]
+            if value is not None:
+                total += value
+    return total
+
+
+def _read_slots(store, loops):
+    total = 0.0
+    value_fn = store.value
+    for _ in range(loops):
+        for slot in READ_SLOTS:
+            value = value_fn(slot)
+            if value is not None:
+                total += value
+    return total
+
+
+def _measure(label, fn, ops):
+    start = alloc_start()
+    t0 = ticks_us()
+    fn()
+    elapsed = max(1, ticks_diff(ticks_us(), t0))
+    heap = alloc_stop(start)
+    print(
+        "[bench_pr_store] {:<22} {:>9} ops/s  heap={}B".format(
+            label, ops * 1000000 // elapsed, heap
+        )
+    )
+
+
+def _footprint(label, factory, fill):
+    start = alloc_start()
+    store = factory()
+    fill(store, 1)
+    heap = alloc_stop(start)
+    print("[bench_pr_store] {:<22} {} fields held in {}B".format(label, len(PR_FIELDS), heap))
+    return store
+
+
+def run(loops=2000):
+    frames = max(1, loops // 10)
+    legacy = _footprint("store legacy", LegacyStore, _fill_legacy)
+    store = _footprint("store array", PRStore, _fill_new)
+
+    for name in READ_NAMES:
+        assert abs(legacy.get_pr(name)[0] - store.get(name)[0]) < 1e-3, name
+    assert store.get("vehicle_speed") == store.get("vehicle_speed_PR")
+    assert store.value(PR_BATTERY_CURRENT) == store.get("battery_current")[0]
+
+    writes = frames * len(PR_FIELDS)
+    reads = loops * len(READ_NAMES)
+
+    def _w_legacy():
+        for frame in range(frames):
+            _fill_legacy(legacy, frame)
+
+    def _w_names():
+        for frame in range(frames):
+            _fill_new(store, frame)
+
+    def _w_slots():
+        for frame in range(frames):
+            _fill_slots(store, frame)
+
+    _measure("write legacy set_pr", _w_legacy, writes)
+    _measure("write set(name)", _w_names, writes)
+    _measure("write set_value(slot)", _w_slots, writes)
+    _measure("read legacy get_pr", lambda: _read_legacy(legacy, loops), reads)
+    _measure("read get_pr shim", lambda: _read_names(store, loops), reads)
+    _measure("read value(slot)", lambda: _read_slots(store, loops), reads)
+    print("[bench_pr_store] slots={} module={}".format(pr_store.PR_SLOT_COUNT, pr_store.__name__))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
@@ -0,0 +1,259 @@
+"""Throughput of text rendering (widgets.Label): palette blit vs per-pixel recolor.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_text_render.py [loops]
+
+Or on the device REPL (drivers/, fonts/ and UI_helpers/ on the path):
+    import bench_text_render
+    bench_text_render.run()
+
+"legacy" replays the previous path verbatim: Writer drawing each glyph pixel
+by pixel followed by _recolor_region reading and rewriting every pixel of
+the text box. "current" is a widgets.Label redraw as shipped (one palette blit
+per glyph, no recolor pass) and "cached" adds the shared GlyphCache (one
+plain RGB565 blit per glyph). All must leave identical framebuffer bytes.
+Cases are the layout dashboard's readouts: two 80 px speed digits, four
+80 px power digits and a 20 px unit label.
+
+On CPython the harness installs pure-Python ``machine``/``framebuf``/
+``uctypes`` stand-ins. Their blit is itself a Python loop, so host figures
+only show the saving from dropping the recolor pass; on the board the blit is
+native and the gap is far larger.
+"""
+
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+
+
+def _ticks_us():
+    fn = getattr(time, "ticks_us", None)
+    if fn is not None:
+        return fn()
+    return int(time.perf_counter() * 1000000)
+
+
+def _ticks_diff(a, b):
+    fn = getattr(time, "ticks_diff", None)
+    if fn is not None:
+        return fn(a, b)
+    return a - b
+
+
+class _Pin:
+    OUT = 1
+
+    def __init__(self, *args, **kwargs):
+        self._value = 0
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def value(self, *args):
+        if args:
+            self._value = args[0]
+        return self._value
+
+
+class _Anything:
+    """Accepts any attribute or call; HW.py touches ADC/I2C at import time."""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return _Anything()
+
+    def __call__(self, *args, **kwargs):
+        return _Anything()
+
+
+class _NullSPI:
+    def write(self, buf):
+        pass
+
+
+def _host_modules():
+    """Pure-Python stand-ins so the driver and Writer import on CPython."""
+    import types
+
+    if not hasattr(time, "sleep_ms"):
+        time.sleep_ms = lambda ms: time.sleep(ms / 1000)
+    if not hasattr(time, "ticks_ms"):
+        time.ticks_ms = lambda: int(time.perf_counter() * 1000)
+        time.ticks_diff = lambda a, b: a - b
+    try:
+        import machine  # noqa: F401
+    except ImportError:
+        machine = types.ModuleType("machine")
+        machine.Pin = _Pin
+        machine.SPI = object
+        machine.__getattr__ = lambda name: _Anything()
+        sys.modules["machine"] = machine
+    try:
+        import uctypes  # noqa: F401
+    except ImportError:
+        uctypes = types.ModuleType("uctypes")
+        uctypes.addressof = lambda obj: obj
+        uctypes.bytearray_at = lambda obj, size: bytearray(obj)
+        sys.modules["uctypes"] = uctypes
+    try:
+        import framebuf  # noqa: F401
+    except ImportError:
+        sys.modules["framebuf"] = _py_framebuf(types.ModuleType("framebuf"))
+
+
+def _py_framebuf(mod):
+    mod.RGB565 = 1
+    mod.MONO_HLSB = 3
+    mod.MONO_HMSB = 4
+
+    class FrameBuffer:
+        def __init__(self, buf, width, height, fmt, stride=None):
+            self._buf = buf
+            self._w = width
+            self._h = height
+            self._fmt = fmt
+            self._stride = width if stride is None else stride
+
+        def _get(self, x, y):
+            if self._fmt == mod.RGB565:
+                idx = (y * self._stride + x) * 2
+                return self._buf[idx] | (self._buf[idx + 1] << 8)
+            byte = self._buf[y * ((self._stride + 7) // 8) + (x >> 3)]
+            bit = 7 - (x & 7) if self._fmt == mod.MONO_HLSB else x & 7
+            return (byte >> bit) & 1
+
+        def pixel(self, x, y, c=None):
+            if not (0 <= x < self._w and 0 <= y < self._h):
+                return None
+            if c is None:
+                return self._get(x, y)
+            idx = (y * self._stride + x) * 2
+            self._buf[idx] = c & 0xFF
+            self._buf[idx + 1] = (c >> 8) & 0xFF
+
+        def fill_rect(self, x, y, w, h, c):
+            x0 = max(0, x)
+            x1 = min(self._w, x + w)
+            if x1 <= x0:
+                return
+            row = bytes((c & 0xFF, (c >> 8) & 0xFF)) * (x1 - x0)
+            for yy in range(max(0, y), min(self._h, y + h)):
+                idx = (yy * self._stride + x0) * 2
+                self._buf[idx : idx + len(row)] = row
+
+        def fill(self, c):
+            self.fill_rect(0, 0, self._w, self._h, c)
+
+        def blit(self, src, x, y, key=-1, palette=None):
+            for yy in range(src._h):
+                for xx in range(src._w):
+                    value = src._get(xx, yy)
+                    if palette is not None:
+                        value = palette._get(value, 0)
+                    if value != key:
+                        self.pixel(x + xx, y + yy, value)
+
+    mod.FrameBuffer = FrameBuffer
+    return mod
+
+
+def _legacy_recolor(lcd, x, y, width, height, fg, bg):
+    if width <= 0 or height <= 0:
+        return
+    pixel = lcd.pixel
+    x_end = min(lcd.width, x + width)
+    y_end = min(lcd.height, y + height)
+    for py in range(max(0, y), y_end):
+        for px in range(max(0, x), x_end):
+            pixel(px, py, fg if pixel(px, py) else bg)
+
+
+def _legacy_render(widgets, lcd, writer, font_mod, text, x, y, area_width, bg):
+    from UI_helpers.writer import Writer
+
+    height = font_mod.height()
+    lcd.fill_rect(x, y, area_width, height, bg)
+    Writer.set_textpos(lcd.framebuf, y, x)
+    writer._use_palette = False  # the old Writer never took the palette path
+    try:
+        writer.printstring(text)
+    finally:
+        writer._use_palette = True
+    width = min(widgets.text_width(font_mod, text), area_width)
+    _legacy_recolor(lcd, x, y, width, height, widgets.FG, widgets.BG)
+    return width
+
+
+def _make_lcd():
+    from drivers import lcd1p69
+
+    lcd1p69.Pin = _Pin
+    return lcd1p69.LCD1p69(_NullSPI(), _Pin(), _Pin(), _Pin(), None)
+
+
+def _time(fn, loops):
+    t0 = _ticks_us()
+    for _ in range(loops):
+        fn()
+    return max(1, _ticks_diff(_ticks_us(), t0))
+
+
+def run(loops=20):
+    _host_modules()
+    import fonts
+    from UI_helpers import widgets
+    from UI_helpers.glyph_cache import GlyphCache
+    from UI_helpers.writer import Writer
+
+    lcd = _make_lcd()
+    cache = GlyphCache()
+    large = fonts.load("sevenSegment_80")
+    small = fonts.load("sevenSegment_20")
+    cases = (
+        ("speed 80px", large, "88", 150, 45),
+        ("power 80px", large, "2450", 40, 137),
+        ("unit 20px", small, "watts", 170, 197),
+    )
+    print("[bench_text_render] loops={}".format(loops))
+    for label, font_mod, text, x, y in cases:
+        writer = Writer(lcd.framebuf, font_mod, verbose=False)
+        writer.setcolor(widgets.FG, widgets.BG)
+        writer.set_clip(col_clip=True, wrap=False)
+        width = widgets.text_width(font_mod, text) + 4
+        label_widget = widgets.Label(lcd, font_mod, x, y, width, writer=writer, text=text)
+
+        def render():
+            label_widget.invalidate()
+            label_widget.render()
+
+        lcd.fill(0)
+        _legacy_render(widgets, lcd, writer, font_mod, text, x, y, width, widgets.BG)
+        legacy_bytes = bytes(lcd.buffer)
+        lcd.fill(0)
+        render()
+        assert bytes(lcd.buffer) == legacy_bytes, label
+        Writer.glyph_cache = cache
+        lcd.fill(0)
+        render()
+        assert bytes(lcd.buffer) == legacy_bytes, label + " cached"
+        Writer.glyph_cache = None
+
+        t_old = _time(lambda: _legacy_render(widgets, lcd, writer, font_mod, text, x, y, width, widgets.BG), loops)
+        t_new = _time(render, loops)
+        Writer.glyph_cache = cache
+        t_cached = _time(render, loops)
+        Writer.glyph_cache = None
+        print(
+            "[bench_text_render] {:<11} {:>2} ch  legacy {:>7} us  current {:>7} us  cached {:>7} us".format(
+                label, len(text), t_old // loops, t_new // loops, t_cached // loops
+            )
+        )
+    print("[bench_text_render] glyph cache {}".format(cache.stats()))
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
@@ -0,0 +1,219 @@
+"""Control-loop lateness under UI load: fixed-interval ui_task vs FrameScheduler.
+
+Run on the host from the MainEsp32 folder:
+    python test/bench_ui_scheduler.py [seconds]
+
+Or on the device REPL (runtime/ on the path):
+    import bench_ui_scheduler
+    bench_ui_scheduler.run()
+
+A fake widget dashboard busy-waits ``WIDGET_MS`` per widget it draws:
+``DRAW_MS`` worth of widgets change every frame and a full refresh redraws
+``FULL_MS`` more. Like ``Row.render`` it stops at the slot's render deadline
+and finishes in the next slots. A 20 ms "control" task, standing in
+for MotorControl.run, records how late each wake-up is and publishes its
+period overrun as the scheduler's lag source. Full refreshes are requested
+every ``REFRESH_EVERY_MS`` like page switches, and during ``BURST_WINDOW`` a
+third task adds ``BURST_MS`` of work every ``BURST_EVERY_MS``. "fixed" replays
+the previous ui_task pacing (draw, then sleep the configured interval);
+"scheduler" runs runtime.tasks.ui_task with a FrameScheduler. Besides
+control lateness it reports draw slots per second and widgets drawn per
+second (the UI throughput, whatever the slicing). On CPython the harness maps
+``uasyncio``/``time.ticks_*`` onto the standard library.
+"""
+
+import sys
+import time
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+    sys.path.insert(0, "test")
+
+from bench_util import host_modules
+
+CONTROL_MS = 20
+UI_FRAME_MS = 40
+WIDGET_MS = 5
+DRAW_MS = 25
+FULL_MS = 60
+REFRESH_EVERY_MS = 700
+# Other work (PR bridge bursts, GC) loading the loop during part of the run.
+BURST_MS = 25
+BURST_EVERY_MS = 15
+BURST_WINDOW = (0.4, 0.7)  # fraction of the run
+
+
+def _busy_ms(ms):
+    t0 = time.ticks_us()
+    while time.ticks_diff(time.ticks_us(), t0) < ms * 1000:
+        pass
+
+
+class _State:
+    screen = 0
+
+
+class _Dashboard:
+    """Stands in for a DashboardBase with a flat widget tree."""
+
+    render_deadline = None
+    render_pending = False
+
+    def __init__(self):
+        self.refresh_requests = 0
+        self._needs_full_refresh = True
+        self._invalid = [True] * ((DRAW_MS + FULL_MS) // WIDGET_MS)
+        self.frames = 0
+        self.draws = 0
+        self.widgets_drawn = 0
+
+    def request_full_refresh(self):
+        self.refresh_requests += 1
+        self._needs_full_refresh = True
+
+    def draw(self, state):
+        invalid = self._invalid
+        count = len(invalid) if self._needs_full_refresh else DRAW_MS // WIDGET_MS
+        self._needs_full_refresh = False
+        for idx in range(count):
+            invalid[idx] = True
+        self.frames += 1
+        self._render()
+
+    def resume_render(self):
+        self._render()
+
+    def _render(self):
+        deadline = self.render_deadline
+        invalid = self._invalid
+        drawn = 0
+        for idx in range(len(invalid)):
+            if not invalid[idx]:
+                continue
+            if drawn and deadline is not None and time.ticks_diff(time.ticks_ms(), deadline) >= 0:
+                break
+            _busy_ms(WIDGET_MS)
+            invalid[idx] = False
+            drawn += 1
+        self.render_pending = deadline is not None and time.ticks_diff(time.ticks_ms(), deadline) >= 0
+        self.draws += 1
+        self.widgets_drawn += drawn
+
+
+class _Control:
+    def __init__(self):
+        self.late = []
+        self.period_avg = None
+
+    def lag_ms(self):
+        if self.period_avg is None:
+            return 0
+        return self.period_avg - CONTROL_MS
+
+    async def run(self, stop):
+        import uasyncio as asyncio
+
+        last = time.ticks_us()
+        next_us = last
+        while not stop[0]:
+            next_us += CONTROL_MS * 1000
+            wait = time.ticks_diff(next_us, time.ticks_us())
+            await asyncio.sleep_ms(max(0, wait // 1000))
+            now = time.ticks_us()
+            self.late.append(max(0, time.ticks_diff(now, next_us)))
+            period = time.ticks_diff(now, last) / 1000
+            last = now
+            if self.period_avg is None:
+                self.period_avg = period
+            else:
+                self.period_avg += 0.2 * (period - self.period_avg)
+            _busy_ms(2)  # ADC + compute + DAC
+            next_us = max(next_us, time.ticks_us() - CONTROL_MS * 1000)
+
+
+async def _fixed_ui(dash, state, stop):
+    import uasyncio as asyncio
+
+    while not stop[0]:
+        dash.draw(state)
+        await asyncio.sleep_ms(UI_FRAME_MS)
+
+
+async def _refresher(dash, stop):
+    import uasyncio as asyncio
+
+    while not stop[0]:
+        await asyncio.sleep_ms(REFRESH_EVERY_MS)
+        dash.request_full_refresh()
+
+
+async def _burst(seconds, stop):
+    import uasyncio as asyncio
+
+    start, end = BURST_WINDOW
+    await asyncio.sleep_ms(int(seconds * start * 1000))
+    t0 = time.ticks_ms()
+    while not stop[0] and time.ticks_diff(time.ticks_ms(), t0) < seconds * (end - start) * 1000:
+        _busy_ms(BURST_MS)
+        await asyncio.sleep_ms(BURST_EVERY_MS)
+
+
+async def _scenario(seconds, use_scheduler):
+    import uasyncio as asyncio
+    from runtime.tasks import ui_task
+    from runtime.ui_scheduler import FrameScheduler
+
+    stop = [False]
+    dash = _Dashboard()
+    control = _Control()
+    scheduler = None
+    tasks = [
+        asyncio.create_task(control.run(stop)),
+        asyncio.create_task(_refresher(dash, stop)),
+        asyncio.create_task(_burst(seconds, stop)),
+    ]
+    if use_scheduler:
+        scheduler = FrameScheduler(lambda: UI_FRAME_MS, lag_source=control.lag_ms)
+        tasks.append(asyncio.create_task(ui_task([dash], _State(), lambda: UI_FRAME_MS, scheduler=scheduler)))
+    else:
+        tasks.append(asyncio.create_task(_fixed_ui(dash, _State(), stop)))
+    await asyncio.sleep_ms(int(seconds * 1000))
+    stop[0] = True
+    for task in tasks:
+        task.cancel()
+    await asyncio.sleep_ms(0)
+    return control.late, dash, scheduler
+
+
+def _report(label, late, dash, seconds):
+    late = sorted(late)
+    count = len(late)
+    avg = sum(late) // max(1, count)
+    p99 = late[min(count - 1, count * 99 // 100)] if count else 0
+    worst = late[-1] if count else 0
+    print(
+        "[bench_ui_scheduler] {:<9} ticks={:>4} late avg={:>6}us p99={:>6}us max={:>6}us  ui {:.1f} fps {:.1f} slots/s {:.0f} widgets/s".format(
+            label, count, avg, p99, worst, dash.frames / seconds, dash.draws / seconds, dash.widgets_drawn / seconds
+        )
+    )
+
+
+def run(seconds=3):
+    host_modules()
+    import uasyncio as asyncio
+
+    print(
+        "[bench_ui_scheduler] control {} ms, ui {} ms, draw {} ms (+{} ms full every {} ms) in {} ms widgets".format(
+            CONTROL_MS, UI_FRAME_MS, DRAW_MS, FULL_MS, REFRESH_EVERY_MS, WIDGET_MS
+        )
+    )
+    late, dash, _ = asyncio.run(_scenario(seconds, False))
+    _report("fixed", late, dash, seconds)
+    late, dash, scheduler = asyncio.run(_scenario(seconds, True))
+    _report("scheduler", late, dash, seconds)
+    for name, stats in scheduler.stats().items():
+        print("[bench_ui_scheduler] {} {}".format(name, stats))
+
+
+if __name__ == "__main__":
+    run(float(sys.argv[1]) if len(sys.argv) > 1 else 3)
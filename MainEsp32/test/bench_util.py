@@ -0,0 +1,209 @@
+"""Shared harness for the host benches in this folder.
+
+Benches run from the MainEsp32 folder put ``test`` on ``sys.path`` and
+import this module; on the device it sits next to them on the path.
+
+``host_modules()`` maps the MicroPython names the runtime code imports
+(``time.ticks_*``, ``uasyncio`` with ``sleep_ms``/``ThreadSafeFlag``, and a
+``machine`` with Pin/ADC/I2C plus a thread-driven Timer) onto the standard
+library. On the device, where ``machine`` exists, it does nothing.
+
+The timing and heap helpers work on both: ``ticks_us``/``ticks_diff`` fall
+back to ``perf_counter``, and ``alloc_start``/``alloc_stop`` and
+:class:`AllocCounter` use tracemalloc on CPython and the ``gc.mem_alloc``
+delta on MicroPython.
+"""
+
+import sys
+import time
+
+try:
+    import tracemalloc  # CPython only
+except ImportError:  # pragma: no cover - MicroPython
+    tracemalloc = None
+
+try:
+    import gc
+except ImportError:  # pragma: no cover
+    gc = None
+
+
+def ticks_us():
+    fn = getattr(time, "ticks_us", None)
+    if fn is not None:
+        return fn()
+    return int(time.perf_counter() * 1000000)
+
+
+def ticks_diff(a, b):
+    fn = getattr(time, "ticks_diff", None)
+    if fn is not None:
+        return fn(a, b)
+    return a - b
+
+
+def alloc_start(pause_gc=True):
+    """Start a heap measurement; pass the result to :func:`alloc_stop`.
+
+    ``pause_gc`` keeps the collector off on MicroPython until the stop, so
+    transient garbage counts instead of being collected mid-run.
+    """
+    if tracemalloc is not None:
+        tracemalloc.start()
+        return 0
+    if gc is not None and hasattr(gc, "mem_alloc"):
+        gc.collect()
+        if pause_gc:
+            gc.disable()
+        return gc.mem_alloc()
+    return 0
+
+
+def alloc_stop(start, retained=False):
+    """Bytes used since :func:`alloc_start` (-1 when nothing can tell).
+
+    By default that is the peak on CPython and everything allocated on
+    MicroPython; ``retained=True`` collects first and reports what is still
+    live.
+    """
+    if tracemalloc is not None:
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return current if retained else peak
+    if gc is not None and hasattr(gc, "mem_alloc"):
+        if retained:
+            gc.collect()
+        used = gc.mem_alloc() - start
+        gc.enable()
+        return used
+    return -1
+
+
+class AllocCounter:
+    """Bytes allocated across many ``feed()`` calls.
+
+    On CPython the tracemalloc peak above the live heap is reset before each
+    feed and summed over feeds (transient objects freed inside one feed count
+    once at their high-water mark); on MicroPython it is the gc.mem_alloc
+    delta with the collector disabled.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self._gc_start = None
+
+    def start(self):
+        if tracemalloc is not None:
+            tracemalloc.start()
+        elif gc is not None and hasattr(gc, "mem_alloc"):
+            gc.collect()
+            gc.disable()
+            self._gc_start = gc.mem_alloc()
+
+    def feed(self, fn, *args):
+        if tracemalloc is None:
+            return fn(*args)
+        current = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        result = fn(*args)
+        self.total += tracemalloc.get_traced_memory()[1] - current
+        return result
+
+    def stop(self):
+        if tracemalloc is not None:
+            tracemalloc.stop()
+        elif self._gc_start is not None:
+            self.total = gc.mem_alloc() - self._gc_start
+            gc.enable()
+        else:
+            self.total = -1
+        return self.total
+
+
+def host_modules():
+    """Stand-ins for the MicroPython modules the benches need (harness only)."""
+    if not hasattr(time, "ticks_ms"):
+        time.ticks_ms = lambda: int(time.perf_counter() * 1000)
+        time.ticks_us = lambda: int(time.perf_counter() * 1000000)
+        time.ticks_diff = lambda a, b: a - b
+        time.ticks_add = lambda a, b: a + b
+    try:
+        import machine  # noqa: F401
+        return
+    except ImportError:
+        pass
+    import asyncio
+    import threading
+    import types
+
+    if not hasattr(asyncio, "sleep_ms"):
+        asyncio.sleep_ms = lambda ms: asyncio.sleep(ms / 1000)
+
+    class ThreadSafeFlag:
+        def __init__(self):
+            self._loop = asyncio.get_event_loop()
+            self._event = asyncio.Event()
+
+        def set(self):
+            self._loop.call_soon_threadsafe(self._event.set)
+
+        async def wait(self):
+            await self._event.wait()
+            self._event.clear()
+
+    asyncio.ThreadSafeFlag = ThreadSafeFlag
+    sys.modules.setdefault("uasyncio", asyncio)
+
+    class Pin:
+        IN = 0
+        OUT = 1
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+    class ADC:
+        ATTN_6DB = 2
+        ATTN_11DB = 3
+        WIDTH_12BIT = 3
+
+        def __init__(self, pin):
+            pass
+
+        def read(self):
+            return 1900
+
+    class I2C:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def writeto(self, addr, buf, stop=True):
+            return len(buf)
+
+    class Timer:
+        PERIODIC = 1
+
+        def __init__(self, timer_id):
+            self._stop = None
+
+        def init(self, *, mode, period, callback):
+            stop = self._stop = threading.Event()
+
+            def _fire():
+                due = time.perf_counter()
+                while not stop.is_set():
+                    due += period / 1000
+                    delay = due - time.perf_counter()
+                    if delay > 0:
+                        stop.wait(delay)
+                    if not stop.is_set():
+                        callback(self)
+
+            threading.Thread(target=_fire, daemon=True).start()
+
+        def deinit(self):
+            if self._stop is not None:
+                self._stop.set()
+
+    machine = types.ModuleType("machine")
+    machine.Pin, machine.ADC, machine.I2C, machine.Timer = Pin, ADC, I2C, Timer
+    sys.modules["machine"] = machine
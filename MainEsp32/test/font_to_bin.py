@@ -0,0 +1,80 @@
+"""Convert font_to_py modules in fonts/ into lazily loaded .bfn containers.
+
+Run on the host from the MainEsp32 folder:
+    python test/font_to_bin.py                      # whole sevenSegment_* family
+    python test/font_to_bin.py sevenSegment_80 --digits
+    python test/font_to_bin.py Font00_24 --chars "0123456789ABC" --out /tmp/f.bfn
+
+``fonts.load()`` picks ``fonts/<name>.bfn`` over ``fonts/<name>.py`` when both
+are on the board, so upload the .bfn next to (or instead of) the module.
+``--digits`` keeps only DIGIT_CHARS; other characters then render as the
+font's default glyph, so use it for fonts that only ever show numbers.
+"""
+
+import sys
+
+if __name__ == "__main__":
+    sys.path.insert(0, ".")
+
+from fonts import binfont
+
+FAMILY = (
+    "sevenSegment_16",
+    "sevenSegment_20",
+    "sevenSegment_24",
+    "sevenSegment_30",
+    "sevenSegment_40",
+    "sevenSegment_80",
+)
+DIGIT_CHARS = "0123456789.-:% "
+
+
+def convert(name, chars=None, out=None):
+    mod = __import__("fonts." + name, None, None, (name,))
+    data = binfont.pack(mod, chars)
+    path = out or "fonts/{}.bfn".format(name)
+    with open(path, "wb") as f:
+        f.write(data)
+    font = binfont.BinaryFont(path)
+    try:
+        codes = range(mod.min_ch(), mod.max_ch() + 1) if chars is None else [ord(ch) for ch in chars]
+        for code in codes:
+            ch = chr(code)
+            expected = mod.get_ch(ch)
+            got = font.get_ch(ch)
+            assert bytes(expected[0]) == bytes(got[0]) and expected[1:] == got[1:], (name, ch)
+    finally:
+        font.close()
+    source = len(bytes(mod._font)) + len(bytes(mod._index))
+    print("[font_to_bin] {:<16} -> {:<28} {:>6} B (module data {} B)".format(name, path, len(data), source))
+    return path
+
+
+def main(argv):
+    names = []
+    chars = None
+    out = None
+    idx = 0
+    while idx < len(argv):
+        arg = argv[idx]
+        if arg == "--digits":
+            chars = DIGIT_CHARS
+        elif arg == "--chars":
+            idx += 1
+            chars = argv[idx]
+        elif arg == "--out":
+            idx += 1
+            out = argv[idx]
+        else:
+            names.append(arg)
+        idx += 1
+    if not names:
+        names = list(FAMILY)
+    if out is not None and len(names) != 1:
+        raise SystemExit("--out needs exactly one font")
+    for name in names:
+        convert(name, chars, out)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
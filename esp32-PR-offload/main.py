@@ -33,7 +33,8 @@ except ImportError:  # pragma: no cover - optional config
     _HW_WAKE_PINS = None
 except Exception:  # pragma: no cover - optional config
     _HW_WAKE_PINS = None
-from phaserunner import Phaserunner
+from phaserunner import Phaserunner, compile_read_plan, READ_GAP_MAX
+from umodbus_simple import AsyncModbusRTUMaster
 from registers import PR_REGISTERS
 import bridge_protocol as proto
 
@@ -41,7 +42,7 @@ import bridge_protocol as proto
 FAST_INTERVAL_MS_DEFAULT = 50   # 20 Hz
 SLOW_INTERVAL_MS_DEFAULT = 1000  # 1 Hz
 FW_VERSION = "2025.11.25.2"  # bump when flashing new builds
-PROTOCOL_VERSION = 1
+PROTOCOL_VERSION = proto.PROTOCOL_VERSION
 
 _fast_interval_ms = FAST_INTERVAL_MS_DEFAULT
 _slow_interval_ms = SLOW_INTERVAL_MS_DEFAULT
@@ -60,7 +61,12 @@ _main_last_token = None
 _debug_logging = False
 _wake_pin_configured = False
 _force_slow_once = False
+_compact_telemetry = False
+_telemetry_codec = None
+_layout_id = 0
 _register_state = {}
+_read_plans = {}
+_read_gap_max = READ_GAP_MAX
 _worker_thread = None
 _SLEEP_DELAY_MS = 10_000
 _sleep_task = None
@@ -89,7 +95,7 @@ def _resolve_wake_pins():
 _WAKE_PIN_LIST = _resolve_wake_pins()
 _wake_pin_objects = []
 
-MSP_FLAG_SLOW_INCLUDED = 0x01
+MSP_FLAG_SLOW_INCLUDED = proto.TELEM_FLAG_SLOW
 _BOOT_SAMPLE_REGS = (
     "battery_voltage",
     "battery_current",
@@ -116,6 +122,12 @@ def _log_register_block(label, names):
     _log("boot: {} regs ({}): {}".format(label, len(names), ", ".join(names)))
     for name in names:
         _log("boot:    {}".format(_format_reg_details(name)))
+    try:
+        plan = _get_read_plan(names)
+        spans = ", ".join("0x{:04X}+{}".format(span[0], span[1]) for span in plan)
+        _log("boot: {} block reads ({}): {}".format(label, len(plan), spans))
+    except Exception as exc:
+        _log("boot: {} block plan failed".format(label), exc)
 
 
 def _probe_phaserunner_once():
@@ -167,7 +179,10 @@ def _log_boot_banner():
         FAST_INTERVAL_MS_DEFAULT,
         SLOW_INTERVAL_MS_DEFAULT,
     ))
-    _log("boot: MSP telemetry flag slow=0x{:02X}".format(MSP_FLAG_SLOW_INCLUDED))
+    _log("boot: MSP telemetry flag slow=0x{:02X} compact=0x{:02X}".format(
+        MSP_FLAG_SLOW_INCLUDED,
+        proto.TELEM_FLAG_COMPACT,
+    ))
     _log_register_block("FAST", FAST_REGS)
     _log_register_block("SLOW", SLOW_REGS)
     _probe_phaserunner_once()
@@ -308,17 +323,8 @@ def _configure_wake_pins():
         _log("wake pin setup failed", "wake helpers unavailable")
     return False
 
-FAST_REGS = ["battery_current", "vehicle_speed", "motor_input_power"]
-SLOW_REGS = [
-    "controller_temp",
-    "motor_temp",
-    "motor_rpm",
-    "battery_voltage",
-    "throttle_voltage",
-    "brake_voltage_1",
-    "digital_inputs",
-    "warnings",
-]
+FAST_REGS = list(proto.mask_to_fields(proto.FAST_DEFAULT_MASK))
+SLOW_REGS = list(proto.mask_to_fields(proto.SLOW_DEFAULT_MASK))
 
 _latest_fast = {name: None for name in FAST_REGS}
 _latest_slow = {name: None for name in SLOW_REGS}
@@ -337,14 +343,132 @@ def _safe_read(pr, name, state):
         return None
 
 
+def _get_read_plan(names):
+    key = tuple(names)
+    plan = _read_plans.get(key)
+    if plan is None:
+        plan = compile_read_plan(key, _read_gap_max)
+        _read_plans[key] = plan
+    return plan
+
+
+def _split_failed_span(names, span):
+    """Swap a span that failed in the cached plan for ``names`` for narrower ones.
+
+    A span bridging gap registers is recompiled without gaps, a gap-free one
+    into single registers, so a rejected address costs one failed transaction
+    instead of one per poll.
+    """
+    fields = span[2]
+    if len(fields) < 2:
+        return
+    key = tuple(names)
+    plan = _read_plans.get(key)
+    if plan is None or span not in plan:
+        return
+    sub_names = [field[0] for field in fields]
+    if len(fields) < span[1]:
+        narrower = compile_read_plan(sub_names, 0)
+    else:
+        narrower = compile_read_plan(sub_names, 0, 1)
+    idx = plan.index(span)
+    _read_plans[key] = plan[:idx] + narrower + plan[idx + 1:]
+
+
+def _record_read_error(state, name, exc):
+    entry = state.setdefault(name, {"value": None, "errors": 0, "last_error": None})
+    entry["errors"] += 1
+    entry["last_error"] = repr(exc)
+
+
 def _read_register_block(pr, names, state=None):
     if state is None:
         state = _register_state
     values = {}
     errors = {}
+    try:
+        plan = _get_read_plan(names)
+    except Exception:
+        plan = None
+    if plan is None:
+        for name in names:
+            values[name] = _safe_read(pr, name, state)
+    else:
+        for span in plan:
+            try:
+                pr.read_span(span, values)
+            except Exception as exc:
+                if _debug_logging:
+                    _log("block read 0x{:04X}+{} failed".format(span[0], span[1]), exc)
+                if len(span[2]) == 1:
+                    # A single read would repeat the same transaction.
+                    values[span[2][0][0]] = None
+                    _record_read_error(state, span[2][0][0], exc)
+                    continue
+                # Fall back to single reads so one bad address cannot blank the
+                # span, and narrow the cached span for the next cycles.
+                for field in span[2]:
+                    values[field[0]] = _safe_read(pr, field[0], state)
+                _split_failed_span(names, span)
+                continue
+            for field in span[2]:
+                entry = state.setdefault(field[0], {"value": None, "errors": 0, "last_error": None})
+                entry["value"] = values[field[0]]
+                entry["last_error"] = None
+    for name in names:
+        entry = state.get(name) or {}
+        last_error = entry.get("last_error")
+        if last_error:
+            errors[name] = last_error
+    return values, errors
+
+
+async def _safe_read_async(pr, name, state):
+    entry = state.setdefault(name, {"value": None, "errors": 0, "last_error": None})
+    try:
+        value = await pr.read_value_async(name)
+        entry["value"] = value
+        entry["last_error"] = None
+        return value
+    except Exception as exc:
+        entry["errors"] += 1
+        entry["last_error"] = repr(exc)
+        return None
+
+
+async def _read_register_block_async(pr, names, state=None):
+    """Awaitable _read_register_block for an AsyncModbusRTUMaster-backed PR."""
+    if state is None:
+        state = _register_state
+    values = {}
+    errors = {}
+    try:
+        plan = _get_read_plan(names)
+    except Exception:
+        plan = None
+    if plan is None:
+        for name in names:
+            values[name] = await _safe_read_async(pr, name, state)
+    else:
+        for span in plan:
+            try:
+                await pr.read_span_async(span, values)
+            except Exception as exc:
+                if _debug_logging:
+                    _log("block read 0x{:04X}+{} failed".format(span[0], span[1]), exc)
+                if len(span[2]) == 1:
+                    values[span[2][0][0]] = None
+                    _record_read_error(state, span[2][0][0], exc)
+                    continue
+                for field in span[2]:
+                    values[field[0]] = await _safe_read_async(pr, field[0], state)
+                _split_failed_span(names, span)
+                continue
+            for field in span[2]:
+                entry = state.setdefault(field[0], {"value": None, "errors": 0, "last_error": None})
+                entry["value"] = values[field[0]]
+                entry["last_error"] = None
     for name in names:
-        value = _safe_read(pr, name, state)
-        values[name] = value
         entry = state.get(name) or {}
         last_error = entry.get("last_error")
         if last_error:
@@ -352,6 +476,14 @@ def _read_register_block(pr, names, state=None):
     return values, errors
 
 
+def set_read_gap(max_gap):
+    """Set the register gap tolerated when coalescing block reads (0 = exact)."""
+    global _read_gap_max
+    _read_gap_max = max(0, int(max_gap))
+    _read_plans.clear()
+    return _read_gap_max
+
+
 def _pack_float(value):
     if value is None:
         value = float("nan")
@@ -376,6 +508,9 @@ def _build_telemetry_payload(flags, seq, timestamp, fast_values, slow_values=Non
     payload.append(flags & 0xFF)
     payload.extend(struct.pack("<H", seq & 0xFFFF))
     payload.extend(struct.pack("<I", timestamp & 0xFFFFFFFF))
+    if _layout_id:
+        payload[0] |= proto.TELEM_FLAG_LAYOUT
+        payload.append(_layout_id)
     for name in FAST_REGS:
         payload.extend(_pack_float(fast_values.get(name)))
     if flags & MSP_FLAG_SLOW_INCLUDED:
@@ -385,6 +520,48 @@ def _build_telemetry_payload(flags, seq, timestamp, fast_values, slow_values=Non
     return bytes(payload)
 
 
+def _get_telemetry_codec():
+    global _telemetry_codec
+    if _telemetry_codec is None:
+        _telemetry_codec = proto.CompactTelemetryCodec(
+            tuple(FAST_REGS) + tuple(SLOW_REGS),
+            PR_REGISTERS,
+            fast_count=len(FAST_REGS),
+            layout=_layout_id,
+        )
+    return _telemetry_codec
+
+
+def set_telemetry_fields(fast_mask, slow_mask, layout_id=0):
+    """Select the registers polled and streamed (masks over proto.TELEMETRY_FIELDS)."""
+    global FAST_REGS, SLOW_REGS, _latest_fast, _latest_slow, _layout_id
+    global _telemetry_codec, _force_slow_once
+    fast = list(proto.mask_to_fields(fast_mask))
+    slow = list(proto.mask_to_fields(slow_mask & ~fast_mask))
+    if not fast:
+        raise ValueError("fast field set empty")
+    FAST_REGS = fast
+    SLOW_REGS = slow
+    _latest_fast = {name: _latest_fast.get(name) for name in fast}
+    _latest_slow = {name: _latest_slow.get(name) for name in slow}
+    _layout_id = layout_id & 0xFF
+    # Rebuilt lazily with the new layout; the first frame is a keyframe.
+    _telemetry_codec = None
+    _force_slow_once = True
+    _log("telemetry fields: fast={} slow={} layout={}".format(",".join(fast), ",".join(slow), _layout_id))
+    return proto.fields_to_mask(fast), proto.fields_to_mask(slow), _layout_id
+
+
+def set_compact_telemetry(enabled):
+    """Switch CMD_TELEMETRY between float frames and compact delta frames."""
+    global _compact_telemetry
+    enabled = bool(enabled)
+    if enabled and not _compact_telemetry:
+        _get_telemetry_codec().reset()
+    _compact_telemetry = enabled
+    return _compact_telemetry
+
+
 def _encode_string(value, max_len=48):
     try:
         data = str(value or "").encode("utf-8")
@@ -409,6 +586,7 @@ async def _send_boot_version(main_uart, uart_lock):
     extra = struct.pack("<B", PROTOCOL_VERSION)
     fw_bytes = FW_VERSION.encode("utf-8")[:60]
     extra += bytes([len(fw_bytes)]) + fw_bytes
+    extra += bytes([proto.FEATURE_COMPACT_TELEMETRY if _compact_telemetry else 0])
     payload = _build_response_payload(0, proto.RESP_OK, extra)
     await _send_msp(main_uart, uart_lock, proto.CMD_VERSION, payload)
 
@@ -425,6 +603,8 @@ def _ensure_command_handlers():
     def _cmd_snapshot(_req_id, _body):
         global _force_slow_once
         _force_slow_once = True
+        if _telemetry_codec is not None:
+            _telemetry_codec.reset()
         return (proto.RESP_OK, b"", None)
 
     def _cmd_set_rate(_req_id, body):
@@ -505,9 +685,19 @@ def _ensure_command_handlers():
         session_bytes = struct.pack("<H", _main_sessions & 0xFFFF)
         return (proto.RESP_OK, session_bytes, None)
 
-    def _cmd_version(_req_id, _body):
+    def _cmd_version(_req_id, body):
+        # Optional body <host_proto:u8><features:u8> negotiates telemetry features.
+        if len(body) >= 2:
+            host_proto = body[0]
+            wanted = body[1]
+            set_compact_telemetry(
+                host_proto >= 2 and bool(wanted & proto.FEATURE_COMPACT_TELEMETRY)
+            )
+            _log("version negotiated: host proto {} compact={}".format(host_proto, _compact_telemetry))
+        features = proto.FEATURE_COMPACT_TELEMETRY if _compact_telemetry else 0
         fw_bytes = FW_VERSION.encode("utf-8")[:60]
         extra = struct.pack("<B", PROTOCOL_VERSION) + bytes([len(fw_bytes)]) + fw_bytes
+        extra += bytes([features])
         return (proto.RESP_OK, extra, None)
 
     def _cmd_debug(_req_id, body):
@@ -515,8 +705,17 @@ def _ensure_command_handlers():
         set_debug_logging(enabled)
         return (proto.RESP_OK, struct.pack("<B", int(enabled)), None)
 
+    def _cmd_set_fields(_req_id, body):
+        if len(body) < 8:
+            return (proto.RESP_ERROR, _encode_string("body short"), None)
+        fast_mask, slow_mask = struct.unpack_from("<II", body, 0)
+        layout_id = body[8] if len(body) >= 9 else 0
+        fast_mask, slow_mask, layout_id = set_telemetry_fields(fast_mask, slow_mask, layout_id)
+        return (proto.RESP_OK, struct.pack("<IIB", fast_mask, slow_mask, layout_id), None)
+
     _COMMAND_MAP = {
         proto.CMD_PING: _cmd_ping,
+        proto.CMD_SET_FIELDS: _cmd_set_fields,
         proto.CMD_SNAPSHOT: _cmd_snapshot,
         proto.CMD_SET_RATE: _cmd_set_rate,
         proto.CMD_POLL_CTRL: _cmd_poll,
@@ -535,7 +734,7 @@ async def _process_command_frame(main_uart, uart_lock, frame):
     payload = frame.get("payload") or b""
     if len(payload) >= 2:
         req_id = struct.unpack_from("<H", payload, 0)[0]
-        body = payload[2:]
+        body = bytes(payload[2:])
     else:
         req_id = 0
         body = b""
@@ -567,13 +766,12 @@ async def _process_command_frame(main_uart, uart_lock, frame):
 
 
 async def command_task(main_uart, uart_lock):
-    parser = proto.MSPParser()
+    parser = proto.MSPStreamParser()
     while not _stop_requested:
         try:
             data = main_uart.read()
             if data:
-                frames = parser.feed(data)
-                for frame in frames:
+                for frame in parser.frames(data):
                     if frame.get("direction") != proto.DIR_TO_DEVICE:
                         continue
                     await _process_command_frame(main_uart, uart_lock, frame)
@@ -600,12 +798,27 @@ async def pr_poll_task(pr, main_uart, uart_lock):
                 await asyncio.sleep_ms(50)
                 continue
             loop_start = time.ticks_ms()
-            fast_values, fast_errors = _read_register_block(pr, FAST_REGS)
+            # set_telemetry_fields() may swap the layout while a read is
+            # awaited; values read for the old registers must not be sent
+            # (or cached) under the new layout id.
+            fast_regs = FAST_REGS
+            slow_regs = SLOW_REGS
+            layout_id = _layout_id
+            if pr.is_async:
+                fast_values, fast_errors = await _read_register_block_async(pr, fast_regs)
+            else:
+                fast_values, fast_errors = _read_register_block(pr, fast_regs)
             include_slow = _force_slow_once or time.ticks_diff(loop_start, next_slow_due) >= 0
             slow_values = _latest_slow
             slow_errors = {}
             if include_slow:
-                slow_values, slow_errors = _read_register_block(pr, SLOW_REGS)
+                if pr.is_async:
+                    slow_values, slow_errors = await _read_register_block_async(pr, slow_regs)
+                else:
+                    slow_values, slow_errors = _read_register_block(pr, slow_regs)
+            if fast_regs is not FAST_REGS or slow_regs is not SLOW_REGS or layout_id != _layout_id:
+                continue
+            if include_slow:
                 next_slow_due = time.ticks_add(loop_start, _slow_interval_ms)
                 _force_slow_once = False
             errors = dict(fast_errors)
@@ -618,13 +831,21 @@ async def pr_poll_task(pr, main_uart, uart_lock):
             _last_payload_ts = loop_start & 0xFFFFFFFF
             flags = MSP_FLAG_SLOW_INCLUDED if include_slow else 0
             slow_payload = _latest_slow if include_slow else None
-            payload = _build_telemetry_payload(
-                flags,
-                _last_seq,
-                _last_payload_ts,
-                _latest_fast,
-                slow_payload,
-            )
+            if _compact_telemetry:
+                payload = _get_telemetry_codec().encode(
+                    _last_seq,
+                    _last_payload_ts,
+                    _latest_fast,
+                    slow_payload,
+                )
+            else:
+                payload = _build_telemetry_payload(
+                    flags,
+                    _last_seq,
+                    _last_payload_ts,
+                    _latest_fast,
+                    slow_payload,
+                )
             await _send_msp(main_uart, uart_lock, proto.CMD_TELEMETRY, payload)
             next_fast = time.ticks_add(loop_start, _fast_interval_ms)
             remaining = time.ticks_diff(next_fast, time.ticks_ms())
@@ -733,10 +954,15 @@ async def _offload_main():
             baudrate=PR_UART_BAUD,
             tx=machine.Pin(PR_UART_RX),
             rx=machine.Pin(PR_UART_TX),
-            timeout=200,
+            timeout=0,
             timeout_char=2,
         )
-        pr = Phaserunner(pr_uart)
+        try:
+            master = AsyncModbusRTUMaster(pr_uart, baudrate=PR_UART_BAUD)
+        except Exception as exc:
+            _log("async modbus unavailable; using blocking master", exc)
+            master = None
+        pr = Phaserunner(pr_uart, master=master)
     except Exception as exc:
         _log("uart init failed", exc)
         sys.print_exception(exc)
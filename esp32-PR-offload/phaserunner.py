@@ -1,12 +1,68 @@
 # phaserunner.py
+try:
+    import ustruct as struct  # type: ignore
+except ImportError:  # pragma: no cover
+    import struct  # type: ignore
+
 from umodbus_simple import ModbusRTUMaster
 from registers import PR_REGISTERS
 
+# Registers not requested but lying between two requested ones are read anyway
+# when the hole is at most this many registers wide (one request costs far more
+# bus time than a few extra data bytes).
+READ_GAP_MAX = 8
+# Modbus RTU limit for function 0x03.
+READ_COUNT_MAX = 125
+
+
+def compile_read_plan(names, max_gap=READ_GAP_MAX, max_count=READ_COUNT_MAX):
+    """Coalesce register names into the fewest ``read_holding_registers`` spans.
+
+    Returns a tuple of ``(start_addr, count, fields)`` where ``fields`` is a tuple
+    of ``(name, byte_offset, fmt, scale)`` entries ready for ``struct.unpack_from``.
+    Unknown names raise ``ValueError`` like ``Phaserunner.read_value``.
+    """
+    entries = []
+    seen = set()
+    for name in names:
+        if name in seen:
+            continue
+        reg = PR_REGISTERS.get(name)
+        if reg is None:
+            raise ValueError("Registro desconocido: {}".format(name))
+        seen.add(name)
+        entries.append((reg["addr"], name, reg))
+    entries.sort()
+    plan = []
+    start = None
+    last = None
+    fields = []
+    for addr, name, reg in entries:
+        if start is not None and (addr - last - 1 > max_gap or addr - start + 1 > max_count):
+            plan.append((start, last - start + 1, tuple(fields)))
+            start = None
+            fields = []
+        if start is None:
+            start = addr
+        last = addr
+        fmt = ">h" if reg["signed"] else ">H"
+        fields.append((name, (addr - start) * 2, fmt, reg["scale"]))
+    if start is not None:
+        plan.append((start, last - start + 1, tuple(fields)))
+    return tuple(plan)
+
+
 class Phaserunner:
-    def __init__(self, uart, slave_id=1):
-        self.master = ModbusRTUMaster(uart)
+    def __init__(self, uart, slave_id=1, master=None):
+        if master is None:
+            master = ModbusRTUMaster(uart)
+        self.master = master
         self.slave_id = slave_id
 
+    @property
+    def is_async(self):
+        return hasattr(self.master, "read_holding_block_async")
+
     def read_value(self, name):
         """Leer cualquier parámetro por nombre"""
         if name not in PR_REGISTERS:
@@ -21,6 +77,53 @@ class Phaserunner:
 
         return raw / reg["scale"]
 
+    def read_span(self, span, out):
+        """Read one plan span in a single transaction and decode into ``out``."""
+        start, count, fields = span
+        data = self.master.read_holding_block(self.slave_id, start, count)
+        for name, offset, fmt, scale in fields:
+            out[name] = struct.unpack_from(fmt, data, offset)[0] / scale
+        return out
+
+    def read_plan(self, plan, out=None):
+        """Read every span of a compiled plan; errors propagate per span."""
+        if out is None:
+            out = {}
+        for span in plan:
+            self.read_span(span, out)
+        return out
+
+    async def read_value_async(self, name):
+        """Versión awaitable de read_value (requiere AsyncModbusRTUMaster)"""
+        if name not in PR_REGISTERS:
+            raise ValueError("Registro desconocido: {}".format(name))
+
+        reg = PR_REGISTERS[name]
+        raw = (await self.master.read_holding_registers_async(self.slave_id, reg["addr"], 1))[0]
+
+        if reg["signed"] and raw > 0x7FFF:
+            raw -= 0x10000
+
+        return raw / reg["scale"]
+
+    async def read_span_async(self, span, out):
+        start, count, fields = span
+        data = await self.master.read_holding_block_async(self.slave_id, start, count)
+        for name, offset, fmt, scale in fields:
+            out[name] = struct.unpack_from(fmt, data, offset)[0] / scale
+        return out
+
+    async def read_plan_async(self, plan, out=None):
+        if out is None:
+            out = {}
+        for span in plan:
+            await self.read_span_async(span, out)
+        return out
+
+    def read_values(self, names, max_gap=READ_GAP_MAX):
+        """Leer varios registros con el mínimo de transacciones Modbus"""
+        return self.read_plan(compile_read_plan(names, max_gap))
+
     def get_all(self):
         """Leer todos los registros definidos y devolver dict con (valor, unidad)"""
         results = {}
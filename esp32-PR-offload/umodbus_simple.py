@@ -1,7 +1,20 @@
 """Minimal Modbus RTU helper used by the Phaserunner interface."""
 
 import struct
-from time import sleep_ms, ticks_diff, ticks_ms
+from time import sleep_ms, ticks_diff, ticks_ms, ticks_us
+
+from checksum import crc16_modbus
+
+try:
+    import uasyncio as asyncio  # type: ignore
+except ImportError:  # pragma: no cover - CPython host tests
+    import asyncio  # type: ignore
+
+# Bits per RTU character (start + 8 data + parity/stop + stop).
+_CHAR_BITS = 11
+# Above 19200 baud the spec fixes the 3.5 char silence at 1.75 ms.
+_MIN_FRAME_GAP_US = 1750
+
 
 class ModbusRTUMaster:
     def __init__(self, uart, timeout_ms=120):
@@ -12,16 +25,15 @@ class ModbusRTUMaster:
             self.timeout_ms = 120
 
     def _crc16(self, data):
-        crc = 0xFFFF
-        for pos in data:
-            crc ^= pos
-            for _ in range(8):
-                if (crc & 1) != 0:
-                    crc >>= 1
-                    crc ^= 0xA001
-                else:
-                    crc >>= 1
-        return struct.pack("<H", crc)
+        return struct.pack("<H", crc16_modbus(data))
+
+    @staticmethod
+    def _crc_ok(resp):
+        end = len(resp) - 2
+        if end < 0:
+            return False
+        crc = crc16_modbus(resp, 0, end)
+        return resp[end] == (crc & 0xFF) and resp[end + 1] == (crc >> 8)
 
     def _read_exact(self, expected_len):
         if expected_len <= 0:
@@ -38,9 +50,10 @@ class ModbusRTUMaster:
             sleep_ms(1)
         return buf
 
-    def read_holding_registers(self, slave_addr, reg_addr, count):
+    def read_holding_block(self, slave_addr, reg_addr, count):
+        """Read ``count`` registers and return the raw big-endian data bytes."""
         if count <= 0:
-            return []
+            return b""
 
         pdu = bytearray([3, reg_addr >> 8, reg_addr & 0xFF, count >> 8, count & 0xFF])
         adu = bytearray([slave_addr]) + pdu
@@ -51,7 +64,120 @@ class ModbusRTUMaster:
         expected_len = 3 + (count * 2) + 2
         resp = self._read_exact(expected_len)
 
-        if self._crc16(resp[:-2]) != resp[-2:]:
+        if not self._crc_ok(resp):
+            raise Exception("CRC error")
+
+        if resp[0] != slave_addr or resp[1] != 3:
+            raise Exception("Invalid response")
+
+        length = resp[2]
+        if length != count * 2:
+            raise Exception("Unexpected payload length")
+        return memoryview(resp)[3 : 3 + length]
+
+    def read_holding_registers(self, slave_addr, reg_addr, count):
+        if count <= 0:
+            return []
+
+        data = self.read_holding_block(slave_addr, reg_addr, count)
+
+        regs = []
+        for i in range(0, len(data), 2):
+            regs.append((data[i] << 8) + data[i + 1])
+
+        return regs
+
+
+def _sleep_ms(ms):
+    fn = getattr(asyncio, "sleep_ms", None)
+    if fn is not None:
+        return fn(ms)
+    return asyncio.sleep(ms / 1000)
+
+
+def _wait_for_ms(awaitable, ms):
+    fn = getattr(asyncio, "wait_for_ms", None)
+    if fn is not None:
+        return fn(awaitable, ms)
+    return asyncio.wait_for(awaitable, ms / 1000)
+
+
+class AsyncModbusRTUMaster(ModbusRTUMaster):
+    """uasyncio Modbus RTU master: waits on the UART stream instead of spinning.
+
+    Keeps the blocking API of :class:`ModbusRTUMaster` and adds awaitable
+    ``*_async`` variants. Requests are serialised with a lock and separated by
+    the 3.5 character inter-frame silence. ``reader``/``writer`` default to
+    ``asyncio.StreamReader``/``StreamWriter`` over the UART and can be swapped
+    for fakes on the host.
+    """
+
+    def __init__(self, uart, timeout_ms=120, baudrate=115200, reader=None, writer=None):
+        super().__init__(uart, timeout_ms)
+        if reader is None:
+            reader = asyncio.StreamReader(uart)
+        if writer is None:
+            writer = asyncio.StreamWriter(uart, {})
+        self._reader = reader
+        self._writer = writer
+        self._lock = asyncio.Lock()
+        self._last_io_us = ticks_us()
+        try:
+            gap = (_CHAR_BITS * 3500000) // int(baudrate)
+        except Exception:
+            gap = _MIN_FRAME_GAP_US
+        self.frame_gap_us = max(_MIN_FRAME_GAP_US, gap)
+
+    def _discard_stale(self):
+        any_fn = getattr(self.uart, "any", None)
+        if any_fn is None:
+            return
+        try:
+            if any_fn():
+                self.uart.read()
+        except Exception:
+            pass
+
+    async def _wait_frame_gap(self):
+        idle_us = ticks_diff(ticks_us(), self._last_io_us)
+        if idle_us < self.frame_gap_us:
+            await _sleep_ms((self.frame_gap_us - idle_us + 999) // 1000)
+
+    async def _read_exact_async(self, expected_len):
+        buf = bytearray()
+        start = ticks_ms()
+        while len(buf) < expected_len:
+            remaining = self.timeout_ms - ticks_diff(ticks_ms(), start)
+            if remaining <= 0:
+                raise Exception("Modbus timeout")
+            try:
+                chunk = await _wait_for_ms(self._reader.read(expected_len - len(buf)), remaining)
+            except asyncio.TimeoutError:
+                raise Exception("Modbus timeout")
+            if chunk:
+                buf.extend(chunk)
+        return buf
+
+    async def read_holding_block_async(self, slave_addr, reg_addr, count):
+        """Awaitable :meth:`read_holding_block`; other tasks run while waiting."""
+        if count <= 0:
+            return b""
+
+        adu = bytearray([slave_addr, 3, reg_addr >> 8, reg_addr & 0xFF, count >> 8, count & 0xFF])
+        adu += self._crc16(adu)
+        expected_len = 3 + (count * 2) + 2
+
+        async with self._lock:
+            await self._wait_frame_gap()
+            self._discard_stale()
+            self._writer.write(adu)
+            await self._writer.drain()
+            try:
+                resp = await self._read_exact_async(expected_len)
+            finally:
+                self._last_io_us = ticks_us()
+
+        if not self._crc_ok(resp):
             raise Exception("CRC error")
 
         if resp[0] != slave_addr or resp[1] != 3:
@@ -60,7 +186,13 @@ class ModbusRTUMaster:
         length = resp[2]
         if length != count * 2:
             raise Exception("Unexpected payload length")
-        data = resp[3 : 3 + length]
+        return memoryview(resp)[3 : 3 + length]
+
+    async def read_holding_registers_async(self, slave_addr, reg_addr, count):
+        if count <= 0:
+            return []
+
+        data = await self.read_holding_block_async(slave_addr, reg_addr, count)
 
         regs = []
         for i in range(0, len(data), 2):